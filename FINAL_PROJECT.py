@@ -1,4 +1,37 @@
+import argparse
+import bisect
+import calendar
+import cProfile
+import copy
+import csv
+import functools
+import heapq
+import itertools
+import json
+import math
+import mmap
+import operator
+import os
 import random
+import re
+import sqlite3
+import statistics
+import tempfile
+import time
+import timeit
+import tracemalloc
+import unicodedata
+import zlib
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import NamedTuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are still single writes, but sessions are not locked against each other
+    fcntl = None
 
 # --------------------- BOND CALCULATIONS ---------------------
 
@@ -10,15 +43,76 @@ def bond_calculator():
         market_rate = float(input("Enter the market interest rate (as %): ")) / 100
         years_to_maturity = int(input("Enter the number of years until maturity: "))
 
-        coupon_payment = face_value * coupon_rate
-        coupon_pv = sum(coupon_payment / (1 + market_rate) ** t for t in range(1, years_to_maturity + 1))
-        face_value_pv = face_value / (1 + market_rate) ** years_to_maturity
-
-        bond_price = coupon_pv + face_value_pv
+        bond_price = RESULT_CACHE.call(price_bonds, face_value, coupon_rate, market_rate, years_to_maturity)
+        if math.isnan(bond_price):
+            print("The bond cannot be priced: years to maturity must not be negative and the market rate must be "
+                  "above -100%.")
+            return
         print(f"\nThe present value (price) of the bond is: ${bond_price:.2f}")
     except ValueError:
         print("Invalid input! Please enter numeric values.")
 
+# Closed-form price of a single level-coupon bond
+def _bond_price(face_value, coupon_rate, market_rate, years_to_maturity):
+    """
+    Price a bond with the annuity closed form instead of summing every coupon:
+         Price = C * (1 - (1 + r)^-n) / r + F * (1 + r)^-n     if r != 0
+         Price = C * n + F                                     if r == 0
+    Rows that cannot be discounted (r <= -100% or n < 0) price as NaN.
+    """
+    if market_rate <= -1 or years_to_maturity < 0:
+        return float("nan")
+    coupon_payment = face_value * coupon_rate
+    if market_rate == 0:
+        return coupon_payment * years_to_maturity + face_value
+    discount = (1 + market_rate) ** -years_to_maturity
+    return coupon_payment * (1 - discount) / market_rate + face_value * discount
+
+def _broadcast(*values):
+    """
+    Lines up scalar and sequence arguments so they can be walked together, repeating the scalars.
+    :param values: Numbers or equally sized sequences (lists, tuples, arrays or CSV columns).
+    :return: The common length (None when every argument is a scalar) and one iterable per argument.
+    """
+    lengths = {len(value) for value in values if not isinstance(value, (int, float))}
+    if len(lengths) > 1:
+        raise ValueError("All input columns must have the same length.")
+    if not lengths:
+        return None, [[value] for value in values]
+    return lengths.pop(), [itertools.repeat(value) if isinstance(value, (int, float)) else value
+                           for value in values]
+
+# Batch Bond Price Calculator
+def price_bonds(face, coupon_rate, market_rate, years):
+    """
+    Price a whole book of bonds in one pass, with no input() or print().
+    Every argument may be a number or a sequence of the same length, rates are decimals (0.05 for 5%)
+    and coupons are paid annually. Each bond is priced with the annuity closed form, so the cost per
+    bond does not grow with its maturity.
+    :return: A float when every argument is a number, otherwise an array('d') of prices in input order.
+    """
+    length, columns = _broadcast(face, coupon_rate, market_rate, years)
+    if length is None:
+        return _bond_price(*(column[0] for column in columns))
+    return array("d", map(_bond_price, *columns))
+
+def read_bond_columns(path, columns=("face_value", "coupon_rate", "market_rate", "years_to_maturity")):
+    """
+    Reads the pricing columns of a bond book stored as CSV so they can be handed straight to price_bonds.
+    :param path: CSV file with a header row.
+    :param columns: Header names holding the face value, coupon rate, market rate and years to maturity.
+    :return: One array('d') per requested column, in the same order as columns.
+    """
+    arrays = [array("d") for _ in columns]
+    with open(path, newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader)
+        positions = [header.index(name) for name in columns]
+        for row in reader:
+            for values, position in zip(arrays, positions):
+                values.append(float(row[position]))
+    return arrays
+
 # Perpetuity Price Calculator
 def perpetuity_price(payment, discount_rate_percent):
     """
@@ -29,959 +123,4628 @@ def perpetuity_price(payment, discount_rate_percent):
         raise ValueError("Discount rate must be greater than zero.")
     return payment / (discount_rate_percent / 100)
 
-# Bond Maturity (Future Value) Calculator
-def bond_maturity():
+# ---- Perpetuity and annuity family ----
+# Rates follow perpetuity_price and are percentages (5.0 for 5%). Every function takes numbers or equally
+# sized sequences; an invalid rate gives NaN for that element instead of raising, so one bad row does not
+# sink a whole grid.
+
+def _growing_perpetuity(payment, discount_rate_percent, growth_rate_percent):
+    spread = (discount_rate_percent - growth_rate_percent) / 100
+    return payment / spread if spread > 0 else math.nan
+
+def _annuity(payment, discount_rate_percent, periods):
+    r = discount_rate_percent / 100
+    if r <= -1 or periods < 0:
+        return math.nan
+    if r == 0:
+        return payment * periods
+    return payment * (1 - (1 + r) ** -periods) / r
+
+def _growing_annuity(payment, discount_rate_percent, growth_rate_percent, periods):
+    r, g = discount_rate_percent / 100, growth_rate_percent / 100
+    if r <= -1 or g <= -1 or periods < 0:
+        return math.nan
+    if r == g:
+        return payment * periods / (1 + r)
+    return payment * (1 - ((1 + g) / (1 + r)) ** periods) / (r - g)
+
+def _annuity_due(payment, discount_rate_percent, periods):
+    return _annuity(payment, discount_rate_percent, periods) * (1 + discount_rate_percent / 100)
+
+def _map_broadcast(kernel, *values):
+    length, columns = _broadcast(*values)
+    if length is None:
+        return kernel(*(column[0] for column in columns))
+    return array("d", map(kernel, *columns))
+
+# Growing Perpetuity
+def growing_perpetuity_price(payment, discount_rate_percent, growth_rate_percent):
+    """
+    Calculate the price of a perpetuity whose first payment grows every period:
+         Price = Payment / ((discount_rate_percent - growth_rate_percent) / 100)
+    NaN where the discount rate does not exceed the growth rate.
+    """
+    return _map_broadcast(_growing_perpetuity, payment, discount_rate_percent, growth_rate_percent)
+
+# Level Annuity
+def annuity_price(payment, discount_rate_percent, periods):
+    """
+    Calculate the price of a level annuity paid at the end of each period:
+         Price = Payment * (1 - (1 + r)^-n) / r,   with r = discount_rate_percent / 100
+    NaN where r <= -100% or n < 0.
+    """
+    return _map_broadcast(_annuity, payment, discount_rate_percent, periods)
+
+# Growing Annuity
+def growing_annuity_price(payment, discount_rate_percent, growth_rate_percent, periods):
+    """
+    Calculate the price of an annuity whose first payment grows at g every period:
+         Price = Payment * (1 - ((1 + g) / (1 + r))^n) / (r - g)
+         Price = Payment * n / (1 + r)   when r == g
+    NaN where r or g <= -100% or n < 0.
+    """
+    return _map_broadcast(_growing_annuity, payment, discount_rate_percent, growth_rate_percent, periods)
+
+# Annuity Due
+def annuity_due_price(payment, discount_rate_percent, periods):
+    """
+    Calculate the price of a level annuity paid at the start of each period:
+         Price = annuity_price(Payment, r, n) * (1 + r)
+    """
+    return _map_broadcast(_annuity_due, payment, discount_rate_percent, periods)
+
+# Valuation grid over every combination of the inputs
+class SensitivityGrid(NamedTuple):
+    names: tuple
+    axes: tuple
+    values: array
+
+    def at(self, *indices):
+        """
+        Value at one grid point, given one index per axis in the order of names.
+        """
+        offset = 0
+        for index, axis in zip(indices, self.axes):
+            offset = offset * len(axis) + index
+        return self.values[offset]
+
+def sensitivity_grid(pricer, **axes):
+    """
+    Values pricer over the cartesian product of its keyword arguments in a single broadcast call.
+    Example: sensitivity_grid(growing_perpetuity_price, payment=[50, 100], discount_rate_percent=range(4, 9),
+             growth_rate_percent=[0, 1, 2])
+    :return: A SensitivityGrid whose values are laid out row-major, with the last axis changing fastest.
+    """
+    names = tuple(axes)
+    grid_axes = tuple(tuple(float(value) for value in axis) for axis in axes.values())
+    columns = zip(*itertools.product(*grid_axes)) if all(grid_axes) else [() for _ in grid_axes]
+    arguments = {name: array("d", column) for name, column in zip(names, columns)}
+    return SensitivityGrid(names, grid_axes, pricer(**arguments))
+
+# Bond Maturity (Future Value)
+def compute_maturity_value(face_value, coupon_rate, years_to_maturity, reinvestment_rate):
     """
     Calculate the maturity (future) value of a bond with reinvested coupon payments.
+    Rates are decimals (0.05 for 5%).
 
     Formula:
         FV_coupons = coupon_payment * [((1 + r)^n - 1) / r]   if r != 0
         Total Maturity Value = FV_coupons + face_value
     """
+    coupon_payment = face_value * coupon_rate
+    if reinvestment_rate != 0:
+        fv_coupons = coupon_payment * (((1 + reinvestment_rate) ** years_to_maturity - 1) / reinvestment_rate)
+    else:
+        fv_coupons = coupon_payment * years_to_maturity
+    return fv_coupons + face_value
+
+# Bond Maturity (Future Value) Calculator
+def bond_maturity():
+    """
+    Interactive shell around compute_maturity_value.
+    """
     try:
         face_value = float(input("Enter the face value of the bond ($): "))
         coupon_rate = float(input("Enter the coupon rate (as %): "))
         years_to_maturity = int(input("Enter the number of years until maturity: "))
         reinvestment_rate = float(input("Enter the reinvestment rate (as %): "))
 
-        coupon_payment = face_value * (coupon_rate / 100)
-
-        if reinvestment_rate != 0:
-            fv_coupons = coupon_payment * (((1 + reinvestment_rate / 100) ** years_to_maturity - 1) / (reinvestment_rate / 100))
-        else:
-            fv_coupons = coupon_payment * years_to_maturity
-
-        total_value = fv_coupons + face_value
+        total_value = RESULT_CACHE.call(compute_maturity_value, face_value, coupon_rate / 100, years_to_maturity,
+                                        reinvestment_rate / 100)
         print(f"\nThe total maturity value of the bond is: ${total_value:.2f}")
     except ValueError:
         print("Invalid input! Please enter numeric values.")
 
+# Current Yield
+def compute_current_yield(face_value, coupon_rate, current_price):
+    """
+    Calculate the current yield of a bond as a decimal:
+         Current Yield = (face_value * coupon_rate) / current_price
+    """
+    if current_price <= 0:
+        raise ValueError("The current price must be greater than zero.")
+    return face_value * coupon_rate / current_price
+
 # Current Yield Calculator
 def current_yield():
     try:
         face_value = float(input("Enter the face value of the bond ($): "))
         coupon_rate = float(input("Enter the coupon rate (as %): "))
         current_price = float(input("Enter the current market price of the bond ($): "))
-        coupon_payment = face_value * (coupon_rate / 100)
-        cy = (coupon_payment / current_price) * 100
+        cy = RESULT_CACHE.call(compute_current_yield, face_value, coupon_rate / 100, current_price) * 100
         print(f"\nThe current yield of the bond is: {cy:.2f}%")
-    except ValueError:
-        print("Invalid input! Please enter numeric values.")
+    except ValueError as e:
+        print("Invalid input!", e)
+
+# Result of a yield to maturity solve
+class YTMResult(NamedTuple):
+    ytm: float          # Yield as a decimal, NaN when no yield reprices the bond
+    iterations: int     # Newton steps plus any Brent fallback steps
+    residual: float     # Model price at ytm minus the quoted price
+    converged: bool
+    method: str         # "newton", "brent" or "none"
+
+def _bond_value_and_slope(face_value, coupon_payment, years_to_maturity, y):
+    """
+    Evaluates the bond price and its analytic derivative dPrice/dy in a single Horner pass over the
+    cash flows, written as a polynomial in the discount factor v = 1 / (1 + y).
+    :return: The price at yield y and the slope of the price with respect to y.
+    """
+    v = 1 / (1 + y)
+    q = coupon_payment + face_value
+    dq = 0.0
+    for _ in range(years_to_maturity - 1):
+        dq = dq * v + q
+        q = q * v + coupon_payment
+    return q * v, -(q + v * dq) * v * v
+
+def _brent(f, a, b, fa, fb, tolerance=1e-12, max_iterations=200):
+    """
+    Brent's method (inverse quadratic interpolation, secant and bisection steps) on a bracket [a, b]
+    where f(a) and f(b) have opposite signs.
+    :return: The root, the number of iterations used and whether the tolerance was reached.
+    """
+    x_pre, x_cur, f_pre, f_cur = a, b, fa, fb
+    x_blk = f_blk = s_pre = s_cur = 0.0
+    if f_pre == 0:
+        return x_pre, 0, True
+    if f_cur == 0:
+        return x_cur, 0, True
+    for iteration in range(1, max_iterations + 1):
+        if f_pre * f_cur < 0:
+            x_blk, f_blk = x_pre, f_pre
+            s_pre = s_cur = x_cur - x_pre
+        if abs(f_blk) < abs(f_cur):
+            x_pre, x_cur, x_blk = x_cur, x_blk, x_cur
+            f_pre, f_cur, f_blk = f_cur, f_blk, f_cur
+        delta = (tolerance + 4e-16 * abs(x_cur)) / 2
+        s_bis = (x_blk - x_cur) / 2
+        if f_cur == 0 or abs(s_bis) < delta:
+            return x_cur, iteration, True
+        if abs(s_pre) > delta and abs(f_cur) < abs(f_pre):
+            if x_pre == x_blk:
+                s_try = -f_cur * (x_cur - x_pre) / (f_cur - f_pre)
+            else:
+                d_pre = (f_pre - f_cur) / (x_pre - x_cur)
+                d_blk = (f_blk - f_cur) / (x_blk - x_cur)
+                s_try = -f_cur * (f_blk * d_blk - f_pre * d_pre) / (d_blk * d_pre * (f_blk - f_pre))
+            if 2 * abs(s_try) < min(abs(s_pre), 3 * abs(s_bis) - delta):
+                s_pre, s_cur = s_cur, s_try
+            else:
+                s_pre = s_cur = s_bis
+        else:
+            s_pre = s_cur = s_bis
+        x_pre, f_pre = x_cur, f_cur
+        x_cur += s_cur if abs(s_cur) > delta else (delta if s_bis > 0 else -delta)
+        f_cur = f(x_cur)
+    return x_cur, max_iterations, False
+
+def _ytm_by_brent(value, price, tolerance):
+    """
+    Safeguarded fallback for the yield solvers: widens a bracket around the root, towards -100% on one
+    side and upwards on the other, then runs Brent's method on it.
+    :param value: Function returning the price of the cash flows at a yield.
+    :return: A YTMResult using the "brent" method.
+    """
+    def f(y):
+        return value(y) - price
+
+    low, high = -0.5, 1.0
+    f_low, f_high = f(low), f(high)
+    while f_low < 0 and low > -1 + 1e-12:
+        low = -1 + (low + 1) / 16
+        f_low = f(low)
+    while f_high > 0 and high < 1e6:
+        high *= 4
+        f_high = f(high)
+    if f_low * f_high > 0:
+        return YTMResult(float("nan"), 0, float("nan"), False, "none")
+    ytm, iterations, converged = _brent(f, low, high, f_low, f_high, tolerance)
+    return YTMResult(ytm, iterations, f(ytm), converged, "brent")
+
+# Yield to Maturity (YTM) Solver
+def solve_ytm(price, face_value, coupon_rate, years_to_maturity, tolerance=1e-10, max_iterations=50):
+    """
+    Solve the yield to maturity of annual-coupon bonds with Newton's method on the analytic price
+    derivative, falling back to Brent's method for any bond whose Newton step leaves the domain or does
+    not settle. Rates are decimals and yields may be negative (anything above -100%).
+    Every argument may be a number or a sequence of the same length. A batch is solved in sweeps where
+    each sweep takes one Newton step for every bond still active, and bonds drop out of the active mask
+    as soon as they converge.
+    :return: A YTMResult, or a list of YTMResult in input order when any argument is a sequence.
+    """
+    length, columns = _broadcast(price, face_value, coupon_rate, years_to_maturity)
+    bonds = list(zip(*columns)) if length is not None else [tuple(column[0] for column in columns)]
+    results = [None] * len(bonds)
+    yields = [0.0] * len(bonds)
+    iterations = [0] * len(bonds)
+    active = []
+    for i, (bond_price, face, coupon, years) in enumerate(bonds):
+        if bond_price <= 0 or years < 1 or int(years) != years:
+            results[i] = YTMResult(float("nan"), 0, float("nan"), False, "none")
+            continue
+        # Start from the classic approximation (C + (F - P) / n) / ((F + P) / 2)
+        coupon_payment = face * coupon
+        yields[i] = (coupon_payment + (face - bond_price) / years) / ((face + bond_price) / 2)
+        active.append(i)
+
+    fallback = []
+    while active:
+        still_active = []
+        for i in active:
+            bond_price, face, coupon, years = bonds[i]
+            value, slope = _bond_value_and_slope(face, face * coupon, int(years), yields[i])
+            iterations[i] += 1
+            step = (value - bond_price) / slope if slope else float("nan")
+            y = yields[i] - step
+            if not math.isfinite(y) or y <= -1:
+                fallback.append(i)
+            elif abs(step) <= tolerance * max(1.0, abs(y)):
+                yields[i] = y
+                residual = _bond_value_and_slope(face, face * coupon, int(years), y)[0] - bond_price
+                results[i] = YTMResult(y, iterations[i], residual, True, "newton")
+            elif iterations[i] >= max_iterations:
+                fallback.append(i)
+            else:
+                yields[i] = y
+                still_active.append(i)
+        active = still_active
 
-# Yield to Maturity (YTM) Calculator using bisection method
+    for i in fallback:
+        bond_price, face, coupon, years = bonds[i]
+        result = _ytm_by_brent(lambda y: _bond_value_and_slope(face, face * coupon, int(years), y)[0],
+                               bond_price, tolerance)
+        results[i] = result._replace(iterations=result.iterations + iterations[i])
+    return results if length is not None else results[0]
+
+# Yield to Maturity (YTM) Calculator
 def yield_to_maturity():
     try:
         bond_price = float(input("Enter the current bond price ($): "))
         face_value = float(input("Enter the face value of the bond ($): "))
         coupon_rate = float(input("Enter the coupon rate (as %): "))
         years_to_maturity = int(input("Enter the number of years until maturity: "))
-        coupon_payment = face_value * (coupon_rate / 100)
-
-        # Define the function f(y) = Present Value at yield y - bond_price
-        def f(y):
-            total = sum(coupon_payment / ((1 + y) ** t) for t in range(1, years_to_maturity + 1))
-            total += face_value / ((1 + y) ** years_to_maturity)
-            return total - bond_price
-
-        # Bisection method settings
-        low = 0.0001
-        high = 1.0
-        tolerance = 1e-6
-        iteration = 0
-
-        if f(low) * f(high) > 0:
-            print("YTM not found in the range. Please check your inputs.")
-            return
-
-        while high - low > tolerance and iteration < 10000:
-            mid = (low + high) / 2
-            if f(mid) == 0:
-                break
-            elif f(mid) * f(low) < 0:
-                high = mid
-            else:
-                low = mid
-            iteration += 1
 
-        ytm = (low + high) / 2
-        print(f"\nThe approximate Yield to Maturity is: {ytm * 100:.2f}%")
+        result = RESULT_CACHE.call(solve_ytm, bond_price, face_value, coupon_rate / 100, years_to_maturity)
+        if not result.converged:
+            print("YTM not found. Please check your inputs.")
+            return
+        print(f"\nThe approximate Yield to Maturity is: {result.ytm * 100:.2f}%")
     except ValueError:
         print("Invalid input! Please enter numeric values.")
 
-# Duration Calculation (Macaulay and Modified Duration)
-def duration_calculation():
-    try:
-        face_value = float(input("Enter the face value of the bond ($): "))
-        coupon_rate = float(input("Enter the coupon rate (as %): "))
-        years_to_maturity = int(input("Enter the number of years until maturity: "))
-        yield_rate_percent = float(input("Enter the yield/market interest rate (as %): "))
-        y = yield_rate_percent / 100
-        coupon_payment = face_value * (coupon_rate / 100)
+# Risk measures of a bond at one yield
+class BondRisk(NamedTuple):
+    price: float
+    macaulay_duration: float
+    modified_duration: float
+    convexity: float
+    dv01: float         # Price change for a one basis point fall in yield
 
-        # Calculate bond price using cash flows:
-        price = sum(coupon_payment / ((1 + y) ** t) for t in range(1, years_to_maturity)) \
-                + (coupon_payment + face_value) / ((1 + y) ** years_to_maturity)
+# Cash-Flow Schedule shared by the bond analytics
+class CashFlowSchedule:
+    """
+    The cash flows of one bond, built once and reused for pricing, duration, convexity, DV01 and YTM.
+    Times are in years and cash flows are discounted with annual compounding. Discount-factor vectors
+    are memoized per yield in a small LRU cache, so repeated questions at the same yield skip the powers.
+    """
+    __slots__ = ("times", "amounts", "cache_size", "_discount_cache")
 
-        weighted_sum = sum(t * (coupon_payment / ((1 + y) ** t)) for t in range(1, years_to_maturity)) \
-                       + years_to_maturity * ((coupon_payment + face_value) / ((1 + y) ** years_to_maturity))
+    def __init__(self, times, amounts, cache_size=32):
+        self.times = array("d", times)
+        self.amounts = array("d", amounts)
+        if len(self.times) != len(self.amounts):
+            raise ValueError("Every cash flow needs a payment time.")
+        if not self.times:
+            raise ValueError("A cash-flow schedule needs at least one cash flow.")
+        self.cache_size = cache_size
+        self._discount_cache = OrderedDict()
 
-        macaulay_duration = weighted_sum / price
-        modified_duration = macaulay_duration / (1 + y)
-        print(f"\nThe Macaulay Duration is: {macaulay_duration:.2f} years")
-        print(f"The Modified Duration is: {modified_duration:.2f} years")
-    except ValueError:
-        print("Invalid input! Please enter numeric values.")
+    @classmethod
+    def for_bond(cls, face_value, coupon_rate, years_to_maturity, cache_size=32):
+        """
+        Builds the schedule of an annual-coupon bond: a coupon every year and the face value at maturity.
+        A bond with 0 years left pays its last coupon and face value now (time 0), so its duration is 0.
+        :param coupon_rate: Coupon rate as a decimal (0.05 for 5%).
+        :raises ValueError: When years_to_maturity is negative.
+        """
+        if years_to_maturity < 0:
+            raise ValueError("Years to maturity cannot be negative.")
+        coupon_payment = face_value * coupon_rate
+        if years_to_maturity == 0:
+            return cls((0,), (coupon_payment + face_value,), cache_size)
+        amounts = [coupon_payment] * years_to_maturity
+        amounts[-1] += face_value
+        return cls(range(1, years_to_maturity + 1), amounts, cache_size)
 
-# --------------------- CORPORATE FINANCE & ACCOUNTING ---------------------
+    def discount_factors(self, y):
+        """
+        :return: The discount factors (1 + y)^-t of every cash flow, from the LRU cache when available.
+        """
+        factors = self._discount_cache.get(y)
+        if factors is not None:
+            self._discount_cache.move_to_end(y)
+            return factors
+        base = 1 + y
+        factors = array("d", [base ** -t for t in self.times])
+        self._discount_cache[y] = factors
+        if len(self._discount_cache) > self.cache_size:
+            self._discount_cache.popitem(last=False)
+        return factors
 
-# Internal Rate of Return (IRR) Calculator
-def irr_calculation():
-    try:
-        cash_flow_str = input("Enter cash flows separated by commas (e.g., -1000, 300, 400, 500): ")
-        cashflows = [float(cf.strip()) for cf in cash_flow_str.split(",")]
-        # Define NPV function for a given rate r
-        def npv(r):
-            return sum(cashflows[t] / ((1 + r) ** t) for t in range(len(cashflows)))
-        # Set search bounds for IRR
-        low = -0.99
-        high = 1.0
-        tolerance = 1e-6
-        iteration = 0
-
-        if npv(low) * npv(high) > 0:
-            print("IRR not found in the range -99% to 100%. Please check your cash flows.")
-            return
+    def price(self, y):
+        """
+        :return: The present value of the cash flows at yield y.
+        """
+        return math.fsum(amount * factor for amount, factor in zip(self.amounts, self.discount_factors(y)))
+
+    def risk_report(self, y):
+        """
+        Computes price, Macaulay and modified duration, convexity and DV01 in a single pass over the
+        cash flows:
+             Macaulay = sum(t * PV_t) / Price
+             Modified = Macaulay / (1 + y)
+             Convexity = sum(t * (t + 1) * PV_t) / (Price * (1 + y)^2)
+             DV01 = Modified * Price * 0.0001
+        :return: A BondRisk.
+        """
+        price = weighted = curvature = 0.0
+        for t, amount, factor in zip(self.times, self.amounts, self.discount_factors(y)):
+            present_value = amount * factor
+            price += present_value
+            weighted += t * present_value
+            curvature += t * (t + 1) * present_value
+        macaulay = weighted / price
+        modified = macaulay / (1 + y)
+        convexity = curvature / (price * (1 + y) ** 2)
+        return BondRisk(price, macaulay, modified, convexity, modified * price * 0.0001)
 
-        while high - low > tolerance and iteration < 10000:
-            mid = (low + high) / 2
-            if npv(mid) == 0:
+    def _value_and_slope(self, y):
+        base = 1 + y
+        value = slope = 0.0
+        for t, amount in zip(self.times, self.amounts):
+            present_value = amount * base ** -t
+            value += present_value
+            slope -= t * present_value
+        return value, slope / base
+
+    def ytm(self, price, guess=0.05, tolerance=1e-10, max_iterations=50):
+        """
+        Solves the yield that reprices the schedule to the given price with Newton's method, falling back
+        to Brent's method. Solver iterates bypass the discount-factor cache so they do not evict it.
+        :return: A YTMResult.
+        """
+        y = guess
+        for iteration in range(1, max_iterations + 1):
+            value, slope = self._value_and_slope(y)
+            step = (value - price) / slope if slope else float("nan")
+            y_next = y - step
+            if not math.isfinite(y_next) or y_next <= -1:
                 break
-            elif npv(mid) * npv(low) < 0:
-                high = mid
-            else:
-                low = mid
-            iteration += 1
+            y = y_next
+            if abs(step) <= tolerance * max(1.0, abs(y)):
+                return YTMResult(y, iteration, self._value_and_slope(y)[0] - price, True, "newton")
+        else:
+            iteration = max_iterations
+        result = _ytm_by_brent(lambda rate: self._value_and_slope(rate)[0], price, tolerance)
+        return result._replace(iterations=result.iterations + iteration)
 
-        irr = (low + high) / 2
-        print(f"\nThe IRR is approximately: {irr * 100:.2f}%")
-    except Exception as e:
-        print("Error:", e)
+# Duration (Macaulay and Modified Duration)
+def compute_duration(face_value, coupon_rate, years_to_maturity, yield_rate):
+    """
+    Calculate the duration and the rest of the risk measures of an annual-coupon bond at a yield.
+    Rates are decimals (0.05 for 5%).
+    :return: A BondRisk with price, Macaulay and modified duration, convexity and DV01.
+    """
+    return CashFlowSchedule.for_bond(face_value, coupon_rate, years_to_maturity).risk_report(yield_rate)
 
-# Payback Period Calculator
-def payback_period():
+# Duration Calculation (Macaulay and Modified Duration)
+def duration_calculation():
     try:
-        cash_flow_str = input("Enter cash flows separated by commas (start with the initial investment as a negative number, e.g., -1000, 300, 400, 500): ")
-        cashflows = [float(cf.strip()) for cf in cash_flow_str.split(",")]
-        cumulative = 0
-        for i, cf in enumerate(cashflows):
-            previous_cum = cumulative
-            cumulative += cf
-            if cumulative >= 0:
-                # Fraction of period required
-                if cf != 0:
-                    fraction = abs(previous_cum) / cf
-                else:
-                    fraction = 0
-                payback = i + fraction  # i is zero-indexed (period 0 is initial investment)
-                print(f"\nThe payback period is approximately: {payback:.2f} periods")
-                return
-        print("\nThe investment is not recovered within the given periods.")
-    except Exception as e:
-        print("Error:", e)
+        face_value = float(input("Enter the face value of the bond ($): "))
+        coupon_rate = float(input("Enter the coupon rate (as %): "))
+        years_to_maturity = int(input("Enter the number of years until maturity: "))
+        yield_rate_percent = float(input("Enter the yield/market interest rate (as %): "))
+        risk = RESULT_CACHE.call(compute_duration, face_value, coupon_rate / 100, years_to_maturity,
+                                 yield_rate_percent / 100)
+        print(f"\nThe Macaulay Duration is: {risk.macaulay_duration:.2f} years")
+        print(f"The Modified Duration is: {risk.modified_duration:.2f} years")
+    except ValueError as e:
+        print("Invalid input!", e)
 
-# Recovery Value Calculator
-def recovery_value():
-    try:
-        salvage_value = float(input("Enter the estimated salvage value ($): "))
-        selling_cost = float(input("Enter the selling cost percentage (as %): "))
-        tax_rate = float(input("Enter the tax rate on capital gains (as %): "))
-        net_value = salvage_value * (1 - selling_cost / 100) * (1 - tax_rate / 100)
-        print(f"\nThe net recovery value is: ${net_value:.2f}")
-    except Exception as e:
-        print("Error:", e)
+# --------------------- YIELD CURVE ---------------------
 
-# --------------------- GAMES ---------------------
+def _spline_second_derivatives(xs, ys):
+    """
+    Second derivatives of the natural cubic spline through the points (xs, ys), from the usual
+    tridiagonal system with zero curvature at both ends.
+    """
+    n = len(xs)
+    second, work = [0.0] * n, [0.0] * n
+    for i in range(1, n - 1):
+        sig = (xs[i] - xs[i - 1]) / (xs[i + 1] - xs[i - 1])
+        p = sig * second[i - 1] + 2
+        second[i] = (sig - 1) / p
+        slope_change = (ys[i + 1] - ys[i]) / (xs[i + 1] - xs[i]) - (ys[i] - ys[i - 1]) / (xs[i] - xs[i - 1])
+        work[i] = (6 * slope_change / (xs[i + 1] - xs[i - 1]) - sig * work[i - 1]) / p
+    for k in range(n - 2, -1, -1):
+        second[k] = second[k] * second[k + 1] + work[k]
+    return second
 
-def Footy_tictactoe():
-    print("Welcome to the Tic Tac Toe game"
-          """
-             This function will play a game of Tic-Tac-Toe based on football. The idea of the game is the same as a normal
-             Tic-Tac-Toe, but with a catch, for each cell, there are conditions that have to be satisfied with a football player.
-             For further simplicity of the game, four categories have been added that can be used in the grid, they are the
-             following: Country, Club, League, Ballon D'or Winner and Champions League winner. There are four sets to play the game,
-             increasing in difficulty. From set one to four, the logic and programming behind the game is the same as used in
-             the preliminary versions, just adding the use of dictionaries to assign players to their respective cells, through
-             using the numbers. The maximum pool of players for each condition is 6, the most famous players will be included or
-             the most influential for that specific category, the input might not be always wrong, just not included within the conditions,
-             try and think about the basic answers, the most influential ones (e.g. for Liverpool and Spain Xabi Alonso, not Iago Aspas).
-             Finally, it is important to note that special characters are not supported in player names, therefore the name must be
-             introduced in the following way: "Firstname Lastname" or just "Lastname" making García an invalid name, Garcia would be valid.
-             :return: The Footy Tic-Tac-Toe game. (Football inspired version of a Tic-Tac-Toe game)
-             """)
-    # DIFFERENT CONFIGURATIONS FOR THE TIC TAC TOE GAME
+def _interpolate(xs, ys, second, x):
+    """
+    Interpolates ys at x, linearly or, when spline second derivatives are given, with the cubic spline.
+    Values outside the knots are extrapolated flat.
+    """
+    if x <= xs[0]:
+        return ys[0]
+    if x >= xs[-1]:
+        return ys[-1]
+    high = bisect.bisect_right(xs, x)
+    low = high - 1
+    h = xs[high] - xs[low]
+    a = (xs[high] - x) / h
+    b = 1 - a
+    y = a * ys[low] + b * ys[high]
+    if second is not None:
+        y += ((a ** 3 - a) * second[low] + (b ** 3 - b) * second[high]) * h * h / 6
+    return y
 
-    def config_game1():
+# Zero-Coupon Yield Curve
+class YieldCurve:
+    """
+    Annually compounded zero rates at a set of tenors (in years), interpolated linearly or with a natural
+    cubic spline and extrapolated flat. Discount factors and their running sums (annuity factors) are
+    precomputed once on a shared annual grid, so an annual-coupon bond prices in O(1) against the curve.
+    """
+    __slots__ = ("tenors", "zero_rates", "method", "_second", "grid_discount_factors", "grid_annuity_factors")
+
+    def __init__(self, tenors, zero_rates, method="linear"):
+        if method not in ("linear", "cubic"):
+            raise ValueError("Interpolation method must be 'linear' or 'cubic'.")
+        self.tenors = array("d", tenors)
+        self.zero_rates = array("d", zero_rates)
+        if not self.tenors or len(self.tenors) != len(self.zero_rates):
+            raise ValueError("Every tenor needs exactly one zero rate.")
+        if self.tenors[0] <= 0 or any(b <= a for a, b in zip(self.tenors, self.tenors[1:])):
+            raise ValueError("Tenors must be positive and strictly increasing.")
+        if min(self.zero_rates) <= -1:
+            raise ValueError("Zero rates must be greater than -100%.")
+        self.method = method
+        self._second = (_spline_second_derivatives(self.tenors, self.zero_rates)
+                        if method == "cubic" and len(self.tenors) > 2 else None)
+        # Shared annual grid: index n holds the discount factor of year n and the sum of years 1..n
+        self.grid_discount_factors = array("d", [1.0])
+        self.grid_annuity_factors = array("d", [0.0])
+        for year in range(1, math.ceil(self.tenors[-1]) + 1):
+            factor = (1 + self.zero_rate(year)) ** -year
+            self.grid_discount_factors.append(factor)
+            self.grid_annuity_factors.append(self.grid_annuity_factors[-1] + factor)
+
+    @classmethod
+    def from_par_yields(cls, tenors, par_yields, method="linear"):
         """
-        First configuration for the game, only including the conditions for countries and clubs. Maximum of 6 players
-        are valid for each category, the most famous ones will be included, categories are ideated for having no more than
-        5 options generally. It is important to note that the player will be included for the team he was most influential
-        for in case of being available for multiple options, Nazario and Figo are considered Real Madrid players, not
-        Barcelona players for this game and configurations.
-        :return: The game board configuration with the following labels and the players that can be assigned to each cell.
+        Bootstraps a zero curve from annual-coupon par yields (decimals). Par yields are interpolated onto
+        every year up to the last tenor, then each year's discount factor follows from pricing its par bond
+        at 100:
+             DF_n = (1 - c_n * (DF_1 + ... + DF_n-1)) / (1 + c_n)
+             Zero_n = DF_n^(-1/n) - 1
         """
-        # Configuration for Game 1
-        row_labels = ["REAL MADRID", "BARÇA", "ATLETI"]
-        col_labels = ["PORTUGAL", "HOLLAND", "BRAZIL"]
-        player_to_cell = {
-            "Cristiano Ronaldo": 1, "Cristiano": 1, "Luis Figo": 1, "Figo": 1, "Pepe": 1, "Ricardo Carvalho": 1,
-            "Carvalho": 1, "Fabio Coentrao": 1, "Coentrao": 1,
-            "Clarence Seedorf": 2, "Seedorf": 2, "Ruud van Nistelrooy": 2, "Van Nistelrooy": 2, "Arjen Robben": 2,
-            "Robben": 2, "Wesley Sneijder": 2, "Sneijder": 2, "Rafael van der Vaart": 2, "Van der Vaart": 2,
-            "Klaas-Jan Huntelaar": 2, "Huntelaar": 2,
-            "Roberto Carlos": 3, "Ronaldo Nazario": 3, "Ronaldo": 3, "Kaka": 3, "Marcelo Vieira": 3, "Marcelo": 3,
-            "Casemiro": 3, "Vinicius Junior": 3, "Vinicius": 3,
-            "Deco": 4, "Baia": 4, "Simao Sabrosa": 4, "Andre Gomes": 4, "Nelson Semedo": 4, "Semedo": 4,
-            "Johan Cruyff": 5, "Cruyff": 5, "Ronald Koeman": 5, "Koeman": 5, "Patrick Kluivert": 5, "Kluivert": 5,
-            "Marc Overmars": 5, "Overmars": 5, "Frenkie de Jong": 5, "De Jong": 5, "Edgar Davids": 5, "Davids": 5,
-            "Romario": 6, "Rivaldo": 6, "Ronaldinho Gaucho": 6, "Ronaldinho": 6, "Dani Alves": 6, "Alves": 6,
-            "Raphinha": 6, "Vitor Roque": 6,
-            "Jorge Alberto Mendonça": 7, "Mendonça": 7, "Paulo Futre": 7, "Futre": 7, "Hugo Leal": 7, "Leal": 7,
-            "Pizzi": 7, "Diogo Jota": 7, "Jota": 7, "Gelson Martins": 7, "Martins": 7,
-            "Jimmy Hasselbaink": 8, "Hasselbaink": 8, "John Heitinga": 8, "Heitinga": 8, "Kizito Musampa": 8,
-            "Musampa": 8, "Memphis Depay": 8, "Depay": 8, "Merel van Dongen": 8, "Van Dongen": 8,
-            "Sari van Veenedaal": 8, "Van Veenedaal": 8,
-            "Diego Costa": 9, "Filipe Luis": 9, "João Miranda": 9, "Miranda": 9, "Matheus Cunha": 9, "Cunha": 9
-        }
-        return row_labels, col_labels, player_to_cell
+        tenors = list(tenors)
+        par_yields = list(par_yields)
+        if len(tenors) != len(par_yields) or not tenors:
+            raise ValueError("Every tenor needs exactly one par yield.")
+        if tenors[0] <= 0 or any(b <= a for a, b in zip(tenors, tenors[1:])):
+            raise ValueError("Tenors must be positive and strictly increasing.")
+        second = _spline_second_derivatives(tenors, par_yields) if method == "cubic" and len(tenors) > 2 else None
+        zero_rates, annuity = [], 0.0
+        years = range(1, math.ceil(tenors[-1]) + 1)
+        for year in years:
+            coupon = _interpolate(tenors, par_yields, second, year)
+            factor = (1 - coupon * annuity) / (1 + coupon)
+            if factor <= 0:
+                raise ValueError(f"The par yields imply a non-positive discount factor at year {year}.")
+            annuity += factor
+            zero_rates.append(factor ** (-1 / year) - 1)
+        return cls(years, zero_rates, method)
 
-    def config_game2():
+    def zero_rate(self, t):
         """
-        Second configuration of the game now introducing the new conditions Ballon D'or Winner and Champions League winner,
-        players that have done both are only counted for one category, in this case Zinedine Zidane is considered for Ballon D'or Winner
-        as he has more than Benzema, as he is now considered as UCL winner for this game, the player will not lose the turn when introducing
-        an invalid input.
-        :return: The game board configuration and game configuration according to the conditions below.
+        :return: The zero rate at time t, or an array('d') of zero rates when t is a sequence.
         """
-        # Configuration for Game 2
-        row_labels = ["UCL WINNER", "DORTMUND", "BALLON D'OR"]
-        col_labels = ["CZECHIA", "FRANCE", "ENGLAND"]
-        player_to_cell = {
-            "Milan Baros": 1, "Baros": 1, "Vladimir Smicer": 1, "Smicer": 1, "Marek Jankulovski": 1, "Jankulovski": 1,
-            "Petr Cech": 1, "Cech": 1,
-            "Karim Benzema": 2, "Benzema": 2, "Didier Deschamps": 2, "Deschamps": 2, "Bixente Lizarazu": 2,
-            "Lizarazu": 2, "Christophe Dugarry": 2, "Dugarry": 2, "Kingsley Coman": 2, "Coman": 2,
-            "Steven Gerrard": 3, "Gerrard": 3, "Frank Lampard": 3, "Lampard": 3, "Wayne Rooney": 3, "Rooney": 3,
-            "Rio Ferdinand": 3, "Ferdinand": 3, "David Beckham": 3, "Beckham": 3, "Paul Scholes": 3, "Scholes": 3,
-            "Jan Koller": 4, "Koller": 4, "Tomas Rosicky": 4, "Rosicky": 4, "Patrik Berger": 4, "Berger": 4,
-            "Ousmane Dembele": 5, "Dembele": 5, "Axel Zagadou": 5, "Zagadou": 5, "Anthony Modeste": 5, "Modeste": 5,
-            "Damien Le Tallec": 5, "Le Tallec": 5, "Soumaila Coulibaly": 5, "Coulibaly": 5,
-            "Jadon Sancho": 6, "Sancho": 6, "Jude Bellingham": 6, "Bellingham": 6, "Jamie Bynoe Gittens": 6,
-            "Bynoe Gittens": 6, "Carney Chukwuemeka": 6, "Chukwuemeka": 6,
-            "Josef Masopust": 7, "Masopust": 7, "Pavel Nedved": 7, "Nedved": 7,
-            "Raymond Kopa": 8, "Kopa": 8, "Michel Platini": 8, "Platini": 8, "Jean Pierre Papin": 8, "Papin": 8,
-            "Zinedine Zidane": 8, "Zidane": 8,
-            "Stanley Matthews": 9, "Matthews": 9, "Bobby Charlton": 9, "Charlton": 9, "Kevin Keegan": 9, "Keegan": 9,
-            "Michael Owen": 9, "Owen": 9
-        }
-        return row_labels, col_labels, player_to_cell
+        if isinstance(t, (int, float)):
+            return _interpolate(self.tenors, self.zero_rates, self._second, t)
+        return array("d", (_interpolate(self.tenors, self.zero_rates, self._second, x) for x in t))
 
-    def config_game3():
+    def discount_factor(self, t):
         """
-        Third configuration of the game, first mixing all the conditions freely, players that have done both are only counted for one category,
-        In the case of Cristiano Ronaldo he is counted for the Ballon D'or only, not for Manchester UDT and Portugal.
-        :return: The third variety of the game board with its respective inputs.
+        :return: The discount factor (1 + z(t))^-t at time t, or an array('d') when t is a sequence.
         """
-        # Configuration for Game 3
-        row_labels = ["MANCHESTER UDT", "LIVERPOOL", "BALLON D'OR"]
-        col_labels = ["PORTUGAL", "MAN CITY", "BARÇA"]
-        player_to_cell = {
-            "Nani": 1, "Luis Nani": 1, "Bebe": 1, "Tiago Bebe": 1, "Joel Pereira": 1, "Pereira": 1, "Diogo Dalot": 1,
-            "Dalot": 1, "Bruno Fernandes": 1, "Fernandes": 1,
-            "Denis Law": 2, "Law": 2, "Brian Kidd": 2, "Kidd": 2, "Peter Schmeichel": 2, "Schmeichel": 2,
-            "Andy Cole": 2, "Cole": 2, "Carlos Tevez": 2, "Tevez": 2, "Owen Hargreaves": 2, "Hargreaves": 2,
-            "Mark Hughes": 3, "Hughes": 3, "Jordi Cruyff": 3, "Laurent Blanc": 3, "Blanc": 3, "Henrik Larsson": 3,
-            "Larsson": 3, "Victor Valdes": 3, "Valdes": 3, "Zlatan Ibrahimovic": 3, "Ibrahimovic": 3, "Gerard Pique": 3,
-            "Pique": 3,
-            "Diogo Jota": 4, "Jota": 4, "Fabio Carvalho": 4, "Carvalho": 4, "Raul Meireles": 4, "Meireles": 4,
-            "Joao Carlos Teixeira": 4, "Teixeira": 4, "Tiago Ilori": 4, "Ilori": 4, "Rafael Camacho": 4, "Camacho": 4,
-            "James Milner": 5, "Milner": 5, "Raheem Sterling": 5, "Sterling": 5, "Robbie Fowler": 5, "Fowler": 5,
-            "Steve McManaman": 5, "McManaman": 5, "Dietmar Hamann": 5, "Hamann": 5, "Craig Bellamy": 5, "Bellamy": 5,
-            "Luis Suarez": 6, "Suarez": 6, "Javier Mascherano": 6, "Mascherano": 6, "Philippe Coutinho": 6,
-            "Coutinho": 6, "Pepe Reina": 6, "Reina": 6, "Luis Garcia": 6, "Garcia": 6, "Boudewijn Zenden": 6,
-            "Zenden": 6,
-            "Eusebio": 7, "Eusebio da Silva Ferreira": 7, "Luis Figo": 7, "Figo": 7, "Cristiano Ronaldo": 7,
-            "Cristiano": 7,
-            "Rodrigo Hernandez": 8, "Rodri": 8,
-            "Johan Cruyff": 9, "Cruyff": 9, "Hristo Stoichkov": 9, "Stoichkov": 9, "Rivaldo": 9, "Ronaldinho Gaucho": 9,
-            "Ronaldinho": 9, "Lionel Messi": 9, "Messi": 9
-        }
-        return row_labels, col_labels, player_to_cell
+        if isinstance(t, (int, float)):
+            return (1 + self.zero_rate(t)) ** -t
+        return array("d", ((1 + z) ** -x for x, z in zip(t, self.zero_rate(t))))
 
-    def config_game4():
+    def _price_bond(self, face_value, coupon_rate, years_to_maturity):
+        if years_to_maturity != int(years_to_maturity) or not 0 <= years_to_maturity < len(self.grid_annuity_factors):
+            return float("nan")
+        years_to_maturity = int(years_to_maturity)
+        return (face_value * coupon_rate * self.grid_annuity_factors[years_to_maturity]
+                + face_value * self.grid_discount_factors[years_to_maturity])
+
+    def price_bonds(self, face, coupon_rate, years):
         """
-        Fourth configuration for the game, the difficulty lies on the scarcity of possible answers for each condition
-        but either way the players available for those slots are well and widely known, for the Spanish row, I have decided
-        to go for a mix between influence and the best players and most influential for those teams overall
-        :return: The fourth variety of the game board with its respective inputs.
+        Prices annual-coupon bonds against the curve from the precomputed grid:
+             Price = C * (DF_1 + ... + DF_n) + F * DF_n
+        Arguments broadcast like the flat-rate price_bonds; maturities beyond the curve price as NaN.
+        :return: A float for scalar arguments, otherwise an array('d') of prices in input order.
         """
-        # Configuration for Game 4
-        row_labels = ["UKRAINE", "SPAIN", "RUSSIA"]
-        col_labels = ["BALLON D'OR", "REAL MADRID", "ARSENAL"]
-        player_to_cell = {
-            "Andriy Shevchenko": 1, "Shevchenko": 1,
-            "Andriy Lunin": 2, "Lunin": 2, "Oleh Luzhnyi": 2, "Luzhnyi": 2,
-            "Oleksandr Zinchenko": 3,
-            "Luis Suarez": 4, "Suarez": 4, "Rodrigo Hernandez": 4, "Rodri": 4,
-            "Sergio Ramos": 5, "Ramos": 5, "Iker Casillas": 5, "Casillas": 5, "Dani Carvajal": 5, "Carvajal": 5,
-            "Xabi Alonso": 5, "Alonso": 5, "Lucas Vazquez": 5, "Vazquez": 5, "Asier Illarramendi": 5, "Illarramendi": 5,
-            "Nacho": 5, "Marco Asensio": 5, "Asensio": 5,
-            "Cesc Fabregas": 6, "Santi Cazorla": 6, "Cazorla": 6, "Mikel Arteta": 6, "Arteta": 6, "Mikel Merino": 6,
-            "Merino": 6, "Hector Bellerin": 6, "Bellerin": 6, "Cesar Azpilicueta": 6, "Azpilicueta": 6,
-            "Nacho Monreal": 6, "Monreal": 6,
-            "Lev Yashin": 7, "Yashin": 7,
-            "Denis Cheryshev": 8, "Cheryshev": 8,
-            "Andrei Arshavin": 9, "Arshavin": 9,
-        }
-        return row_labels, col_labels, player_to_cell
-
-    def play_game(Team_1, Team_2, row_labels, col_labels, player_to_cell):
+        length, columns = _broadcast(face, coupon_rate, years)
+        if length is None:
+            return self._price_bond(*(column[0] for column in columns))
+        return array("d", map(self._price_bond, *columns))
+
+    def price_cash_flows(self, times, amounts):
         """
-        Allows for the game to actually be played. It sets up the game board and the values inside each cell, that
-        will later be changed with another function.
-        :param Team_1: Home team, the team that will be assigned the symbol "X" on the board.
-        :param Team_2: Away team, the team that will be assigned the symbol "O" on the board.
-        :param row_labels: According to the different configurations of the game, the labels with the row conditions for the game
-        :param col_labels: According to the different configurations of the game, the labels with the column conditions for the game
-        :param player_to_cell: The dictionary that allows for that specific configuration to be used and have the players assigned
-        to a certain cell on the board, allowing for the game to be played
-        :return: The logic of the game board and the possible inputs for each category and respective cell.
+        :return: The present value of arbitrary cash flows (such as a CashFlowSchedule's) on the curve.
         """
-        # Basic game setup
-        gameBoard = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
-        rows = 3
-        columns = 3
-        available_positions = [1, 2, 3, 4, 5, 6, 7, 8, 9]
-        home_team = "X"
-        away_team = "O"
-        endloop = False
-        Count_Turns = 0
+        return math.fsum(amount * factor for amount, factor in zip(amounts, self.discount_factor(times)))
 
-        # PRINT THE GAME BOARD
-        def printboard():
-            """
-            Function that prints the game board, allowing for the visual representation of every step of the game, it
-            prints the board after every turn with its updated version. The labels are also printed for every cell and category
-            :return: Prints the game board with its respective labels and cells at any given moment during the game, the current
-            state of the game board at that moment during the game .
-            """
-            print(" " * 20, end="")
-            for header in col_labels:
-                print(f"{header:^15}", end=" ")
-            print("\n" + "-" * 70)
-            for i in range(rows):
-                print(f"{row_labels[i]:<15}", end="|")
-                for j in range(columns):
-                    print(f"{str(gameBoard[i][j]):^15}", end="|")
-                print("\n" + "-" * 70)
+def _parse_curve_points(text):
+    """
+    Parses "tenor:rate%" pairs such as "1:3.5, 2:3.8, 5:4.1" into sorted tenors and decimal rates.
+    """
+    points = []
+    for pair in text.replace(" ", "").split(","):
+        if pair.count(":") != 1:
+            raise ValueError(f"'{pair}' is not a tenor:rate pair.")
+        tenor, rate = pair.split(":")
+        points.append((float(tenor), float(rate) / 100))
+    points.sort()
+    return [tenor for tenor, _ in points], [rate for _, rate in points]
+
+# Bond Price on a Yield Curve Calculator
+def curve_bond_calculator():
+    try:
+        points = input("Enter par yields as tenor:rate pairs in % (e.g., 1:3.5, 2:3.8, 5:4.1, 10:4.4): ")
+        method = input("Interpolation method, linear or cubic (default linear): ").strip().lower() or "linear"
+        face_value = float(input("Enter the face value of the bond ($): "))
+        coupon_rate = float(input("Enter the coupon rate (as %): ")) / 100
+        years_to_maturity = int(input("Enter the number of years until maturity: "))
+
+        curve = YieldCurve.from_par_yields(*_parse_curve_points(points), method=method)
+        bond_price = curve.price_bonds(face_value, coupon_rate, years_to_maturity)
+        if math.isnan(bond_price):
+            print("The bond matures beyond the end of the curve.")
+            return
+        print(f"\nThe zero rate at maturity is: {curve.zero_rate(years_to_maturity) * 100:.2f}%")
+        print(f"The present value (price) of the bond on the curve is: ${bond_price:.2f}")
+    except ValueError as e:
+        print("Invalid input!", e)
+
+# --------------------- RATE SCENARIOS ---------------------
+
+# Scenario prices and risk of a bond book
+class ScenarioReport(NamedTuple):
+    base_prices: array          # Price of every bond on the unshifted curve
+    prices: list                # prices[s][b]: price of bond b under scenario s
+    dv01: array                 # Price change for a one basis point parallel fall in rates
+    convexity: array
+    key_rate_durations: dict    # Key tenor -> array of key-rate durations, one per bond
+
+def parallel_scenario(curve, shift):
+    """
+    :return: Zero-rate shifts on the curve's annual grid moving every year by shift (0.0001 = 1bp).
+    """
+    return array("d", [shift] * (len(curve.grid_discount_factors) - 1))
+
+def twist_scenario(curve, short_shift, long_shift):
+    """
+    :return: Zero-rate shifts rotating the curve, short_shift at year 1 moving linearly to long_shift at the
+    last year of the grid.
+    """
+    horizon = len(curve.grid_discount_factors) - 1
+    if horizon == 1:
+        return array("d", [short_shift])
+    return array("d", [short_shift + (long_shift - short_shift) * (year - 1) / (horizon - 1)
+                       for year in range(1, horizon + 1)])
+
+def key_rate_scenario(curve, key_tenor, shift, key_tenors=(1, 2, 5, 10, 20, 30)):
+    """
+    :return: Zero-rate shifts bumping one key rate by shift, fading linearly to zero at the neighbouring
+    key tenors (and staying flat beyond the first and last key tenor), so the key-rate bumps of every key
+    tenor add up to a parallel shift.
+    """
+    keys = sorted(key_tenors)
+    position = keys.index(key_tenor)
+    shifts = array("d")
+    for year in range(1, len(curve.grid_discount_factors)):
+        if year == key_tenor:
+            weight = 1.0
+        elif year < key_tenor:
+            weight = 1.0 if position == 0 else max(0.0, (year - keys[position - 1]) / (key_tenor - keys[position - 1]))
+        else:
+            weight = 1.0 if position == len(keys) - 1 else max(0.0, (keys[position + 1] - year) / (keys[position + 1] - key_tenor))
+        shifts.append(shift * weight)
+    return shifts
+
+def _shifted_grid(curve, shifts):
+    """
+    Discount factors and running annuity factors of the curve's annual grid after shifting each year's
+    zero rate.
+    """
+    factors, annuity = [1.0], [0.0]
+    for year, (factor, shift) in enumerate(zip(itertools.islice(curve.grid_discount_factors, 1, None), shifts), start=1):
+        if shift:
+            factor = (factor ** (-1 / year) + shift) ** -year
+        factors.append(factor)
+        annuity.append(annuity[-1] + factor)
+    return factors, annuity
+
+# Scenario Engine
+def run_scenarios(curve, face, coupon_rate, years, scenarios=(), key_tenors=(1, 2, 5, 10, 20, 30), bump=0.0001):
+    """
+    Revalues a book of annual-coupon bonds under a matrix of zero-rate scenarios and reports DV01, convexity
+    and key-rate durations in the same pass. Each bond is reduced once to its layout (coupon, face, maturity
+    index into the curve grid); every scenario then only rebuilds the grid discount and annuity factors and
+    prices each bond in O(1) from them:
+         DV01 = (P(-1bp) - P(+1bp)) / 2
+         Convexity = (P(+bp) + P(-bp) - 2 * P) / (P * bp^2)
+         KRD_k = (P(key k - bp) - P(key k + bp)) / (2 * P * bp)
+    :param scenarios: Zero-rate shift vectors over years 1..last curve year (see parallel_scenario,
+    twist_scenario and key_rate_scenario).
+    :param key_tenors: Key tenors for the key-rate durations; those beyond the curve are dropped.
+    :param bump: Size of the internal bumps used for the risk measures.
+    :return: A ScenarioReport.
+    """
+    horizon = len(curve.grid_discount_factors) - 1
+    length, columns = _broadcast(face, coupon_rate, years)
+    layout = []
+    for face_value, coupon, maturity in zip(*columns):
+        if maturity != int(maturity) or not 1 <= maturity <= horizon:
+            raise ValueError(f"Bond maturity {maturity} is outside the curve's 1 to {horizon} years.")
+        layout.append((face_value * coupon, face_value, int(maturity)))
+    scenarios = [array("d", scenario) for scenario in scenarios]
+    if any(len(scenario) != horizon for scenario in scenarios):
+        raise ValueError(f"Every scenario needs one shift per curve year (1 to {horizon}).")
+    keys = [key for key in sorted(key_tenors) if key <= horizon]
+
+    # User scenarios and internal risk bumps are priced in the same batched loop
+    internal = [parallel_scenario(curve, 0.0), parallel_scenario(curve, bump), parallel_scenario(curve, -bump)]
+    for key in keys:
+        internal.append(key_rate_scenario(curve, key, bump, keys))
+        internal.append(key_rate_scenario(curve, key, -bump, keys))
+    priced = []
+    for shifts in scenarios + internal:
+        factors, annuity = _shifted_grid(curve, shifts)
+        priced.append(array("d", [coupon * annuity[n] + face_value * factors[n] for coupon, face_value, n in layout]))
+
+    base, up, down = priced[len(scenarios):len(scenarios) + 3]
+    dv01 = array("d", [(d - u) / 2 for u, d in zip(up, down)])
+    convexity = array("d", [(u + d - 2 * p) / (p * bump * bump) for p, u, d in zip(base, up, down)])
+    key_rate_durations = {}
+    for i, key in enumerate(keys):
+        key_up, key_down = priced[len(scenarios) + 3 + 2 * i], priced[len(scenarios) + 4 + 2 * i]
+        key_rate_durations[key] = array("d", [(d - u) / (2 * p * bump) for p, u, d in zip(base, key_up, key_down)])
+    return ScenarioReport(base, priced[:len(scenarios)], dv01, convexity, key_rate_durations)
+
+# --------------------- MONTE CARLO VALUATION ---------------------
+
+# Monte Carlo estimate of a bond price
+class MonteCarloResult(NamedTuple):
+    price: float
+    std_error: float
+    ci_low: float
+    ci_high: float
+    paths: int
+
+def _short_rate_step(model, rates, shocks, speed, mean, volatility, dt):
+    """
+    Advances every path of a short-rate model by one time step:
+         Vasicek: dr = speed * (mean - r) dt + volatility dW                (exact Gaussian transition)
+         CIR:     dr = speed * (mean - r) dt + volatility * sqrt(r) dW      (Euler, full truncation at zero)
+    """
+    root_dt = math.sqrt(dt)
+    if model == "vasicek":
+        decay = math.exp(-speed * dt)
+        spread = volatility * math.sqrt((1 - decay * decay) / (2 * speed)) if speed else volatility * root_dt
+        return [mean + (r - mean) * decay + spread * z for r, z in zip(rates, shocks)]
+    if model == "cir":
+        return [r + speed * (mean - max(r, 0.0)) * dt + volatility * math.sqrt(max(r, 0.0)) * root_dt * z
+                for r, z in zip(rates, shocks)]
+    raise ValueError("Model must be 'vasicek' or 'cir'.")
+
+def _draw_shocks(rng, count, antithetic):
+    """
+    Standard normal shocks for count paths; with antithetic variates the second half mirrors the first.
+    """
+    if not antithetic:
+        return [rng.gauss(0.0, 1.0) for _ in range(count)]
+    half = [rng.gauss(0.0, 1.0) for _ in range(count // 2)]
+    return half + [-z for z in half]
+
+def simulate_short_rate_paths(model="vasicek", r0=0.03, speed=0.2, mean=0.04, volatility=0.01, years=10,
+                              steps_per_year=12, paths=1_000, seed=None, antithetic=True):
+    """
+    Simulates short-rate paths with a seeded generator. With antithetic variates path i + paths / 2 uses
+    the mirrored shocks of path i, so paths must be even.
+    :return: A list of paths, each an array('d') of years * steps_per_year + 1 rates starting at r0.
+    """
+    if antithetic and paths % 2:
+        raise ValueError("Antithetic variates need an even number of paths.")
+    rng = random.Random(seed)
+    dt = 1 / steps_per_year
+    rates = [r0] * paths
+    rows = [array("d", [r0]) for _ in range(paths)]
+    for _ in range(years * steps_per_year):
+        rates = _short_rate_step(model, rates, _draw_shocks(rng, paths, antithetic), speed, mean, volatility, dt)
+        for row, r in zip(rows, rates):
+            row.append(r)
+    return rows
+
+def _path_discount_chunks(model, r0, speed, mean, volatility, horizon, steps_per_year, paths, chunk_size, rng,
+                          antithetic):
+    """
+    Simulates paths chunk by chunk and keeps only what bond pricing needs: per year, the pathwise discount
+    factors exp(-integral of r) and their running sums. Memory is chunk_size * horizon whatever the path count.
+    :return: A generator of (discount factors, annuity factors) lists indexed [year][path].
+    """
+    dt = 1 / steps_per_year
+    done = 0
+    while done < paths:
+        size = min(chunk_size, paths - done)
+        rates = [r0] * size
+        integrals = [0.0] * size
+        factors, annuity = [[1.0] * size], [[0.0] * size]
+        for _ in range(horizon):
+            for _ in range(steps_per_year):
+                next_rates = _short_rate_step(model, rates, _draw_shocks(rng, size, antithetic), speed, mean,
+                                              volatility, dt)
+                integrals = [total + (r + n) * 0.5 * dt for total, r, n in zip(integrals, rates, next_rates)]
+                rates = next_rates
+            year_factors = [math.exp(-total) for total in integrals]
+            factors.append(year_factors)
+            annuity.append([a + d for a, d in zip(annuity[-1], year_factors)])
+        yield factors, annuity
+        done += size
+
+# Monte Carlo Bond Pricing
+def monte_carlo_bond_prices(face, coupon_rate, years, model="vasicek", r0=0.03, speed=0.2, mean=0.04,
+                            volatility=0.01, paths=10_000, steps_per_year=12, seed=None, antithetic=True,
+                            chunk_size=10_000, confidence=0.95):
+    """
+    Prices annual-coupon bonds by simulating a Vasicek or CIR short rate and discounting every bond along
+    every path:
+         Price_path = C * (D_1 + ... + D_n) + F * D_n,    D_t = exp(-integral of r from 0 to t)
+    Paths are processed in chunks, and only running sums are kept between chunks, so memory stays bounded
+    at any path count. With antithetic variates each mirrored pair is averaged before the standard error
+    is taken, as the two halves are not independent.
+    :return: A MonteCarloResult for scalar arguments, otherwise a list of them in input order.
+    """
+    length, columns = _broadcast(face, coupon_rate, years)
+    bonds = list(zip(*columns))
+    if any(maturity != int(maturity) or maturity < 1 for _, _, maturity in bonds):
+        raise ValueError("Years to maturity must be whole numbers of at least 1.")
+    if paths < 1 or chunk_size < 1:
+        raise ValueError("The number of paths and the chunk size must be at least 1.")
+    if antithetic:
+        paths += paths % 2
+        chunk_size += chunk_size % 2
+    horizon = int(max(maturity for _, _, maturity in bonds))
+    rng = random.Random(seed)
+    totals = [0.0] * len(bonds)
+    squares = [0.0] * len(bonds)
+    samples = 0
+    for factors, annuity in _path_discount_chunks(model, r0, speed, mean, volatility, horizon, steps_per_year,
+                                                  paths, chunk_size, rng, antithetic):
+        for b, (face_value, coupon, maturity) in enumerate(bonds):
+            coupon_payment = face_value * coupon
+            values = [coupon_payment * a + face_value * d for a, d in zip(annuity[int(maturity)], factors[int(maturity)])]
+            if antithetic:
+                half = len(values) // 2
+                values = [(x + y) / 2 for x, y in zip(values[:half], values[half:])]
+            totals[b] += math.fsum(values)
+            squares[b] += math.fsum(x * x for x in values)
+        samples += len(factors[0]) // 2 if antithetic else len(factors[0])
+
+    z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+    results = []
+    for total, square in zip(totals, squares):
+        price = total / samples
+        variance = max(square / samples - price * price, 0.0) * samples / max(samples - 1, 1)
+        std_error = math.sqrt(variance / samples)
+        results.append(MonteCarloResult(price, std_error, price - z * std_error, price + z * std_error, paths))
+    return results if length is not None else results[0]
+
+def _vasicek_zero_coupon_price(r0, speed, mean, volatility, maturity):
+    """
+    Closed-form Vasicek zero-coupon bond price, the exact answer the simulation converges to.
+    """
+    b = (1 - math.exp(-speed * maturity)) / speed
+    a = (mean - volatility ** 2 / (2 * speed ** 2)) * (b - maturity) - volatility ** 2 * b ** 2 / (4 * speed)
+    return math.exp(a - b * r0)
+
+# Monte Carlo Bond Price Calculator
+def monte_carlo_bond_calculator():
+    try:
+        face_value = float(input("Enter the face value of the bond ($): "))
+        coupon_rate = float(input("Enter the coupon rate (as %): ")) / 100
+        years_to_maturity = int(input("Enter the number of years until maturity: "))
+        model = input("Short-rate model, vasicek or cir (default vasicek): ").strip().lower() or "vasicek"
+        r0 = float(input("Enter the current short rate (as %): ")) / 100
+        mean = float(input("Enter the long-run mean rate (as %): ")) / 100
+        speed = float(input("Enter the mean-reversion speed (e.g., 0.2): "))
+        volatility = float(input("Enter the rate volatility (as %): ")) / 100
+        paths = int(input("Enter the number of simulated paths (e.g., 10000): "))
+
+        result = monte_carlo_bond_prices(face_value, coupon_rate, years_to_maturity, model, r0, speed, mean,
+                                         volatility, paths)
+        print(f"\nThe simulated price of the bond is: ${result.price:.2f} (standard error ${result.std_error:.4f})")
+        print(f"95% confidence interval: ${result.ci_low:.2f} to ${result.ci_high:.2f}")
+    except ValueError as e:
+        print("Invalid input!", e)
+
+# --------------------- DATED BONDS & DAY COUNTS ---------------------
+
+DAY_COUNT_CONVENTIONS = ("30/360", "ACT/365", "ACT/ACT")
+
+# Coupon dates of a bond template
+class CouponSchedule(NamedTuple):
+    dates: tuple        # Start of the first coupon period (on or before issue), then every coupon date
+    frequency: int
+    convention: str
+
+# Clean and dirty price of a dated bond
+class DatedBondPrice(NamedTuple):
+    clean: float
+    dirty: float
+    accrued: float
+    next_coupon: date
+    coupons_left: int
+
+def _as_date(value):
+    return value if isinstance(value, date) else date.fromisoformat(str(value))
+
+def _add_months(day, months):
+    """
+    Moves a date by a number of months, clamping to the end of shorter months (31 Aug - 6 months = 28/29 Feb).
+    """
+    month_index = day.year * 12 + day.month - 1 + months
+    year, month = divmod(month_index, 12)
+    return date(year, month + 1, min(day.day, calendar.monthrange(year, month + 1)[1]))
+
+def _days_30_360(start, end):
+    """
+    Day count under the US 30/360 (bond basis) convention.
+    """
+    d1 = min(start.day, 30)
+    d2 = min(end.day, 30) if d1 == 30 else end.day
+    return 360 * (end.year - start.year) + 30 * (end.month - start.month) + (d2 - d1)
+
+def _period_fraction(start, end, period_start, period_end, convention, frequency):
+    """
+    Fraction of a coupon period between start and end under a day-count convention:
+         30/360:  days360(start, end) * frequency / 360
+         ACT/365: actual days * frequency / 365
+         ACT/ACT: actual days / actual days in the coupon period (ICMA)
+    """
+    if convention == "30/360":
+        return _days_30_360(start, end) * frequency / 360
+    if convention == "ACT/365":
+        return (end - start).days * frequency / 365
+    if convention == "ACT/ACT":
+        return (end - start).days / (period_end - period_start).days
+    raise ValueError(f"Unknown day-count convention '{convention}'. Choose from: {', '.join(DAY_COUNT_CONVENTIONS)}.")
+
+def _coupon_dates_backwards(issue, maturity, months):
+    """
+    Lazily walks the coupon dates back from maturity, always offset from maturity so month-end dates do
+    not drift, until the first date on or before issue. A maturity on the last day of a month pays on the
+    last day of every coupon month (end-of-month rule: 30 Jun pays 31 Dec, not 30 Dec).
+    """
+    end_of_month = maturity.day == calendar.monthrange(maturity.year, maturity.month)[1]
+    step = 0
+    while True:
+        day = _add_months(maturity, -months * step)
+        if end_of_month:
+            day = day.replace(day=calendar.monthrange(day.year, day.month)[1])
+        yield day
+        if day <= issue:
+            return
+        step += 1
+
+# Coupon Schedule Generator
+@functools.lru_cache(maxsize=4096)
+def coupon_schedule(issue, maturity, frequency=2, convention="30/360"):
+    """
+    Builds the coupon dates of a bond template. Schedules are generated on first use and cached by
+    (issue, maturity, frequency, convention), so bonds sharing a template share one date tuple.
+    :param frequency: Coupons per year (1, 2, 3, 4, 6 or 12).
+    :return: A CouponSchedule.
+    """
+    issue, maturity = _as_date(issue), _as_date(maturity)
+    if frequency not in (1, 2, 3, 4, 6, 12):
+        raise ValueError("Coupon frequency must be 1, 2, 3, 4, 6 or 12 payments per year.")
+    if convention not in DAY_COUNT_CONVENTIONS:
+        raise ValueError(f"Unknown day-count convention '{convention}'. Choose from: {', '.join(DAY_COUNT_CONVENTIONS)}.")
+    if maturity <= issue:
+        raise ValueError("Maturity must be after the issue date.")
+    dates = tuple(reversed(list(_coupon_dates_backwards(issue, maturity, 12 // frequency))))
+    return CouponSchedule(dates, frequency, convention)
+
+# Dated Bond Pricing (clean price, dirty price and accrued interest)
+def price_dated_bond(face_value, coupon_rate, yield_rate, settlement, maturity, issue=None, frequency=2,
+                     convention="30/360"):
+    """
+    Prices a bond between coupon dates using street convention, with rates as decimals:
+         Dirty = sum(CF_k / (1 + y / f)^(k + w)),  k = 0 .. coupons left - 1
+         Accrued = (C / f) * (fraction of the current period already elapsed)
+         Clean = Dirty - Accrued
+    where w is the fraction of the current coupon period still to run at settlement under the day-count
+    convention. A first period that starts before issue accrues, and pays its coupon, only from the issue
+    date on (a short first coupon).
+    :param issue: Issue date; by default the bond is treated as issued on the coupon date on or before
+    settlement, so the current period accrues in full.
+    :return: A DatedBondPrice.
+    """
+    settlement, maturity = _as_date(settlement), _as_date(maturity)
+    if issue is None:
+        if frequency not in (1, 2, 3, 4, 6, 12) or maturity <= settlement:
+            raise ValueError("Settlement must be before maturity and the frequency one of 1, 2, 3, 4, 6 or 12.")
+        *_, issue = _coupon_dates_backwards(settlement, maturity, 12 // frequency)
+    issue = _as_date(issue)
+    if not issue <= settlement < maturity:
+        raise ValueError("Settlement must be on or after issue and before maturity.")
+    schedule = coupon_schedule(issue, maturity, frequency, convention)
+    index = bisect.bisect_right(schedule.dates, settlement)
+    previous_coupon, next_coupon = schedule.dates[index - 1], schedule.dates[index]
+    coupon_payment = face_value * coupon_rate / frequency
+    remaining = _period_fraction(settlement, next_coupon, previous_coupon, next_coupon, convention, frequency)
+    elapsed = _period_fraction(max(previous_coupon, issue), settlement, previous_coupon, next_coupon, convention,
+                               frequency)
+    coupons_left = len(schedule.dates) - index
+
+    # Discount backwards from maturity, one period at a time
+    v = 1 / (1 + yield_rate / frequency)
+    dirty = coupon_payment + face_value
+    for _ in range(coupons_left - 1):
+        dirty = dirty * v + coupon_payment
+    if previous_coupon < issue:
+        # The first coupon is paid pro rata for the part of its period since issue, like its accrued interest
+        dirty -= coupon_payment * (1 - _period_fraction(issue, next_coupon, previous_coupon, next_coupon,
+                                                        convention, frequency))
+    dirty *= v ** remaining
+    accrued = coupon_payment * elapsed
+    return DatedBondPrice(dirty - accrued, dirty, accrued, next_coupon, coupons_left)
+
+# Clean and Dirty Bond Price Calculator
+def dated_bond_calculator():
+    try:
+        face_value = float(input("Enter the face value of the bond ($): "))
+        coupon_rate = float(input("Enter the coupon rate (as %): ")) / 100
+        yield_rate = float(input("Enter the yield/market interest rate (as %): ")) / 100
+        issue = input("Enter the issue date (YYYY-MM-DD): ").strip()
+        maturity = input("Enter the maturity date (YYYY-MM-DD): ").strip()
+        settlement = input("Enter the settlement date (YYYY-MM-DD): ").strip()
+        frequency = int(input("Enter the coupons per year (1, 2, 4 or 12): "))
+        convention = input("Day count, 30/360, ACT/365 or ACT/ACT (default 30/360): ").strip().upper() or "30/360"
+
+        result = price_dated_bond(face_value, coupon_rate, yield_rate, settlement, maturity, issue, frequency,
+                                  convention)
+        print(f"\nThe dirty price of the bond is: ${result.dirty:.2f}")
+        print(f"The accrued interest is: ${result.accrued:.2f}")
+        print(f"The clean price of the bond is: ${result.clean:.2f}")
+        print(f"Next coupon on {result.next_coupon.isoformat()}, {result.coupons_left} coupons left")
+    except ValueError as e:
+        print("Invalid input!", e)
+
+# --------------------- CORPORATE FINANCE & ACCOUNTING ---------------------
+
+# Result of an IRR solve
+class IRRResult(NamedTuple):
+    irr: float          # Root closest to zero, NaN when the cash flows have no IRR
+    roots: tuple        # Every real IRR found, in increasing order
+    iterations: int     # Newton and Brent steps summed over all roots
+    residual: float     # Largest absolute NPV left at any reported root
+    converged: bool
+    sign_changes: int   # Sign changes in the cash flows, an upper bound on the number of IRRs
+
+# Rates scanned for brackets when cash flows change sign more than once: -99% to 100% in 1% steps,
+# then up to 1000% in 10% steps
+_IRR_SCAN_GRID = tuple([-0.99 + 0.01 * i for i in range(200)] + [1.0 + 0.1 * i for i in range(1, 91)])
+
+def _npv_and_slope(cashflows, r):
+    """
+    Evaluates NPV(r) = sum(cf_t / (1 + r)^t) and its derivative with Horner's scheme in v = 1 / (1 + r),
+    so no power is recomputed per term.
+    :return: The NPV at rate r and the slope dNPV/dr.
+    """
+    v = 1 / (1 + r)
+    flows = reversed(cashflows)
+    p = next(flows)
+    dp = 0.0
+    for cf in flows:
+        dp = dp * v + p
+        p = p * v + cf
+    return p, -dp * v * v
+
+def _npv(cashflows, r):
+    """
+    NPV at rate r with Horner's scheme, without the derivative.
+    """
+    v = 1 / (1 + r)
+    flows = reversed(cashflows)
+    p = next(flows)
+    for cf in flows:
+        p = p * v + cf
+    return p
+
+def _count_sign_changes(cashflows):
+    """
+    Counts the sign changes in a cash-flow sequence, ignoring zeros (Descartes' rule of signs bounds the
+    number of IRRs by this count).
+    """
+    changes, previous = 0, 0.0
+    for cf in cashflows:
+        if cf:
+            if previous and (cf < 0) != (previous < 0):
+                changes += 1
+            previous = cf
+    return changes
+
+def _refine_root(cashflows, low, high, f_low, f_high, tolerance):
+    """
+    Newton steps from inside a sign-change bracket, shrinking the bracket as they go. As soon as a step
+    would leave the bracket, Brent's method finishes the job on what is left of it.
+    :return: The root, the number of iterations used and whether the tolerance was reached.
+    """
+    x = 0.1 if low < 0.1 < high else (low + high) / 2
+    iterations = 0
+    for _ in range(20):
+        value, slope = _npv_and_slope(cashflows, x)
+        iterations += 1
+        if value == 0:
+            return x, iterations, True
+        if (value < 0) == (f_low < 0):
+            low, f_low = x, value
+        else:
+            high, f_high = x, value
+        step = value / slope if slope else float("inf")
+        x_next = x - step
+        if not low < x_next < high:
+            break
+        if abs(step) <= tolerance * max(1.0, abs(x_next)):
+            return x_next, iterations, True
+        x = x_next
+    root, brent_iterations, converged = _brent(lambda r: _npv(cashflows, r), low, high, f_low, f_high,
+                                               tolerance)
+    return root, iterations + brent_iterations, converged
+
+# Internal Rate of Return (IRR) Solver
+def solve_irr(cashflows, tolerance=1e-10):
+    """
+    Finds the IRRs of one cash-flow vector (period 0 first) above -100%.
+    With a single sign change there is exactly one IRR, which is bracketed and refined directly. With
+    several sign changes the NPV is scanned from -99% to 1000% and every bracket found is refined, so all
+    real IRRs in that range are returned.
+    :return: An IRRResult.
+    """
+    cashflows = [float(cf) for cf in cashflows]
+    sign_changes = _count_sign_changes(cashflows)
+    # Zeros at either end do not move the roots, only the Horner work
+    last = len(cashflows)
+    while last and cashflows[last - 1] == 0:
+        last -= 1
+    first = next((t for t, cf in enumerate(cashflows) if cf), last)
+    flows = cashflows[first:last]
+    if sign_changes == 0:
+        return IRRResult(float("nan"), (), 0, float("nan"), False, 0)
+
+    brackets = []
+    if sign_changes == 1:
+        # NPV tends to the last flow as r -> -100% and to the first as r -> infinity
+        low, high = -0.9, 1.0
+        f_low, f_high = _npv(flows, low), _npv(flows, high)
+        while (f_low < 0) == (flows[0] < 0) and low > -1 + 1e-12:
+            low = -1 + (low + 1) / 16
+            f_low = _npv(flows, low)
+        while (f_high < 0) != (flows[0] < 0) and high < 1e6:
+            high *= 4
+            f_high = _npv(flows, high)
+        if (f_low < 0) != (f_high < 0):
+            brackets.append((low, high, f_low, f_high))
+    else:
+        previous_rate = previous_value = None
+        for rate in _IRR_SCAN_GRID:
+            value = _npv(flows, rate)
+            if value == 0:
+                brackets.append((rate, rate, 0.0, 0.0))
+            elif previous_value and (value < 0) != (previous_value < 0):
+                brackets.append((previous_rate, rate, previous_value, value))
+            previous_rate, previous_value = rate, value
+
+    roots, iterations, converged = [], 0, True
+    for low, high, f_low, f_high in brackets:
+        if f_low == 0:
+            roots.append(low)
+            continue
+        root, used, ok = _refine_root(flows, low, high, f_low, f_high, tolerance)
+        roots.append(root)
+        iterations += used
+        converged = converged and ok
+    if not roots:
+        return IRRResult(float("nan"), (), iterations, float("nan"), False, sign_changes)
+    residual = max(abs(_npv(cashflows, root)) for root in roots)
+    return IRRResult(min(roots, key=abs), tuple(roots), iterations, residual, converged, sign_changes)
+
+def solve_irr_batch(cashflow_rows, padding=None):
+    """
+    Solves the IRR of many projects at once.
+    :param cashflow_rows: A ragged list of cash-flow sequences, or a padded matrix whose rows are filled
+    at the end with the padding value, None or NaN.
+    :param padding: Trailing value to ignore on every row besides None and NaN, for padded matrices.
+    :return: A list of IRRResult, one per row and in input order.
+    """
+    return [solve_irr(itertools.islice(row, _unpadded_length(row, padding))) for row in cashflow_rows]
+
+def _unpadded_length(row, padding):
+    """
+    The length of a padded row once its trailing padding is dropped. Padding is any trailing None or NaN,
+    plus the padding value itself when it is not None (so padding=0 also drops trailing zeros).
+    :return: The number of leading entries to keep; len(row) when the row has no padding.
+    """
+    length = len(row)
+    while length:
+        value = row[length - 1]
+        if not (value is None or value != value or padding is not None and value == padding):
+            break
+        length -= 1
+    return length
+
+# Internal Rate of Return (IRR) Calculator
+def irr_calculation():
+    try:
+        cash_flow_str = input("Enter cash flows separated by commas (e.g., -1000, 300, 400, 500): ")
+        cashflows = [float(cf.strip()) for cf in cash_flow_str.split(",")]
+        result = RESULT_CACHE.call(solve_irr, cashflows)
+
+        if result.sign_changes == 0:
+            print("IRR not found: the cash flows never change sign. Please check your cash flows.")
+        elif not result.roots:
+            print("IRR not found between -99% and 1000%. Please check your cash flows.")
+        elif len(result.roots) == 1:
+            print(f"\nThe IRR is approximately: {result.irr * 100:.2f}%")
+        else:
+            irrs = ", ".join(f"{root * 100:.2f}%" for root in result.roots)
+            print(f"\nThe cash flows change sign {result.sign_changes} times and have several IRRs: {irrs}")
+    except Exception as e:
+        print("Error:", e)
+
+# Payback Period
+def compute_payback_period(cashflows, discount_rate=None):
+    """
+    Calculate the payback period of a cash-flow sequence, where period 0 is the initial investment.
+    The period in which the cumulative sum turns non-negative is interpolated linearly. With a discount
+    rate (decimal) the discounted payback period is returned instead, using cf_t / (1 + r)^t.
+    :return: The payback period in periods, NaN when the investment is never recovered.
+    """
+    if discount_rate is not None:
+        cashflows = list(map(operator.mul, cashflows, _discount_table(discount_rate, len(cashflows))))
+    cumulative = 0
+    for i, cf in enumerate(cashflows):
+        previous_cum = cumulative
+        cumulative += cf
+        if cumulative >= 0:
+            # Fraction of period required
+            if cf != 0:
+                fraction = abs(previous_cum) / cf
+            else:
+                fraction = 0
+            return i + fraction  # i is zero-indexed (period 0 is initial investment)
+    return float("nan")
+
+def _discount_table(rate, periods):
+    """
+    :return: The discount factors 1 / (1 + rate)^t for t = 0 .. periods - 1, by repeated multiplication.
+    """
+    v = 1 / (1 + rate)
+    factors = array("d", [1.0]) * periods
+    for t in range(1, periods):
+        factors[t] = factors[t - 1] * v
+    return factors
+
+# Batch Payback Period Calculator
+def payback_periods(cashflow_rows, discount_rate=None, padding=None):
+    """
+    Simple or discounted payback for a whole matrix of projects at once.
+    Rows may be ragged, or padded at the end with the padding value, None or NaN, which is masked out
+    (see _unpadded_length); rows without padding are used as they are, without a copy.
+    The discount factors are computed once per period and shared by every project, and each project stops
+    at the first period whose cumulative (discounted) sum is non-negative.
+    :param discount_rate: Decimal rate for discounted payback, None for simple payback.
+    :return: An array('d') of payback periods in input order, NaN for projects that never recover.
+    """
+    rows = []
+    for row in cashflow_rows:
+        length = _unpadded_length(row, padding)
+        rows.append(row if length == len(row) else row[:length])
+    if discount_rate is not None:
+        factors = _discount_table(discount_rate, max(map(len, rows), default=0))
+        rows = [list(map(operator.mul, row, factors)) for row in rows]
+    return array("d", map(compute_payback_period, rows))
+
+# Payback Period Calculator
+def payback_period():
+    try:
+        cash_flow_str = input("Enter cash flows separated by commas (start with the initial investment as a negative number, e.g., -1000, 300, 400, 500): ")
+        cashflows = [float(cf.strip()) for cf in cash_flow_str.split(",")]
+        payback = RESULT_CACHE.call(compute_payback_period, cashflows)
+        if math.isnan(payback):
+            print("\nThe investment is not recovered within the given periods.")
+        else:
+            print(f"\nThe payback period is approximately: {payback:.2f} periods")
+    except Exception as e:
+        print("Error:", e)
+
+# Incremental Cash-Flow Ledger (NPV, IRR and payback as cash flows arrive)
+class CashFlowLedger:
+    """
+    A cash-flow series that is updated one period at a time while NPV, IRR and payback stay cheap to query.
+    - Payback uses a segment tree holding each node's sum and best prefix sum, so appends and point edits are
+      O(log n) and the first period where the cumulative sum turns non-negative is found in O(log n).
+    - NPV at every tracked rate keeps its discount powers and running total, so appends and edits adjust it
+      in O(1) and reading it is O(1).
+    - IRR warm-starts Newton's method from the previous root, which usually settles in one or two steps.
+    """
+    __slots__ = ("_flows", "_capacity", "_sum", "_best", "_rates", "_last_irr")
+
+    def __init__(self, cashflows=()):
+        self._flows = array("d")
+        self._capacity = 1
+        self._sum = [0.0, 0.0]
+        self._best = [-math.inf, -math.inf]
+        self._rates = {}
+        self._last_irr = None
+        for cf in cashflows:
+            self.append(cf)
+
+    def __len__(self):
+        return len(self._flows)
+
+    def __getitem__(self, period):
+        return self._flows[period]
+
+    def _rebuild(self):
+        capacity = self._capacity
+        self._sum = [0.0] * (2 * capacity)
+        self._best = [-math.inf] * (2 * capacity)
+        for period, cf in enumerate(self._flows):
+            self._sum[capacity + period] = self._best[capacity + period] = cf
+        for node in range(capacity - 1, 0, -1):
+            self._combine(node)
+
+    def _combine(self, node):
+        left, right = 2 * node, 2 * node + 1
+        self._sum[node] = self._sum[left] + self._sum[right]
+        self._best[node] = max(self._best[left], self._sum[left] + self._best[right])
+
+    def _set_leaf(self, period, cf):
+        node = self._capacity + period
+        self._sum[node] = self._best[node] = cf
+        node //= 2
+        while node:
+            self._combine(node)
+            node //= 2
+
+    def append(self, cf):
+        """
+        Adds the cash flow of the next period.
+        """
+        cf = float(cf)
+        period = len(self._flows)
+        self._flows.append(cf)
+        if period == self._capacity:
+            self._capacity *= 2
+            self._rebuild()
+        else:
+            self._set_leaf(period, cf)
+        for tracked in self._rates.values():
+            power = tracked[1][-1] * tracked[0] if tracked[1] else 1.0
+            tracked[1].append(power)
+            tracked[2] += cf * power
+
+    def edit(self, period, cf):
+        """
+        Replaces the cash flow of an existing period; negative periods count back from the last, as in a list.
+        :raises IndexError: When the period does not exist.
+        """
+        cf = float(cf)
+        if period < 0:
+            period += len(self._flows)
+            if period < 0:
+                raise IndexError("Cash flow period out of range.")
+        delta = cf - self._flows[period]
+        self._flows[period] = cf
+        self._set_leaf(period, cf)
+        for tracked in self._rates.values():
+            tracked[2] += delta * tracked[1][period]
+
+    def track_rate(self, rate):
+        """
+        Starts keeping NPV at rate up to date on every append and edit (one O(n) pass to start).
+        """
+        if rate not in self._rates:
+            v = 1 / (1 + rate)
+            powers = array("d")
+            power, total = 1.0, 0.0
+            for cf in self._flows:
+                powers.append(power)
+                total += cf * power
+                power *= v
+            self._rates[rate] = [v, powers, total]
+
+    def npv(self, rate):
+        """
+        :return: The NPV at rate; O(1) for tracked rates, one Horner pass otherwise.
+        """
+        tracked = self._rates.get(rate)
+        if tracked is not None:
+            return tracked[2]
+        return _npv(self._flows, rate) if self._flows else 0.0
+
+    def cumulative(self, periods):
+        """
+        :return: The sum of the first periods cash flows, in O(log n).
+        """
+        total, low, high = 0.0, self._capacity, self._capacity + periods
+        while low < high:
+            if low & 1:
+                total += self._sum[low]
+                low += 1
+            if high & 1:
+                high -= 1
+                total += self._sum[high]
+            low //= 2
+            high //= 2
+        return total
+
+    def payback_period(self):
+        """
+        :return: The payback period, same definition as compute_payback_period, NaN when not yet recovered.
+        """
+        if not self._flows or self._best[1] < 0:
+            return float("nan")
+        node, before = 1, 0.0
+        while node < self._capacity:
+            left = 2 * node
+            if before + self._best[left] >= 0:
+                node = left
+            else:
+                before += self._sum[left]
+                node = left + 1
+        period = node - self._capacity
+        cf = self._flows[period]
+        return period + (abs(before) / cf if cf != 0 else 0)
+
+    def irr(self, tolerance=1e-10):
+        """
+        :return: The IRR, warm-started from the previous root, or NaN when there is none. When Newton's
+        method does not settle from the previous root, a full solve_irr picks the root closest to zero.
+        """
+        if self._last_irr is not None:
+            r = self._last_irr
+            for _ in range(8):
+                value, slope = _npv_and_slope(self._flows, r)
+                if not slope:
+                    break
+                step = value / slope
+                r -= step
+                if not math.isfinite(r) or r <= -1:
+                    break
+                if abs(step) <= tolerance * max(1.0, abs(r)):
+                    self._last_irr = r
+                    return r
+        result = solve_irr(self._flows, tolerance)
+        self._last_irr = result.irr if result.roots else None
+        return result.irr
+
+# Recovery Value
+def compute_recovery_value(salvage_value, selling_cost, tax_rate):
+    """
+    Calculate the net recovery value of an asset. Rates are decimals (0.05 for 5%):
+         Net Value = salvage_value * (1 - selling_cost) * (1 - tax_rate)
+    """
+    return salvage_value * (1 - selling_cost) * (1 - tax_rate)
+
+# Totals of net recovery value for one group of assets
+class RecoveryAggregate(NamedTuple):
+    assets: int
+    salvage_value: float
+    selling_costs: float
+    taxes: float
+    net_recovery_value: float
+
+def _mapped_lines(path):
+    """
+    Streams the decoded lines of a file through a read-only memory map, so the file is paged in by the OS
+    instead of being read into Python objects all at once.
+    """
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for line in iter(mapped.readline, b""):
+                yield line.decode("utf-8-sig")
+
+# Columnar Asset Register
+class AssetRegister:
+    """
+    An asset register held as columns: salvage values, selling costs and tax rates as array('d'), and the
+    jurisdiction and grouping fields dictionary-encoded as integer codes. Rates are decimals; a missing
+    per-row rate is stored as NaN and looked up by jurisdiction when values are computed.
+    """
+    __slots__ = ("salvage_values", "selling_costs", "tax_rates", "jurisdiction_codes", "group_codes",
+                 "jurisdictions", "groups")
+
+    def __init__(self):
+        self.salvage_values = array("d")
+        self.selling_costs = array("d")
+        self.tax_rates = array("d")
+        self.jurisdiction_codes = array("l")
+        self.group_codes = array("l")
+        self.jurisdictions = []
+        self.groups = []
+
+    def __len__(self):
+        return len(self.salvage_values)
+
+    @classmethod
+    def from_csv(cls, path, group_by="jurisdiction", chunk_size=10_000):
+        """
+        Loads a register from CSV with the columns salvage_value, jurisdiction and optionally selling_cost,
+        tax_rate and the group_by column. The file is memory-mapped and parsed chunk_size rows at a time
+        straight into the columns, so no row is ever kept as a dict. Blank lines are skipped.
+        :raises ValueError: When a required column is missing or a row is too short to hold every column.
+        """
+        register = cls()
+        jurisdiction_index, group_index = {}, {}
+        reader = csv.reader(_mapped_lines(path))
+        header = next(reader, None)
+        if header is None:
+            return register
+        positions = {name: header.index(name) if name in header else None
+                     for name in ("salvage_value", "selling_cost", "tax_rate", "jurisdiction", group_by)}
+        if positions["salvage_value"] is None or positions["jurisdiction"] is None:
+            raise ValueError("The register needs salvage_value and jurisdiction columns.")
+        if positions[group_by] is None:
+            raise ValueError(f"The register has no '{group_by}' column to group by.")
+
+        def column(row, name, default):
+            position = positions[name]
+            return float(row[position]) if position is not None and row[position] != "" else default
+
+        width = max(position for position in positions.values() if position is not None) + 1
+
+        def rows():
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) < width:
+                    raise ValueError(f"Line {reader.line_num} of the register has {len(row)} fields, "
+                                     f"expected {len(header)}.")
+                yield row
+
+        for chunk in _chunked(rows(), chunk_size):
+            register.salvage_values.extend(float(row[positions["salvage_value"]]) for row in chunk)
+            register.selling_costs.extend(column(row, "selling_cost", 0.0) for row in chunk)
+            register.tax_rates.extend(column(row, "tax_rate", math.nan) for row in chunk)
+            for index, names, codes, name in ((jurisdiction_index, register.jurisdictions,
+                                               register.jurisdiction_codes, "jurisdiction"),
+                                              (group_index, register.groups, register.group_codes, group_by)):
+                for row in chunk:
+                    value = row[positions[name]]
+                    code = index.get(value)
+                    if code is None:
+                        code = index[value] = len(names)
+                        names.append(value)
+                    codes.append(code)
+        return register
+
+    def _rate_column(self, tax_rates):
+        """
+        Per-row tax rates, falling back to the jurisdiction table wherever the row has none.
+        """
+        table = [tax_rates.get(name, math.nan) if tax_rates else math.nan for name in self.jurisdictions]
+        rates = array("d", self.tax_rates)
+        for row, (rate, code) in enumerate(zip(self.tax_rates, self.jurisdiction_codes)):
+            if rate != rate:
+                rates[row] = table[code]
+                if table[code] != table[code]:
+                    raise ValueError(f"No tax rate for row {row + 1} (jurisdiction '{self.jurisdictions[code]}').")
+        return rates
+
+    def net_recovery_values(self, tax_rates=None):
+        """
+        Applies salvage * (1 - selling_cost) * (1 - tax) to every asset in one pass.
+        :param tax_rates: Jurisdiction -> decimal tax rate, used where a row has no tax_rate of its own.
+        :return: An array('d') of net recovery values in register order.
+        """
+        return array("d", map(compute_recovery_value, self.salvage_values, self.selling_costs,
+                              self._rate_column(tax_rates)))
+
+    def aggregate(self, tax_rates=None, by="group"):
+        """
+        Totals salvage value, selling costs, taxes and net recovery value per group in a single pass.
+        :param by: "group" for the column chosen at load time, or "jurisdiction".
+        :return: A dict of group name -> RecoveryAggregate.
+        """
+        if by not in ("group", "jurisdiction"):
+            raise ValueError(f"Cannot aggregate by '{by}', expected 'group' or 'jurisdiction'.")
+        names, codes = (self.groups, self.group_codes) if by == "group" else (self.jurisdictions, self.jurisdiction_codes)
+        count = [0] * len(names)
+        salvage = [0.0] * len(names)
+        costs = [0.0] * len(names)
+        taxes = [0.0] * len(names)
+        for code, value, selling_cost, rate in zip(codes, self.salvage_values, self.selling_costs,
+                                                   self._rate_column(tax_rates)):
+            after_costs = value * (1 - selling_cost)
+            count[code] += 1
+            salvage[code] += value
+            costs[code] += value - after_costs
+            taxes[code] += after_costs * rate
+        return {name: RecoveryAggregate(count[i], salvage[i], costs[i], taxes[i], salvage[i] - costs[i] - taxes[i])
+                for i, name in enumerate(names)}
+
+# Recovery Value Calculator
+def recovery_value():
+    try:
+        salvage_value = float(input("Enter the estimated salvage value ($): "))
+        selling_cost = float(input("Enter the selling cost percentage (as %): "))
+        tax_rate = float(input("Enter the tax rate on capital gains (as %): "))
+        net_value = RESULT_CACHE.call(compute_recovery_value, salvage_value, selling_cost / 100, tax_rate / 100)
+        print(f"\nThe net recovery value is: ${net_value:.2f}")
+    except Exception as e:
+        print("Error:", e)
+
+# --------------------- GAMES ---------------------
+
+# ---- Game data store ----
+# The boards, lists, rosters and lineups of the games live in game_data.tsv next to this file (or the file named by
+# BIEBIR_GAME_DATA), one record per line as: game <tab> key <tab> JSON data.
+GAME_DATA_ENV = "BIEBIR_GAME_DATA"
+
+class GameDataStore:
+    """
+    Lazily loaded game data. The first request scans the file once for the byte range of every record, without
+    decoding any JSON, and each load then reads and decodes just the one record asked for, so a game only pays
+    for the board or lineup it plays however large the file grows.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._offsets = None     # game -> {key: (start, end)}, in file order
+
+    def _index(self):
+        if self._offsets is None:
+            offsets = {}
+            with open(self.path, "rb") as handle:
+                handle.readline()
+                start = handle.tell()
+                for line in handle:
+                    game, key, _ = line.split(b"\t", 2)
+                    offsets.setdefault(game.decode("utf-8"), {})[key.decode("utf-8")] = (start, start + len(line))
+                    start += len(line)
+            self._offsets = offsets
+        return self._offsets
+
+    def keys(self, game):
+        """
+        :return: The keys stored for a game (board numbers, categories or team names), in file order.
+        """
+        return list(self._index().get(game, ()))
+
+    def load(self, game, key):
+        """
+        Reads and decodes a single record.
+        :raises KeyError: When the game has no record under that key.
+        """
+        start, end = self._index()[game][key]
+        with open(self.path, "rb") as handle:
+            handle.seek(start)
+            record = handle.read(end - start)
+        return json.loads(record.split(b"\t", 2)[2])
+
+# The store every game reads from
+GAME_DATA = GameDataStore(os.environ.get(GAME_DATA_ENV) or
+                          os.path.join(os.path.dirname(os.path.abspath(__file__)), "game_data.tsv"))
+
+def load_tictactoe_config(number):
+    """
+    :return: The row labels, column labels and player to cell dictionary of tic-tac-toe board number.
+    """
+    config = GAME_DATA.load("tictactoe", number)
+    return config["row_labels"], config["col_labels"], config["player_to_cell"]
+
+# ---- Player name index ----
+_NAME_PUNCTUATION = re.compile(r"[\s'’.\-]+")
+
+def fold_name(name):
+    """
+    Folds a player name for matching: accents removed, case folded and punctuation turned into single spaces,
+    so "Luka Modrić", "luka modric" and "LUKA  MODRIC" all fold to "luka modric".
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NAME_PUNCTUATION.sub(" ", stripped.casefold()).strip()
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _edit_distance(a, b, limit):
+    """
+    Levenshtein distance between a and b, or limit + 1 as soon as it is known to exceed limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+# A name found by PlayerNameIndex.lookup, with the edit distance of the match (0 for an exact match)
+class NameMatch(NamedTuple):
+    name: str
+    value: object
+    distance: int
+
+class PlayerNameIndex:
+    """
+    Inverted index over player names used by every game. Each name is stored folded (see fold_name) together
+    with its surname forms ("Virgil van Dijk" also answers to "van dijk" and "dijk"), and every stored key is
+    listed under its character trigrams so that a mistyped name only has to be compared with the keys that
+    share most of its trigrams instead of with the whole list.
+    """
+
+    def __init__(self, entries):
+        """
+        :param entries: (name, value) pairs, e.g. player_to_cell.items(); the value is returned with each match.
+        """
+        self.names, self.values = [], []
+        self._keys = {}          # folded key -> (rank, entry ids); rank 0 for full names, 1 for surname forms
+        self._key_list = []
+        self._postings = {}      # (trigram, key length) -> key ids
+        for name, value in entries:
+            self.add(name, value)
+
+    def add(self, name, value):
+        """
+        Indexes one more name, with its surname forms and trigrams, without touching the existing entries.
+        """
+        entry = len(self.names)
+        self.names.append(name)
+        self.values.append(value)
+        tokens = fold_name(name).split()
+        for rank, key in enumerate([" ".join(tokens)] + [" ".join(tokens[i:]) for i in range(1, len(tokens))]):
+            self._add_key(key, min(rank, 1), entry)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _add_key(self, key, rank, entry):
+        current = self._keys.get(key)
+        if current is None:
+            self._keys[key] = (rank, [entry])
+            for gram in _trigrams(key):
+                self._postings.setdefault((gram, len(key)), []).append(len(self._key_list))
+            self._key_list.append(key)
+        elif rank < current[0]:
+            self._keys[key] = (rank, [entry])
+        elif rank == current[0]:
+            current[1].append(entry)
+
+    def _matches(self, key, distance):
+        return [NameMatch(self.names[entry], self.values[entry], distance) for entry in self._keys[key][1]]
+
+    def lookup(self, query, max_distance=None):
+        """
+        Finds the players a typed name refers to: the exact folded name or surname when there is one, otherwise
+        the stored names within max_distance edits of it (1 for short queries, 2 from six letters up).
+        :return: The closest NameMatch list, empty when nothing is close enough.
+        """
+        key = fold_name(query)
+        if key in self._keys:
+            return self._matches(key, 0)
+        if max_distance is None:
+            max_distance = 1 if len(key) < 6 else 2
+        # Every edit changes at most three trigrams and the length by one, so a key within max_distance edits has
+        # a length within max_distance of the query's, shares all but 3 * max_distance of its trigrams and so
+        # appears in the postings of at least one of its 3 * max_distance + 1 rarest trigrams
+        grams = _trigrams(key)
+        lengths = range(len(key) - max_distance, len(key) + max_distance + 1)
+        postings = {gram: [self._postings.get((gram, length), ()) for length in lengths] for gram in grams}
+        rarest = sorted(grams, key=lambda gram: sum(map(len, postings[gram])))[:3 * max_distance + 1]
+        candidates = set()
+        for gram in rarest:
+            for key_ids in postings[gram]:
+                candidates.update(key_ids)
+        needed = len(grams) - 3 * max_distance
+        best, found = max_distance, []
+        for key_id in candidates:
+            candidate = self._key_list[key_id]
+            if abs(len(candidate) - len(key)) > best or len(grams & _trigrams(candidate)) < needed:
+                continue
+            distance = _edit_distance(key, candidate, best)
+            if distance > best:
+                continue
+            if distance < best:
+                best, found = distance, [candidate]
+            elif distance == best:
+                found.append(candidate)
+        return [match for candidate in found for match in self._matches(candidate, best)]
+
+# Indexes built so far, one per game dataset (a tic-tac-toe board, a Tenaball list, a lineup, ...)
+_NAME_INDEXES = {}
+
+def name_index(dataset, entries):
+    """
+    The PlayerNameIndex of a dataset, built from entries the first time the dataset is asked for and reused
+    afterwards.
+    :param dataset: A hashable name for the dataset, e.g. ("tictactoe", "1").
+    :param entries: (name, value) pairs, or a function returning them, only used when the index is built.
+    """
+    index = _NAME_INDEXES.get(dataset)
+    if index is None:
+        index = _NAME_INDEXES[dataset] = PlayerNameIndex(entries() if callable(entries) else entries)
+    return index
+
+# ---- Bitboard tic-tac-toe ----
+# Each team's marks are a 9-bit integer where cell n (1 to 9, row by row) is bit n - 1, so a move is one
+# OR and a win check is one table lookup.
+FULL_BOARD = 0b111111111
+WIN_MASKS = (0b000000111, 0b000111000, 0b111000000,   # rows
+             0b001001001, 0b010010010, 0b100100100,   # columns
+             0b100010001, 0b001010100)                # diagonals
+# _WINNING_BOARDS[board] is 1 when board holds three in a line, for all 512 boards
+_WINNING_BOARDS = bytes(any(board & mask == mask for mask in WIN_MASKS) for board in range(FULL_BOARD + 1))
+
+def cell_bit(cell):
+    """
+    :param cell: A cell number from 1 to 9.
+    :return: The bit of that cell on a board.
+    """
+    return 1 << (cell - 1)
+
+def has_won(board):
+    """
+    :param board: One team's 9-bit board.
+    :return: True when the board holds one of the WIN_MASKS lines.
+    """
+    return _WINNING_BOARDS[board] == 1
+
+def free_cells(home_board, away_board):
+    """
+    :return: The cell numbers (1 to 9) that neither team has taken yet, in order.
+    """
+    taken = home_board | away_board
+    return [cell for cell in range(1, 10) if not taken >> (cell - 1) & 1]
+
+def random_self_play(games, seed=0):
+    """
+    Plays games of random moves on bitboards.
+    :return: A (home wins, away wins, ties) tuple.
+    """
+    rng = random.Random(seed)
+    results = [0, 0, 0]
+    for _ in range(games):
+        boards = [0, 0]
+        cells = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+        rng.shuffle(cells)
+        for turn, cell in enumerate(cells):
+            boards[turn & 1] |= 1 << (cell - 1)
+            if _WINNING_BOARDS[boards[turn & 1]]:
+                results[turn & 1] += 1
+                break
+        else:
+            results[2] += 1
+    return tuple(results)
+
+# The eight symmetries of the board as cell permutations (rotations and reflections, 0-based cells)
+_BOARD_SYMMETRIES = ((0, 1, 2, 3, 4, 5, 6, 7, 8), (6, 3, 0, 7, 4, 1, 8, 5, 2), (8, 7, 6, 5, 4, 3, 2, 1, 0),
+                     (2, 5, 8, 1, 4, 7, 0, 3, 6), (2, 1, 0, 5, 4, 3, 8, 7, 6), (6, 7, 8, 3, 4, 5, 0, 1, 2),
+                     (0, 3, 6, 1, 4, 7, 2, 5, 8), (8, 5, 2, 7, 4, 1, 6, 3, 0))
+# _SYMMETRY_TABLES[k][board] is board with every cell moved by the k-th symmetry
+_SYMMETRY_TABLES = tuple(tuple(sum(1 << target for target, source in enumerate(permutation) if board >> source & 1)
+                               for board in range(FULL_BOARD + 1))
+                         for permutation in _BOARD_SYMMETRIES)
+
+# Move chosen by the tic-tac-toe AI and what it cost
+class MoveStats(NamedTuple):
+    cell: int
+    score: int
+    nodes: int
+    seconds: float
+    table_size: int
+
+class TicTacToeAI:
+    """
+    Perfect tic-tac-toe play by negamax with alpha-beta pruning. Positions are stored in a transposition
+    table under the smallest of their eight symmetric forms, so rotated and mirrored boards share one entry
+    and, once every position has been reached, no move needs a fresh search. Scores are from the side to
+    move: a win is worth 1 plus the empty cells left (faster wins score higher), a tie 0.
+    """
+    _EXACT, _LOWER, _UPPER = 0, 1, 2
+
+    def __init__(self, table=None):
+        self.table = {} if table is None else table
+        self.nodes = 0
+
+    @staticmethod
+    def canonical(mover_board, other_board):
+        return min((symmetry[mover_board] << 9) | symmetry[other_board] for symmetry in _SYMMETRY_TABLES)
+
+    def negamax(self, mover_board, other_board, alpha=-10, beta=10):
+        """
+        Score of the position for the side to move, searched with alpha-beta over the transposition table.
+        """
+        self.nodes += 1
+        if _WINNING_BOARDS[other_board]:
+            return -(10 - bin(mover_board | other_board).count("1"))
+        taken = mover_board | other_board
+        if taken == FULL_BOARD:
+            return 0
+        key = self.canonical(mover_board, other_board)
+        entry = self.table.get(key)
+        if entry is not None:
+            value, bound = entry
+            if bound == self._EXACT or (bound == self._LOWER and value >= beta) or (bound == self._UPPER and value <= alpha):
+                return value
+        original_alpha, best = alpha, -10
+        for cell in range(9):
+            bit = 1 << cell
+            if taken & bit:
+                continue
+            value = -self.negamax(other_board, mover_board | bit, -beta, -alpha)
+            if value > best:
+                best = value
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    break
+        bound = self._UPPER if best <= original_alpha else self._LOWER if best >= beta else self._EXACT
+        self.table[key] = (best, bound)
+        return best
+
+    def best_move(self, mover_board, other_board):
+        """
+        Picks the move with the best score for the side to move, preferring the lowest cell number on ties.
+        :return: A MoveStats with the chosen cell (1 to 9), its score, the nodes searched and the time taken.
+        """
+        start, nodes = time.perf_counter(), self.nodes
+        best_cell, best = None, -11
+        for cell in free_cells(mover_board, other_board):
+            value = -self.negamax(other_board, mover_board | cell_bit(cell), -10, -best)
+            if value > best:
+                best_cell, best = cell, value
+        return MoveStats(best_cell, best, self.nodes - nodes, time.perf_counter() - start, len(self.table))
+
+    def save(self, path):
+        with open(path, "w") as handle:
+            json.dump({str(key): value for key, value in self.table.items()}, handle)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as handle:
+            return cls({int(key): tuple(value) for key, value in json.load(handle).items()})
+
+    @classmethod
+    def precomputed(cls, path=None):
+        """
+        An AI whose table already covers the whole game: loaded from path when that file exists, otherwise
+        built by searching every reachable position once (and saved to path, when one is given).
+        """
+        if path is not None and os.path.exists(path):
+            return cls.load(path)
+        ai = cls()
+        seen = set()
+        pending = [(0, 0)]
+        while pending:
+            mover_board, other_board = pending.pop()
+            key = cls.canonical(mover_board, other_board)
+            if key in seen or _WINNING_BOARDS[other_board] or mover_board | other_board == FULL_BOARD:
+                continue
+            seen.add(key)
+            ai.best_move(mover_board, other_board)
+            pending.extend((other_board, mover_board | cell_bit(cell)) for cell in free_cells(mover_board, other_board))
+        if path is not None:
+            ai.save(path)
+        return ai
+
+# The AI shared by every single-player game, built on first use
+@functools.lru_cache(maxsize=None)
+def tictactoe_ai():
+    return TicTacToeAI.precomputed()
+
+def Footy_tictactoe():
+    print("Welcome to the Tic Tac Toe game"
+          """
+             This function will play a game of Tic-Tac-Toe based on football. The idea of the game is the same as a normal
+             Tic-Tac-Toe, but with a catch, for each cell, there are conditions that have to be satisfied with a football player.
+             For further simplicity of the game, four categories have been added that can be used in the grid, they are the
+             following: Country, Club, League, Ballon D'or Winner and Champions League winner. There are four sets to play the game,
+             increasing in difficulty. From set one to four, the logic and programming behind the game is the same as used in
+             the preliminary versions, just adding the use of dictionaries to assign players to their respective cells, through
+             using the numbers. The maximum pool of players for each condition is 6, the most famous players will be included or
+             the most influential for that specific category, the input might not be always wrong, just not included within the conditions,
+             try and think about the basic answers, the most influential ones (e.g. for Liverpool and Spain Xabi Alonso, not Iago Aspas).
+             Finally, names can be introduced as "Firstname Lastname" or just "Lastname", accents and capital letters do not matter
+             (García and garcia are both valid) and small typos are forgiven as long as only one player is that close.
+             :return: The Footy Tic-Tac-Toe game. (Football inspired version of a Tic-Tac-Toe game)
+             """)
+    # DIFFERENT CONFIGURATIONS FOR THE TIC TAC TOE GAME
+
+    def config_game1():
+        """
+        First configuration for the game, only including the conditions for countries and clubs. Maximum of 6 players
+        are valid for each category, the most famous ones will be included, categories are ideated for having no more than
+        5 options generally. It is important to note that the player will be included for the team he was most influential
+        for in case of being available for multiple options, Nazario and Figo are considered Real Madrid players, not
+        Barcelona players for this game and configurations.
+        :return: The game board configuration with its labels and the players that can be assigned to each cell, read from
+        the game data store.
+        """
+        # Configuration for Game 1
+        return load_tictactoe_config("1")
+
+    def config_game2():
+        """
+        Second configuration of the game now introducing the new conditions Ballon D'or Winner and Champions League winner,
+        players that have done both are only counted for one category, in this case Zinedine Zidane is considered for Ballon D'or Winner
+        as he has more than Benzema, as he is now considered as UCL winner for this game, the player will not lose the turn when introducing
+        an invalid input.
+        :return: The game board configuration and game configuration according to these conditions, read from the game data store.
+        """
+        # Configuration for Game 2
+        return load_tictactoe_config("2")
+
+    def config_game3():
+        """
+        Third configuration of the game, first mixing all the conditions freely, players that have done both are only counted for one category,
+        In the case of Cristiano Ronaldo he is counted for the Ballon D'or only, not for Manchester UDT and Portugal.
+        :return: The third variety of the game board with its respective inputs.
+        """
+        # Configuration for Game 3
+        return load_tictactoe_config("3")
+
+    def config_game4():
+        """
+        Fourth configuration for the game, the difficulty lies on the scarcity of possible answers for each condition
+        but either way the players available for those slots are well and widely known, for the Spanish row, I have decided
+        to go for a mix between influence and the best players and most influential for those teams overall
+        :return: The fourth variety of the game board with its respective inputs.
+        """
+        # Configuration for Game 4
+        return load_tictactoe_config("4")
+
+    def play_game(Team_1, Team_2, row_labels, col_labels, player_to_cell, computer=None, names=None):
+        """
+        Allows for the game to actually be played. It sets up the game board and the values inside each cell, that
+        will later be changed with another function.
+        :param Team_1: Home team, the team that will be assigned the symbol "X" on the board.
+        :param Team_2: Away team, the team that will be assigned the symbol "O" on the board.
+        :param row_labels: According to the different configurations of the game, the labels with the row conditions for the game
+        :param col_labels: According to the different configurations of the game, the labels with the column conditions for the game
+        :param player_to_cell: The dictionary that allows for that specific configuration to be used and have the players assigned
+        to a certain cell on the board, allowing for the game to be played
+        :param computer: A TicTacToeAI that plays as Team_2 in single-player mode, None when two people play.
+        :param names: The PlayerNameIndex of player_to_cell, built here when it is not given.
+        :return: The logic of the game board and the possible inputs for each category and respective cell.
+        """
+        if names is None:
+            names = PlayerNameIndex(player_to_cell.items())
+        # Basic game setup, one bitboard per symbol
+        gameBoard = {"X": 0, "O": 0}
+        rows = 3
+        columns = 3
+        home_team = "X"
+        away_team = "O"
+        endloop = False
+        Count_Turns = 0
+
+        # PRINT THE GAME BOARD
+        def printboard():
+            """
+            Function that prints the game board, allowing for the visual representation of every step of the game, it
+            prints the board after every turn with its updated version. The labels are also printed for every cell and category
+            :return: Prints the game board with its respective labels and cells at any given moment during the game, the current
+            state of the game board at that moment during the game .
+            """
+            print(" " * 20, end="")
+            for header in col_labels:
+                print(f"{header:^15}", end=" ")
+            print("\n" + "-" * 70)
+            for i in range(rows):
+                print(f"{row_labels[i]:<15}", end="|")
+                for j in range(columns):
+                    cell = i * columns + j + 1
+                    mark = next((symbol for symbol, board in gameBoard.items() if board & cell_bit(cell)), cell)
+                    print(f"{str(mark):^15}", end="|")
+                print("\n" + "-" * 70)
+
+        # CREATE A FUNCTION THAT MODIFIES THE CURRENT STATE OF THE GAME BOARD
+        def modgameboard(num, symbol):
+            """
+            Allows for the game board to be modified after each input, marking the cell on the bitboard of the symbol
+            that made the move and introduced a valid input for one of the categories.
+            :param num: Number of the cell (from 1 to 9) that will be modified according to the player to cell dictionary.
+            :param symbol: 'X' or 'O' depending on the team that made the move and introduced a valid input for one of the category.
+            :return: The updated game board with the modified cell after each move, but it does not print the current state of the board
+            after it has been modified by this function.
+            """
+            gameBoard[symbol] |= cell_bit(num)
+
+        # CREATE A FUNCTION THAT PRINTS THE RESULT OF THE GAME
+        def declare_winner(symbol):
+            """
+            This function declares the winner of the game, it severs a complementary purpose to the checkwin function.
+            :param symbol: 'X' or 'O' depending on the team that won the game.
+            :return: A f string with the team that has won the game of tic-tac-toe
+            """
+            nonlocal endloop  # Imports endloop into this specific function
+            if symbol == home_team:
+                print(f"Incredible! {Team_1} has scored a game winning goal!")
+                print(f"{Team_1} has won the championship with an incredible performance!")
+            elif symbol == away_team:
+                print(f"Incredible! {Team_2} has scored a game winning goal!")
+                print(f"{Team_2} has won the championship with an incredible performance!")
+            endloop = True
+            printboard()
+
+        # CREATE A COMPLEMENTARY FUNCTION TO THE PREVIOUS ONE THAT RUNS THE WHOLE LOGIC OF WHO HAS WON
+        def checkwin(symbol):
+            """
+            Creates the logic behind checking the winner of the game, it looks the bitboard of the team that just moved
+            up in the precomputed table of winning boards, which covers the three rows, three columns and two diagonals
+            of WIN_MASKS, and lets declare_winner handle the result of the game.
+            :param symbol: 'X' or 'O', the team that has just made a move.
+            :return: The result of the game, but it does not print the team that won or if there was a tie
+            """
+            if has_won(gameBoard[symbol]):
+                declare_winner(symbol)
+
+        # CREATE THE TURN LOGIC FOR THE GAME
+        while endloop == False and Count_Turns < 9:
+            # Logic for knowing which is the team in control of the turn
+            printboard()
+            if Count_Turns % 2 == 0:
+                current_team = Team_1  # Sets the team that is in charge during that turn
+                symbol = home_team
+            else:
+                current_team = Team_2
+                symbol = away_team
+            if computer is not None and symbol == away_team:
+                # The computer picks the cell with alpha-beta and then one of the players that fits it
+                move = computer.best_move(gameBoard[away_team], gameBoard[home_team])
+                player_name = random.choice([name for name, cell in player_to_cell.items() if cell == move.cell])
+                print(f"\n{current_team} picks {player_name} "
+                      f"({move.nodes} positions searched in {move.seconds * 1000:.2f} ms)")
+                modgameboard(move.cell, symbol)
+                print(f"Incredible! {player_name} has scored an amazing goal for {current_team}!")
+                checkwin(symbol)
+                Count_Turns += 1
+                continue
+            player_name = input(f"\n{current_team}, pick a player to try and score (The format must be 'Sergio Ramos' or 'Ramos) or type exit to quit: ").strip()# The function strip eliminates all the useless spaces to be able to compare the names directly to the dictionary
+            if player_name.lower() == "exit":
+                print("Exiting game. Goodbye!")
+                endloop = True
+                break
+            # Check if the player picked is within the options in the dictionary, ignoring accents, case and small typos
+            matches = names.lookup(player_name)
+            if not matches:
+                print("That player is not available for the game!. Choose another option")
+                continue
+            if len({match.value for match in matches}) > 1:
+                print(f"More than one player matches {player_name}: {', '.join(match.name for match in matches)}. Be more specific.")
+                continue
+            player_name = matches[0].name
+            # Check that the player is picking an available cell, one that has not been used by the opponent
+            chosen_cell = matches[0].value
+            if (gameBoard[home_team] | gameBoard[away_team]) & cell_bit(chosen_cell):
+                print(
+                    f"That position {player_name} is already taken, a player has been used from there. Choose another cell.")
+                continue
+            # Modify the current state of the game board according to the input received, also checks if there has been a winning goal
+            modgameboard(chosen_cell, symbol)
+            print(f"Incredible! {player_name} has scored an amazing goal for {current_team}!")
+            checkwin(symbol)
+            Count_Turns += 1
+
+        if not endloop:
+            print("It's a tie!")
+            printboard()
+
+    # MAIN MENU for choosing the games
+
+    print("Choose a game configuration:")
+    print("1: Game 1")
+    print("2: Game 2")
+    print("3: Game 3")
+    print("4: Game 4")
+    choice = input("Enter the number of the game you want to play: ").strip()
+    if choice == "1":
+        row_labels, col_labels, player_to_cell = config_game1()
+    elif choice == "2":
+        row_labels, col_labels, player_to_cell = config_game2()
+    elif choice == "3":
+        row_labels, col_labels, player_to_cell = config_game3()
+    elif choice == "4":
+        row_labels, col_labels, player_to_cell = config_game4()
+    else:
+        print("Invalid choice. Defaulting to Game 1.")
+        row_labels, col_labels, player_to_cell = config_game1()
+    print("1: Two teams")
+    print("2: Play against the computer")
+    computer = tictactoe_ai() if input("Enter 1 or 2: ").strip() == "2" else None
+    Team_1 = input("Team 1's name is: ")
+    Team_2 = "The Computer" if computer is not None else input("Team 2's name is: ")
+    print(f"Let the championship final between {Team_1} and {Team_2} begin!")
+    names = name_index(("tictactoe", tuple(row_labels), tuple(col_labels)), player_to_cell.items)
+    play_game(Team_1, Team_2, row_labels, col_labels, player_to_cell, computer, names)
+
+# ---- Tenaball categories ----
+# Raw player statistics that Tenaball top 10s are computed from: player_stats.csv next to this file (or the file
+# named by BIEBIR_STATS), one row per player, team and season with the columns below. National teams are teams
+# too, and fee is what the team paid to sign the player that season (0 when he was already there).
+STATS_ENV = "BIEBIR_STATS"
+STATS_TEXT_COLUMNS = ("player", "team", "season", "coach")
+STATS_METRICS = ("appearances", "goals", "assists", "fee")
+
+# A top list over the statistics: the metric summed per player over the rows that pass every filter. A filter is
+# a (column, value) pair, where the value may be a tuple of accepted values, and the column "teammate" keeps the
+# team seasons the named player was part of (his own rows left out).
+class StatsCategory(NamedTuple):
+    title: str
+    metric: str
+    filters: tuple = ()
+
+# One place of a top list
+class RankedPlayer(NamedTuple):
+    player: str
+    total: float
+
+# The categories Tenaball plays when the statistics are available, precomputed and cached by PlayerStats
+TENABALL_CATEGORIES = (
+    StatsCategory("all time goalscorers", "goals"),
+    StatsCategory("all time assist providers", "assists"),
+    StatsCategory("players with the most caps for the Spanish National Team", "appearances", (("team", "Spain"),)),
+    StatsCategory("players with the most combined appearances for Juventus and Real Madrid", "appearances",
+                  (("team", ("Juventus", "Real Madrid")),)),
+    StatsCategory("most used players by coach Ancelotti at Real Madrid", "appearances",
+                  (("team", "Real Madrid"), ("coach", "Carlo Ancelotti"))),
+    StatsCategory("most used players by coach lEnrique at Fc Barcelona", "appearances",
+                  (("team", "Fc Barcelona"), ("coach", "Luis Enrique"))),
+    StatsCategory("most expensive barça signings", "fee", (("team", "Fc Barcelona"),)),
+    StatsCategory("most appearances with teammate David de Gea", "appearances", (("teammate", "David de Gea"),)),
+    StatsCategory("players with most appearances with teammate Antony", "appearances", (("teammate", "Antony"),)),
+)
+
+def _grouped_rows(codes, size):
+    """
+    Counting sort of row numbers by code.
+    :return: The rows grouped by code, ascending within each code, and the offsets of the groups: the rows
+             holding code c are rows[offsets[c]:offsets[c + 1]].
+    """
+    counts = [0] * size
+    for code in codes:
+        counts[code] += 1
+    offsets = array("l", itertools.accumulate(counts, initial=0))
+    slots = offsets.tolist()
+    rows = array("l", [0]) * len(codes)
+    for row, code in enumerate(codes):
+        rows[slots[code]] = row
+        slots[code] += 1
+    return rows, offsets
+
+class PlayerStats:
+    """
+    Player statistics held as columns for top-k queries. The CSV is parsed once, chunk_size rows at a time,
+    into a column cache next to it (<file>.columns): the text columns dictionary-encoded as array('l') codes,
+    plus a "squad" code per team season, and the metrics as array('d'), all sorted by player so each player's
+    rows are one slice. Every text column also gets its rows grouped by value, so a filter reads just the rows
+    it keeps. An unfiltered top list is a running sum of the metric read off at the player slice bounds, a
+    filtered one a sum over the kept rows, and both end in heapq.nlargest over the per-player totals.
+
+    Results are kept per (metric, k, filters), and top lists asked for through categories() are also saved in
+    the column cache. Everything is tied to the size and modification time of the CSV, so editing the dataset
+    rebuilds the columns and drops every cached list on the next query.
+    """
+
+    def __init__(self, path, cache_dir=None, chunk_size=100_000):
+        self.path = path
+        self.cache_dir = cache_dir or path + ".columns"
+        self.chunk_size = chunk_size
+        self._signature = None
+        self._values = {}        # text column -> values in code order
+        self._codes = {}         # text column -> {value: code}
+        self._columns = {}       # column -> array of codes or metric values, in player order
+        self._groups = {}        # text column -> (rows grouped by code, group offsets), as from _grouped_rows
+        self._results = {}       # (metric, k, filters) -> [RankedPlayer]
+
+    def signature(self):
+        status = os.stat(self.path)
+        return [status.st_size, status.st_mtime_ns]
+
+    def __len__(self):
+        self._refresh()
+        return len(self._columns["player"])
+
+    def _meta(self):
+        meta_path = os.path.join(self.cache_dir, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def up_to_date(self):
+        """
+        :return: Whether the column cache was built from the CSV as it is now, so opening it needs no rebuild.
+        """
+        if self._signature is not None and self._signature == self.signature():
+            return True
+        meta = self._meta()
+        return meta is not None and meta["signature"] == self.signature()
+
+    def _refresh(self):
+        signature = self.signature()
+        if signature == self._signature:
+            return
+        meta = self._meta()
+        if meta is None or meta["signature"] != signature:
+            self._build(signature)
+        else:
+            self._values = meta["values"]
+            self._columns, self._groups = {}, {}
+            for name, typecode in self._column_types():
+                self._columns[name] = self._read(name, typecode, meta["rows"])
+            for name in STATS_TEXT_COLUMNS[1:] + ("squad",):
+                self._groups[name] = (self._read(name + ".rows", "l", meta["rows"]),
+                                      self._read(name + ".offsets", "l", meta["groups"][name] + 1))
+            players = len(self._values["player"])
+            self._groups["player"] = (None, self._read("player.offsets", "l", players + 1))
+        self._codes = {name: {value: code for code, value in enumerate(values)}
+                       for name, values in self._values.items()}
+        self._signature = signature
+        self._results = {}
+
+    def _read(self, name, typecode, count):
+        column = array(typecode)
+        with open(os.path.join(self.cache_dir, name + ".bin"), "rb") as handle:
+            column.fromfile(handle, count)
+        return column
+
+    @staticmethod
+    def _column_types():
+        return [(name, "l") for name in STATS_TEXT_COLUMNS + ("squad",)] + [(name, "d") for name in STATS_METRICS]
+
+    def _build(self, signature):
+        """
+        Parses the CSV into columns, sorts them by player, groups the rows of every text column and writes the
+        column cache, its meta.json last. Blank lines are skipped.
+        :raises ValueError: When a column is missing or a row is too short to hold every column.
+        """
+        indexes = {name: {} for name in STATS_TEXT_COLUMNS}
+        codes = {name: array("l") for name in STATS_TEXT_COLUMNS}
+        metrics = {name: array("d") for name in STATS_METRICS}
+        reader = csv.reader(_mapped_lines(self.path))
+        header = next(reader, [])
+        missing = [name for name in STATS_TEXT_COLUMNS + STATS_METRICS if name not in header]
+        if missing:
+            raise ValueError(f"The statistics have no {', '.join(missing)} column.")
+        positions = {name: header.index(name) for name in STATS_TEXT_COLUMNS + STATS_METRICS}
+        width = max(positions.values()) + 1
+
+        def rows():
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) < width:
+                    raise ValueError(f"Line {reader.line_num} of the statistics has {len(row)} fields, "
+                                     f"expected {len(header)}.")
+                yield row
+
+        for chunk in _chunked(rows(), self.chunk_size):
+            for name in STATS_TEXT_COLUMNS:
+                index, position = indexes[name], positions[name]
+                codes[name].extend(index.setdefault(row[position], len(index)) for row in chunk)
+            for name in STATS_METRICS:
+                position = positions[name]
+                metrics[name].extend(float(row[position] or 0) for row in chunk)
+
+        seasons = len(indexes["season"])
+        codes["squad"] = array("l", [team * seasons + season for team, season in zip(codes["team"], codes["season"])])
+        order, player_offsets = _grouped_rows(codes["player"], len(indexes["player"]))
+        self._columns = {name: array(column.typecode, map(column.__getitem__, order))
+                         for name, column in itertools.chain(codes.items(), metrics.items())}
+        self._groups = {name: _grouped_rows(self._columns[name], len(indexes["team"]) * seasons if name == "squad"
+                                            else len(indexes[name]))
+                        for name in STATS_TEXT_COLUMNS[1:] + ("squad",)}
+        self._groups["player"] = (None, player_offsets)
+        self._values = {name: list(index) for name, index in indexes.items()}
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        files = dict(self._columns)
+        for name, (rows, offsets) in self._groups.items():
+            if rows is not None:
+                files[name + ".rows"] = rows
+            files[name + ".offsets"] = offsets
+        for name, column in files.items():
+            with open(os.path.join(self.cache_dir, name + ".bin"), "wb") as handle:
+                column.tofile(handle)
+        temporary = os.path.join(self.cache_dir, "meta.json.tmp")
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump({"signature": signature, "rows": len(order), "values": self._values,
+                       "groups": {name: len(offsets) - 1 for name, (_, offsets) in self._groups.items()}},
+                      handle, ensure_ascii=False)
+        os.replace(temporary, os.path.join(self.cache_dir, "meta.json"))
+
+    def _group(self, column, code):
+        rows, offsets = self._groups[column]
+        return rows[offsets[code]:offsets[code + 1]]
+
+    def _filter_rows(self, column, value):
+        """
+        :return: The set of rows whose column holds value (or one of a tuple of values); for "teammate", the
+                 rows of the team seasons that player was part of, less his own.
+        """
+        if column == "teammate":
+            player = self._codes["player"].get(value)
+            if player is None:
+                return set()
+            offsets = self._groups["player"][1]
+            own = range(offsets[player], offsets[player + 1])
+            rows = set().union(*(self._group("squad", squad)
+                                 for squad in set(map(self._columns["squad"].__getitem__, own))))
+            rows.difference_update(own)
+            return rows
+        if column not in self._groups or column == "player":
+            raise ValueError(f"Cannot filter the statistics by '{column}'.")
+        index = self._codes[column]
+        return set().union(*(self._group(column, index[item])
+                             for item in (value if isinstance(value, tuple) else (value,)) if item in index))
+
+    def top(self, metric, k=10, filters=()):
+        """
+        :param metric: One of STATS_METRICS, summed per player.
+        :param filters: (column, value) pairs, as in StatsCategory.
+        :return: The k players with the highest total, highest first, as RankedPlayer; players whose total
+                 is 0 are left out, so fewer than k come back when fewer qualify.
+        """
+        if metric not in STATS_METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {', '.join(STATS_METRICS)}.")
+        self._refresh()
+        filters = tuple((column, tuple(value) if isinstance(value, list) else value) for column, value in filters)
+        key = (metric, k, filters)
+        if key in self._results:
+            return self._results[key]
+
+        values = self._columns[metric]
+        if filters:
+            selections = sorted((self._filter_rows(column, value) for column, value in filters), key=len)
+            rows = selections[0].intersection(*selections[1:])
+            players = self._columns["player"]
+            totals = {}
+            for row in sorted(rows):
+                totals[players[row]] = totals.get(players[row], 0.0) + values[row]
+        else:
+            running = array("d", itertools.accumulate(values, initial=0.0))
+            bounds = list(map(running.__getitem__, self._groups["player"][1]))
+            totals = dict(enumerate(map(operator.sub, bounds[1:], bounds[:-1])))
+        names = self._values["player"]
+        ranked = [RankedPlayer(names[code], totals[code])
+                  for code in heapq.nlargest(k, totals, key=totals.__getitem__) if totals[code] > 0]
+        self._results[key] = ranked
+        return ranked
+
+    def categories(self, categories=TENABALL_CATEGORIES, k=10):
+        """
+        Top k lists of a set of hot categories, read from categories.json in the column cache when it was
+        computed from the current dataset, and otherwise computed now and saved there for the next session.
+        :return: A dict of title -> [RankedPlayer].
+        """
+        self._refresh()
+        path = os.path.join(self.cache_dir, "categories.json")
+        saved = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as handle:
+                cached = json.load(handle)
+            if cached["signature"] == self._signature:
+                saved = cached["lists"]
+        lists, changed = {}, False
+        for category in categories:
+            key = json.dumps([category.metric, k, category.filters], ensure_ascii=False)
+            if key not in saved:
+                saved[key] = [list(entry) for entry in self.top(category.metric, k, category.filters)]
+                changed = True
+            lists[category.title] = [RankedPlayer(*entry) for entry in saved[key]]
+        if changed:
+            temporary = path + ".tmp"
+            with open(temporary, "w", encoding="utf-8") as handle:
+                json.dump({"signature": self._signature, "lists": saved}, handle, ensure_ascii=False)
+            os.replace(temporary, path)
+        return lists
+
+@functools.lru_cache(maxsize=None)
+def _player_stats(path):
+    return PlayerStats(path)
+
+def player_stats():
+    """
+    :return: The PlayerStats of the statistics file, or None when there is none.
+    """
+    path = os.environ.get(STATS_ENV) or os.path.join(os.path.dirname(os.path.abspath(__file__)), "player_stats.csv")
+    return _player_stats(path) if os.path.exists(path) else None
+
+def warm_up_player_stats():
+    """
+    Loads the player statistics and their Tenaball categories ahead of play, building the column cache first
+    when the CSV is new or has changed (about 10 s per million rows), so tenaball() itself starts at once.
+    :return: The PlayerStats, or None when there are no statistics.
+    """
+    stats = player_stats()
+    if stats is not None:
+        if not stats.up_to_date():
+            print("Loading the player statistics, this only happens after they change...")
+        stats.categories()
+    return stats
+
+def tenaball():
+    # Code to randomly choose the tenaball category: the lists computed from the player statistics when there
+    # are any (complete top 10s only), and the hand-written lists of the game data for every other category
+    stats = player_stats()
+    try:
+        generated = {title: [entry.player for entry in ranked] for title, ranked in stats.categories().items()
+                     if len(ranked) == 10} if stats is not None else {}
+    except (OSError, ValueError):
+        # unreadable statistics were already reported when the game was loaded, so play the hand-written lists
+        generated = {}
+    category = random.choice(list(dict.fromkeys(GAME_DATA.keys("tenaball") + list(generated))))
+    random_tenaball = generated[category] if category in generated else GAME_DATA.load("tenaball", category)["players"]
+
+    # index of the list so guesses ignore accents, case and small typos and can be just the surname (keyed on the
+    # list itself, so a list recomputed from changed statistics gets a fresh index)
+    names = name_index(("tenaball", category, tuple(random_tenaball)), lambda: ((name, position) for position, name in enumerate(random_tenaball)))
+
+    # so that we can track how many the player has guessed
+    correct_answer = []
+
+    # object that defines the amount of lives you
+    lives = 3
+
+    # Scoreboard object so to substitute the name of the player by the question mark
+    reveal_ans = ["?" for _ in random_tenaball]
+
+    # starting the game
+    print("Welcome to our Tenaball game mode")
+    play = input("Do you want to play or exit?")
+    # if player types exit it will. not run
+    if play == "exit":
+        print("Bye!")
+        return
+
+    # anything else will start the game
+    else:
+        # will start a loop that will keep going as long as lives are not 0 or the amount of player guessed is less than 10
+        while lives > 0 and len(correct_answer) < 10:
+            print(f"\nYou have {lives} lives left")
+
+            # will print the tenaball tower which will allows the player to later see what position of the players he guessed
+            print("tenaball tower:")
+            for i, name in enumerate(reveal_ans, start=1):
+                print(f"{i}. {name}")
+            print(f"find the top 10 {category}")
+
+            player = input("Enter a player's full name: ")
+            matches = names.lookup(player)
+            if len(matches) == 1:
+                player = matches[0].name
+
+            # check if guessed player is in the top 10
+            if len(matches) == 1 and player not in correct_answer:
+                # will define what position in the top 10 the player is in
+                position = matches[0].value + 1
+                # will print what position in the top 10 the player is in
+                print(f"You guessed {player} correctly, he is number {position} on the list")
+                # will then add the correct player to the list by removing the question mark by the player name
+                reveal_ans[position - 1] = player
+                # adds the player in the list of correct answers so that we can see how many right players
+                # the user has guessed
+                correct_answer.append(player)
+                lives = 3
+
+                # if player has already been guessed
+            elif player in correct_answer:
+                print("You already guessed that player")
+                # lives == lives
+
+                # if the name fits more than one player on the list
+            elif len(matches) > 1:
+                print(f"More than one player on the list matches {player}, be more specific")
+
+                # if player is not on the list
+            else:
+                print(f"{player} is not on the list")
+                # removes a life
+                lives -= 1
+
+        # conditionalities for the code to see if it should stop
+        # stops if the length of players is the top 10 given
+        if len(correct_answer) == 10:
+            print("\nYou beat the Tenaball")
+
+        # or it will also stop if lives reach zero
+
+        else:
+            print("\nThe Tenaball beat you")
+            print(f"The correct players were:")
+            for position, player in enumerate(random_tenaball, start=1):
+                print(f"{position}. {player}")
+
+
+# ---- Player table ----
+# Footynator questions, by the player attribute they ask about
+FOOTYNATOR_QUESTIONS = {
+    "league": "Which league does he play in?",
+    "position": "What is his position?",
+    "nationality": "What is his nationality?",
+    "team": "Which team does he play for?",
+    "age": "What is his age?",
+}
+
+# Footynator attributes held as real integers, which also support range queries
+INTEGER_ATTRIBUTES = ("age",)
+
+_NONZERO_BYTE = re.compile(rb"[^\x00]")
+
+def _bitmap_rows(bitmap):
+    """
+    The row numbers set in a bitmap, in order. Zero bytes are skipped by a regular expression scan so that
+    sparse bitmaps over large tables cost little more than their set bits.
+    """
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for match in _NONZERO_BYTE.finditer(data):
+        base, byte = match.start() * 8, data[match.start()]
+        for bit in range(8):
+            if byte >> bit & 1:
+                yield base + bit
+
+class PlayerTable:
+    """
+    Footynator players stored by column. Every attribute is dictionary-encoded: each distinct value (folded, see
+    fold_name, or a real int for INTEGER_ATTRIBUTES) gets an integer code, the rows hold codes in an array('l'),
+    and every code has a bitmap, a Python int whose bit r is set when row r has that value. A filter is then one
+    bitwise AND and counting the candidates one popcount.
+    """
+
+    def __init__(self, players=(), attributes=tuple(FOOTYNATOR_QUESTIONS)):
+        self.attributes = tuple(attributes)
+        self.names = []
+        self.columns = {attribute: array("l") for attribute in self.attributes}
+        self.dictionaries = {attribute: [] for attribute in self.attributes}   # code -> value as first stored
+        self.bitmaps = {attribute: [] for attribute in self.attributes}        # code -> rows bitmap
+        self._codes = {attribute: {} for attribute in self.attributes}         # folded value -> code
+        for player in players:
+            self.names.append(player["name"])
+            for attribute in self.attributes:
+                self.columns[attribute].append(self._encode(attribute, player[attribute]))
+        for attribute in self.attributes:
+            buffers = [bytearray((len(self.names) + 7) // 8) for _ in self.dictionaries[attribute]]
+            for row, code in enumerate(self.columns[attribute]):
+                buffers[code][row >> 3] |= 1 << (row & 7)
+            self.bitmaps[attribute] = [int.from_bytes(buffer, "little") for buffer in buffers]
+
+    def _key(self, attribute, value):
+        if attribute in INTEGER_ATTRIBUTES:
+            try:
+                return int(value)
+            except ValueError:
+                return None
+        return fold_name(str(value))
+
+    def _encode(self, attribute, value):
+        key = self._key(attribute, value)
+        codes = self._codes[attribute]
+        code = codes.get(key)
+        if code is None:
+            code = codes[key] = len(self.dictionaries[attribute])
+            self.dictionaries[attribute].append(key if attribute in INTEGER_ATTRIBUTES else value)
+            self.bitmaps[attribute].append(0)
+        return code
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.select())
+
+    def append(self, player):
+        """
+        Adds one player, setting its bit in the bitmap of each of its values.
+        :return: The new row number.
+        """
+        row = len(self.names)
+        self.names.append(player["name"])
+        for attribute in self.attributes:
+            code = self._encode(attribute, player[attribute])
+            self.columns[attribute].append(code)
+            self.bitmaps[attribute][code] |= 1 << row
+        return row
+
+    def update(self, row, player):
+        """
+        Replaces the values of an existing row, moving its bit from the old values' bitmaps to the new ones.
+        """
+        self.names[row] = player["name"]
+        bit = 1 << row
+        for attribute in self.attributes:
+            column, bitmaps = self.columns[attribute], self.bitmaps[attribute]
+            bitmaps[column[row]] &= ~bit
+            column[row] = self._encode(attribute, player[attribute])
+            bitmaps[column[row]] |= bit
+
+    def row(self, row):
+        """
+        :return: Row number row decoded back into a player dict.
+        """
+        player = {"name": self.names[row]}
+        for attribute in self.attributes:
+            player[attribute] = self.dictionaries[attribute][self.columns[attribute][row]]
+        return player
+
+    def all_rows(self):
+        return (1 << len(self.names)) - 1
+
+    def bitmap(self, attribute, value):
+        """
+        :return: The bitmap of the rows whose attribute equals value (ignoring case and accents), 0 if none do.
+        """
+        code = self._codes[attribute].get(self._key(attribute, value))
+        return 0 if code is None else self.bitmaps[attribute][code]
+
+    def range(self, attribute, low, high):
+        """
+        :return: The bitmap of the rows whose integer attribute lies between low and high, both included.
+        """
+        bitmap = 0
+        for value, code in self._codes[attribute].items():
+            if value is not None and low <= value <= high:
+                bitmap |= self.bitmaps[attribute][code]
+        return bitmap
+
+    def filter(self, bitmap=None, **conditions):
+        """
+        ANDs the bitmaps of every attribute=value condition into bitmap (all rows when None).
+        Example: table.filter(league="La Liga", position="Forward")
+        """
+        if bitmap is None:
+            bitmap = self.all_rows()
+        for attribute, value in conditions.items():
+            bitmap &= self.bitmap(attribute, value)
+        return bitmap
+
+    def select(self, bitmap=None):
+        return PlayerSelection(self, self.all_rows() if bitmap is None else bitmap)
+
+class PlayerSelection:
+    """
+    The rows of a PlayerTable picked by a bitmap. It behaves like the list of player dicts it replaces: len()
+    is a popcount and iterating or indexing decodes only the rows that are read.
+    """
+    __slots__ = ("table", "bitmap")
+
+    def __init__(self, table, bitmap):
+        self.table = table
+        self.bitmap = bitmap
+
+    def __len__(self):
+        return self.bitmap.bit_count()
+
+    def __iter__(self):
+        return map(self.table.row, _bitmap_rows(self.bitmap))
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        return self.table.row(next(itertools.islice(_bitmap_rows(self.bitmap), index, None)))
+
+    def row_numbers(self):
+        return _bitmap_rows(self.bitmap)
+
+def filter_players(players, attribute, value):
+    """
+    Filters the players based on the given attribute value.
+    The comparison ignores case and accents (see fold_name).
+    :param players: A PlayerTable or PlayerSelection, filtered with one bitmap AND, or a list of player dicts.
+    :return: A PlayerSelection, or a list when players is a list.
+    """
+    if isinstance(players, PlayerTable):
+        players = players.select()
+    if isinstance(players, PlayerSelection):
+        return PlayerSelection(players.table, players.bitmap & players.table.bitmap(attribute, value))
+    value = fold_name(value)
+    return [player for player in players if fold_name(str(player[attribute])) == value]
+
+# ---- Footynator corrections ----
+# Directory holding what Footynator learns from its players (BIEBIR_DATA_DIR, or ~/.biebir_hub)
+DATA_DIR_ENV = "BIEBIR_DATA_DIR"
+
+def _locked(handle, exclusive):
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+class CorrectionLog:
+    """
+    Append-only log of Footynator corrections, one record per line as "<crc32 in hex> <JSON>". Every append is a
+    single write to a file opened in append mode under an exclusive lock, so sessions writing at the same time
+    never interleave, and it is flushed to disk before returning when durable is True. A line whose checksum does
+    not match, such as the torn last line of a crashed write, is skipped on replay.
+    """
+
+    def __init__(self, path, durable=True):
+        self.path = path
+        self.durable = durable
+
+    @staticmethod
+    def encode(record):
+        payload = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+    @staticmethod
+    def decode(line):
+        """
+        :return: The record of a log line, or None when the line is damaged.
+        """
+        checksum, _, payload = line.rstrip(b"\n").partition(b" ")
+        try:
+            if int(checksum, 16) != zlib.crc32(payload):
+                return None
+            return json.loads(payload)
+        except ValueError:
+            return None
+
+    def append(self, record):
+        """
+        Writes one record. When the file does not end in a newline (a write torn by a crash), the record starts
+        on a line of its own, so only the torn line is lost on replay.
+        """
+        with open(self.path, "a+b") as handle:
+            _locked(handle, exclusive=True)
+            end = handle.seek(0, os.SEEK_END)
+            torn = False
+            if end:
+                handle.seek(end - 1)
+                torn = handle.read(1) != b"\n"
+            handle.write(b"\n" * torn + self.encode(record))
+            handle.flush()
+            if self.durable:
+                os.fsync(handle.fileno())
+
+    def replay(self, handle=None):
+        """
+        :param handle: The log already open for reading and locked by the caller, or None to open and lock it here.
+        :return: The intact records in the order they were written, and the number of damaged lines skipped.
+        """
+        if handle is None:
+            if not os.path.exists(self.path):
+                return [], 0
+            with open(self.path, "rb") as handle:
+                _locked(handle, exclusive=False)
+                return self.replay(handle)
+        records = [self.decode(line) for line in handle]
+        return [record for record in records if record is not None], records.count(None)
+
+    def size(self):
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+class FootynatorMemory:
+    """
+    Players learnt from corrections, kept as a snapshot (players.json) plus a CorrectionLog (corrections.log) of
+    what was learnt since. Once the log grows past compact_bytes it is folded into the snapshot, which is replaced
+    atomically, and emptied, so loading at startup never replays more than compact_bytes of log.
+    """
+
+    def __init__(self, directory, compact_bytes=1 << 20, durable=True):
+        self.directory = directory
+        self.compact_bytes = compact_bytes
+        self.snapshot_path = os.path.join(directory, "players.json")
+        self.log = CorrectionLog(os.path.join(directory, "corrections.log"), durable)
+
+    def _snapshot(self):
+        if not os.path.exists(self.snapshot_path):
+            return []
+        with open(self.snapshot_path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def load(self):
+        """
+        :return: Every learnt player, oldest first; a player corrected twice appears twice, the later one winning.
+        """
+        if not os.path.exists(self.log.path):
+            return self._snapshot()
+        # Snapshot and log are read under one shared lock, so a compaction cannot move records in between
+        with open(self.log.path, "rb") as handle:
+            _locked(handle, exclusive=False)
+            return self._snapshot() + self.log.replay(handle)[0]
+
+    def record(self, player):
+        """
+        Logs one corrected player, compacting the log when it has grown past compact_bytes.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self.log.append(player)
+        if self.log.size() > self.compact_bytes:
+            self.compact()
+
+    def compact(self):
+        """
+        Folds the log into the snapshot, keeping the latest record of each player. The log stays locked
+        throughout, so no session appends in between; if the process dies before the log is emptied the same
+        records are folded in again next time, which changes nothing.
+        """
+        if not os.path.exists(self.log.path):
+            return
+        with open(self.log.path, "r+b") as handle:
+            _locked(handle, exclusive=True)
+            latest = {fold_name(player["name"]): player for player in self._snapshot()}
+            for line in handle:
+                player = self.log.decode(line)
+                if player is not None:
+                    latest[fold_name(player["name"])] = player
+            temporary = self.snapshot_path + ".tmp"
+            with open(temporary, "w", encoding="utf-8") as snapshot:
+                json.dump(list(latest.values()), snapshot, ensure_ascii=False)
+                snapshot.flush()
+                os.fsync(snapshot.fileno())
+            os.replace(temporary, self.snapshot_path)
+            handle.truncate(0)
+
+# The memory Footynator writes to
+@functools.lru_cache(maxsize=None)
+def footynator_memory():
+    return FootynatorMemory(os.environ.get(DATA_DIR_ENV) or os.path.join(os.path.expanduser("~"), ".biebir_hub"))
+
+def learn_player(table, names, player):
+    """
+    Adds a corrected player to the PlayerTable and its name index, or updates the row of a player with the
+    same full name, touching only that row's bits and index entries.
+    """
+    key = fold_name(player["name"])
+    rows = [match.value for match in names.lookup(player["name"], max_distance=0)
+            if fold_name(table.names[match.value]) == key]
+    if rows:
+        table.update(rows[0], player)
+    else:
+        names.add(player["name"], table.append(player))
+
+# The Footynator roster with everything learnt so far, built once per session and then kept up to date
+@functools.lru_cache(maxsize=None)
+def footynator_players():
+    """
+    :return: The PlayerTable and its PlayerNameIndex (mapping names to row numbers).
+    """
+    table = PlayerTable(GAME_DATA.load("footynator", "players")["players"])
+    names = PlayerNameIndex((name, row) for row, name in enumerate(table.names))
+    for player in footynator_memory().load():
+        learn_player(table, names, player)
+    return table, names
+
+def _plogp(count):
+    return count * math.log2(count) if count > 1 else 0.0
+
+class QuestionPlanner:
+    """
+    Chooses Footynator's next question as the one whose answer is expected to remove the most uncertainty about
+    the remaining candidates. Answers are deterministic, so the expected information gain of asking an attribute
+    is the entropy of its values over the candidates, H = log2(n) - sum(c * log2(c)) / n. The planner keeps a
+    value histogram per attribute together with its sum(c * log2(c)) and updates both as candidates are removed,
+    so picking a question costs one step per attribute whatever the roster size.
+    """
+
+    def __init__(self, players, attributes=tuple(FOOTYNATOR_QUESTIONS)):
+        self.table = players if isinstance(players, PlayerTable) else PlayerTable(players, attributes)
+        self.attributes = tuple(attributes)
+        self.asked = set()
+        self.bitmap = self.table.all_rows()
+        # The starting histograms are the popcounts of the table's value bitmaps
+        self.histograms = [{code: bitmap.bit_count() for code, bitmap in enumerate(self.table.bitmaps[attribute])
+                            if bitmap} for attribute in self.attributes]
+        self._plogp_sums = [sum(map(_plogp, histogram.values())) for histogram in self.histograms]
+
+    @property
+    def candidates(self):
+        return self.table.select(self.bitmap)
+
+    def _update(self, bitmap, step):
+        columns = [self.table.columns[attribute] for attribute in self.attributes]
+        for row in _bitmap_rows(bitmap):
+            for position, column in enumerate(columns):
+                histogram, code = self.histograms[position], column[row]
+                count = histogram.get(code, 0)
+                self._plogp_sums[position] += _plogp(count + step) - _plogp(count)
+                if count + step:
+                    histogram[code] = count + step
+                else:
+                    del histogram[code]
+
+    def entropy(self, attribute):
+        position = self.attributes.index(attribute)
+        n = self.bitmap.bit_count()
+        if len(self.histograms[position]) < 2:
+            return 0.0
+        return math.log2(n) - self._plogp_sums[position] / n
+
+    def next_question(self):
+        """
+        :return: The unasked attribute with the highest entropy over the candidates, or None when no question
+                 could tell the remaining candidates apart.
+        """
+        best, best_entropy = None, 0.0
+        for attribute in self.attributes:
+            if attribute not in self.asked:
+                entropy = self.entropy(attribute)
+                if entropy > best_entropy:
+                    best, best_entropy = attribute, entropy
+        return best
+
+    def answer(self, attribute, value):
+        """
+        Keeps only the candidates whose attribute matches value (ignoring case and accents) with one bitmap AND,
+        and updates the histograms by taking out the dropped players, or by recounting the kept ones when fewer
+        are kept.
+        :return: The remaining candidates, as a PlayerSelection.
+        """
+        self.asked.add(attribute)
+        kept = self.bitmap & self.table.bitmap(attribute, value)
+        dropped = self.bitmap & ~kept
+        self.bitmap = kept
+        if kept.bit_count() < dropped.bit_count():
+            self.histograms = [{} for _ in self.attributes]
+            self._plogp_sums = [0.0] * len(self.attributes)
+            self._update(kept, 1)
+        else:
+            self._update(dropped, -1)
+        return self.candidates
+
+def footynator():
+    print("Welcome to Footynator: Football Player Guesser!")
+    players, names = footynator_players()
+
+    print("Think of a football player, and I'll try to guess who it is by asking a few questions.")
+    print("At any point, type 'exit' to quit the game.")
+
+    # The planner asks the most informative remaining question first (see QuestionPlanner)
+    planner = QuestionPlanner(players)
+    candidates = planner.candidates
+
+    while len(candidates) > 1:
+        attribute = planner.next_question()
+        if attribute is None:
+            break
+
+        answer = input(FOOTYNATOR_QUESTIONS[attribute] + " ").strip()
+        if answer.lower() == "exit":
+            print("Exiting the game.")
+            return
+
+        candidates = planner.answer(attribute, answer)
+
+        if not candidates:
+            print("No player matches that description. Please try again.")
+            return
+
+    if len(candidates) == 1:
+        guessed_player = candidates[0]["name"]
+        print("The player you are thinking of is:", guessed_player)
+        correct = input("Was I correct? (yes/no) ").strip().lower()
+        if correct in ("yes", "y"):
+            print("Great! Thanks for playing!")
+        else:
+            correct_name = input("Oh no, what player were you thinking of? ").strip()
+            known = names.lookup(correct_name)
+            if len(known) == 1:
+                print(f"I know {known[0].name} ({players.row(known[0].value)['team']}), "
+                      f"your answers must have pointed me elsewhere.")
+            correction = {"name": correct_name,
+                          "league": input("Which league does he play in? ").strip(),
+                          "position": input("What position does he play in? ").strip(),
+                          "nationality": input("What is his nationality? ").strip(),
+                          "team": input("Which team does he play for? ").strip(),
+                          "age": input("How old is he? ").strip()}
+            if correct_name:
+                try:
+                    footynator_memory().record(correction)
+                except OSError as e:
+                    print("I could not save that correction:", e)
+                learn_player(players, names, correction)
+            print(f"Thanks for letting me know! I'll add {correct_name} to my records")
+            print("Thanks for playing!")
+            return
+    else:
+        print("I couldn't guess with certainty. The players that match are:")
+        for player in candidates:
+            print("- " + player["name"])
+
+def missing11():
+    # Randomly select a team and load only its lineup.
+    team_name = random.choice(GAME_DATA.keys("missing11"))
+    lineup = [tuple(player) for player in GAME_DATA.load("missing11", team_name)["lineup"]]
+    names = name_index(("missing11", team_name), lambda: ((player, pos) for pos, player in lineup))
+    print(f"Guess the starting 11 for {team_name}!")
+    print("Enter player names one by one. (Type 'quit' to exit)\n")
+
+    guessed = set()
+    attempts = 0
+    while len(guessed) < 11:
+        guess = input("Your guess: ").strip()
+        if guess.lower() == "quit":
+            print("Game exited.")
+            return
+        attempts += 1
+
+        # Look the guess up in the lineup's name index (accents, case and small typos do not matter).
+        matches = names.lookup(guess)
+        if len(matches) > 1:
+            print(f"More than one player matches {guess}: {', '.join(match.name for match in matches)}.")
+        elif matches:
+            player, pos = matches[0].name, matches[0].value
+            if player in guessed:
+                print(f"You already guessed {player}.")
+            else:
+                guessed.add(player)
+                print(f"Correct! {player} plays as {pos}.")
+        else:
+            print("Incorrect guess.")
+
+        # Display the full lineup with positions, showing "???" for unguessed players.
+        print("\nCurrent lineup:")
+        for pos, player in lineup:
+            if player in guessed:
+                print(f"{pos}: {player}")
+            else:
+                print(f"{pos}: ???")
+        print(f"\n{len(guessed)}/11 players found.\n")
+
+    print(f"Congratulations! You completed the lineup in {attempts} guesses.")
+    print("\nThe full starting 11 was:")
+    for pos, player in lineup:
+        print(f"{pos}: {player}")
+
+# --------------------- RESULT CACHE ---------------------
+
+# Hit, miss and eviction counters of a ResultCache
+class CacheStats(NamedTuple):
+    hits: int
+    disk_hits: int
+    misses: int
+    evictions: int
+    size: int
+
+def _normalize_argument(value, digits):
+    """
+    Turns an argument into a hashable, rounded key component: numbers become floats rounded to digits
+    decimals (so 5, 5.0 and 5.00000000001 share an entry) and sequences become tuples.
+    """
+    if type(value) is float or type(value) is int:
+        value = round(float(value), digits)
+        return 0.0 if value == 0 else value
+    if isinstance(value, (list, tuple, array, range)):
+        return tuple(_normalize_argument(item, digits) for item in value)
+    return value
+
+def _encode_result(value):
+    """
+    Turns a calculator result into plain JSON data: numbers, strings and None stay as they are, and named
+    tuples, tuples, lists, arrays and dates become a one-key object tagged with their kind (named tuples
+    also record their class name).
+    :raises TypeError: For any other type, which is then cached in memory only.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return {"namedtuple": [type(value).__name__, [_encode_result(item) for item in value]]}
+    if isinstance(value, tuple):
+        return {"tuple": [_encode_result(item) for item in value]}
+    if isinstance(value, list):
+        return {"list": [_encode_result(item) for item in value]}
+    if isinstance(value, array):
+        return {"array": [value.typecode, value.tolist()]}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    raise TypeError(f"Cannot store a {type(value).__name__} result.")
+
+def _decode_result(data):
+    """
+    Rebuilds a result written by _encode_result. Named tuples are only rebuilt as the NamedTuple classes of
+    this module, so a cache file can never make the program construct anything else.
+    :raises ValueError: For data that _encode_result could not have written.
+    """
+    if not isinstance(data, dict):
+        if isinstance(data, list):
+            raise ValueError("Untagged list in a cached result.")
+        return data
+    (kind, payload), = data.items()
+    if kind == "namedtuple":
+        name, items = payload
+        result_type = globals().get(name)
+        if not (isinstance(result_type, type) and issubclass(result_type, tuple) and hasattr(result_type, "_fields")):
+            raise ValueError(f"Unknown result type '{name}' in a cached result.")
+        return result_type(*(_decode_result(item) for item in items))
+    if kind == "tuple":
+        return tuple(_decode_result(item) for item in payload)
+    if kind == "list":
+        return [_decode_result(item) for item in payload]
+    if kind == "array":
+        return array(*payload)
+    if kind == "date":
+        return date.fromisoformat(payload)
+    raise ValueError(f"Unknown kind '{kind}' in a cached result.")
+
+# Memoization of the pure calculators
+class ResultCache:
+    """
+    A bounded LRU cache of calculator results keyed on the calculator name and its normalized, rounded
+    arguments. With a path the results are also written to a SQLite file as JSON (never pickled, so a shared
+    or edited file cannot run code), and survive restarts: a miss in memory is looked up on disk before the
+    calculator runs again. Rows that do not decode, such as those of older pickle-based files, count as misses
+    and are overwritten.
+    Only deterministic calculators belong here (no input(), print() or random draws).
+    """
+
+    def __init__(self, maxsize=4096, digits=10, path=None):
+        self.maxsize = maxsize
+        self.digits = digits
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+        self._entries = OrderedDict()
+        self._store = None
+        if path is not None:
+            self.attach(path)
+
+    def attach(self, path):
+        """
+        Backs the cache with a SQLite file, creating it on first use.
+        """
+        self.close()
+        self._store = sqlite3.connect(path, isolation_level=None)
+        self._store.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+
+    def close(self):
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def _key(self, func, args, kwargs):
+        digits = self.digits
+        key = (func.__module__, func.__qualname__, *[_normalize_argument(value, digits) for value in args])
+        if kwargs:
+            key += tuple((name, _normalize_argument(value, digits)) for name, value in sorted(kwargs.items()))
+        return key
+
+    def _remember(self, key, result):
+        self._entries[key] = result
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def call(self, func, *args, **kwargs):
+        """
+        Returns func(*args, **kwargs), computing it only when no equivalent call is cached. Exceptions are
+        not cached. Mutable results (arrays, lists) are copied so callers cannot change the cached value.
+        """
+        key = self._key(func, args, kwargs)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.copy(self._entries[key])
+        if self._store is not None:
+            row = self._store.execute("SELECT value FROM results WHERE key = ?", (repr(key),)).fetchone()
+            if row is not None:
+                try:
+                    result = _decode_result(json.loads(row[0]))
+                except (TypeError, ValueError):
+                    pass    # unreadable row: recomputed below and overwritten
+                else:
+                    self._remember(key, result)
+                    self.disk_hits += 1
+                    return copy.copy(result)
+        self.misses += 1
+        result = func(*args, **kwargs)
+        self._remember(key, result)
+        if self._store is not None:
+            try:
+                encoded = json.dumps(_encode_result(result))
+            except TypeError:
+                encoded = None
+            if encoded is not None:
+                self._store.execute("INSERT OR REPLACE INTO results VALUES (?, ?)", (repr(key), encoded))
+        return copy.copy(result)
+
+    def wrap(self, func):
+        """
+        Returns a cached version of func that shares this cache's entries and counters.
+        """
+        @functools.wraps(func)
+        def cached(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+        return cached
+
+    def stats(self):
+        return CacheStats(self.hits, self.disk_hits, self.misses, self.evictions, len(self._entries))
+
+    def clear(self, disk=False):
+        """
+        Empties the in-memory entries and resets the counters; with disk=True the SQLite store too.
+        """
+        self._entries.clear()
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+        if disk and self._store is not None:
+            self._store.execute("DELETE FROM results")
+
+# The cache used by the interactive calculators (persisted with --cache-file)
+RESULT_CACHE = ResultCache()
+
+# --------------------- INSTRUMENTATION ---------------------
+
+# Environment variable that turns profiling on, holding the export path (.json, or .prof for cProfile)
+PROFILE_ENV = "BIEBIR_PROFILE"
+
+# Calculators, menu modes and games that get timed when instrumentation is on
+_INSTRUMENTED = (
+    "price_bonds", "perpetuity_price", "growing_perpetuity_price", "annuity_price", "growing_annuity_price",
+    "annuity_due_price", "compute_maturity_value", "compute_current_yield", "solve_ytm", "compute_duration",
+    "run_scenarios", "monte_carlo_bond_prices", "price_dated_bond", "solve_irr", "solve_irr_batch",
+    "compute_payback_period", "payback_periods", "compute_recovery_value",
+    "bond_calculator", "bond_maturity", "current_yield", "yield_to_maturity", "duration_calculation",
+    "curve_bond_calculator", "monte_carlo_bond_calculator", "dated_bond_calculator", "irr_calculation",
+    "payback_period", "recovery_value", "Footy_tictactoe", "footynator", "tenaball", "missing11",
+)
+# Objective functions whose calls are counted as solver function evaluations
+_COUNTED_EVALUATIONS = ("_bond_value_and_slope", "_npv_and_slope", "_npv")
+
+class Instrumentation:
+    """
+    Opt-in timing of the calculators and games. enable() swaps the module-level functions listed in
+    _INSTRUMENTED for timed wrappers and disable() puts the originals back, so nothing is paid while it
+    is off. Every call records its wall time, the solver iterations reported in its result, the
+    objective-function evaluations made inside it and the RESULT_CACHE hits it got.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.evaluations = 0
+        self.records = {}
+        self._originals = {}
+
+    def enable(self):
+        if self.enabled:
+            return
+        module = globals()
+        for name in _INSTRUMENTED:
+            self._originals[name] = module[name]
+            module[name] = self._timed(module[name])
+        for name in _COUNTED_EVALUATIONS:
+            self._originals[name] = module[name]
+            module[name] = self._counted(module[name])
+        self.enabled = True
+
+    def disable(self):
+        globals().update(self._originals)
+        self._originals.clear()
+        self.enabled = False
+
+    def _counted(self, func):
+        @functools.wraps(func)
+        def counted(*args):
+            self.evaluations += 1
+            return func(*args)
+        return counted
+
+    def _timed(self, func):
+        record = self.records.setdefault(func.__name__, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0,
+                                                         "iterations": 0, "evaluations": 0, "cache_hits": 0})
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            evaluations, cache_hits = self.evaluations, RESULT_CACHE.hits + RESULT_CACHE.disk_hits
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - start
+                record["calls"] += 1
+                record["seconds"] += seconds
+                record["max_seconds"] = max(record["max_seconds"], seconds)
+                record["evaluations"] += self.evaluations - evaluations
+                record["cache_hits"] += RESULT_CACHE.hits + RESULT_CACHE.disk_hits - cache_hits
+            if isinstance(result, list):
+                record["iterations"] += sum(getattr(item, "iterations", 0) for item in result)
+            else:
+                record["iterations"] += getattr(result, "iterations", 0)
+            return result
+        return timed
+
+    def report(self):
+        """
+        :return: A dict of function name -> totals, for every function called at least once.
+        """
+        return {name: dict(record, mean_seconds=record["seconds"] / record["calls"])
+                for name, record in self.records.items() if record["calls"]}
+
+    def export(self, path):
+        with open(path, "w") as handle:
+            json.dump(self.report(), handle, indent=2)
+
+# The instrumentation switched on by --profile or BIEBIR_PROFILE
+INSTRUMENTATION = Instrumentation()
+
+def run_profiled(target, path):
+    """
+    Runs target() with instrumentation on and writes the results to path when it returns: cProfile
+    statistics (readable with pstats) when path ends in .prof or .pstats, otherwise the JSON call report.
+    """
+    if path.endswith((".prof", ".pstats")):
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(target)
+        finally:
+            profiler.dump_stats(path)
+        return
+    INSTRUMENTATION.enable()
+    try:
+        target()
+    finally:
+        INSTRUMENTATION.disable()
+        INSTRUMENTATION.export(path)
+
+# --------------------- BATCH PROCESSING ---------------------
+
+# Calculators available to the batch runner: input fields, pure function, whether the function takes
+# whole columns at once, and the output column for results that are a single number
+_BATCH_CALCULATORS = {
+    "price": (("face_value", "coupon_rate", "market_rate", "years_to_maturity"), price_bonds, True, "price"),
+    "maturity": (("face_value", "coupon_rate", "years_to_maturity", "reinvestment_rate"), compute_maturity_value,
+                 False, "maturity_value"),
+    "current_yield": (("face_value", "coupon_rate", "current_price"), compute_current_yield, False,
+                      "current_yield"),
+    "ytm": (("price", "face_value", "coupon_rate", "years_to_maturity"), solve_ytm, True, None),
+    "duration": (("face_value", "coupon_rate", "years_to_maturity", "yield_rate"), compute_duration, False, None),
+    "irr": (("cashflows",), solve_irr, False, None),
+    "payback": (("cashflows",), compute_payback_period, False, "payback_period"),
+    "recovery": (("salvage_value", "selling_cost", "tax_rate"), compute_recovery_value, False, "recovery_value"),
+}
+
+class BatchSummary(NamedTuple):
+    processed: int
+    rejected: int
+    seconds: float
+
+def _parse_batch_field(name, value):
+    """
+    Converts one raw field of a batch record: years to maturity become ints, cash flows become a list
+    (a JSON list, or a string of numbers separated by semicolons, commas or spaces) and anything else a float.
+    """
+    if value is None or value == "":
+        raise ValueError(f"Missing field '{name}'.")
+    if name == "years_to_maturity":
+        years = float(value)
+        if not math.isfinite(years) or years != int(years):
+            raise ValueError("Years to maturity must be a whole number.")
+        return int(years)
+    if name == "cashflows":
+        flows = value if isinstance(value, list) else [cf for cf in re.split(r"[;,\s]+", str(value).strip()) if cf]
+        if not flows:
+            raise ValueError("No cash flows given.")
+        return [float(cf) for cf in flows]
+    return float(value)
+
+def _read_batch_records(path):
+    """
+    Streams the records of a CSV (with header) or JSONL file one at a time.
+    :return: A generator of (line number, record, None, None) tuples; records that cannot be decoded are
+    yielded as (line number, None, error message, raw record) so the caller can reject them.
+    """
+    with open(path, newline="", encoding="utf-8") as handle:
+        if path.endswith((".jsonl", ".ndjson", ".json")):
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_number, None, f"Malformed JSON: {e}", line.rstrip("\n")
+                    continue
+                if not isinstance(record, dict):
+                    yield line_number, None, "A record must be a JSON object.", line.rstrip("\n")
+                    continue
+                yield line_number, record, None, None
+        else:
+            reader = csv.DictReader(handle)
+            for record in reader:
+                if None in record:
+                    yield reader.line_num, None, "Too many values in the row.", record
+                    continue
+                yield reader.line_num, record, None, None
+
+def _chunked(iterable, chunk_size):
+    """
+    Groups a stream into lists of at most chunk_size items without reading ahead any further.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def _batch_output_value(value, for_csv):
+    if isinstance(value, tuple):
+        return ";".join(repr(item) for item in value) if for_csv else list(value)
+    if not for_csv and isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+def _process_batch_chunk(calculator, chunk):
+    """
+    Runs one chunk of records through a calculator.
+    :return: The result rows and the rejected rows of the chunk, each as a list of dicts.
+    """
+    fields, function, columnar, result_name = _BATCH_CALCULATORS[calculator]
+    results, rejects, parsed = [], [], []
+    for line_number, record, error, raw in chunk:
+        if record is None:
+            rejects.append({"line": line_number, "error": error, "record": raw})
+            continue
+        try:
+            arguments = tuple(_parse_batch_field(name, record.get(name)) for name in fields)
+        except (TypeError, ValueError) as e:
+            rejects.append({"line": line_number, "error": str(e), "record": record})
+            continue
+        parsed.append((line_number, record, arguments))
+
+    outcomes = None
+    if columnar and parsed:
+        try:
+            outputs = function(*(list(column) for column in zip(*(arguments for _, _, arguments in parsed))))
+            outcomes = [(entry, output, None) for entry, output in zip(parsed, outputs)]
+        except (ArithmeticError, ValueError):
+            pass    # a bad row fails the whole column call, so the chunk is redone below one row at a time
+    if outcomes is None:
+        outcomes = []
+        for entry in parsed:
+            try:
+                output = function(*([argument] for argument in entry[2]))[0] if columnar else function(*entry[2])
+                outcomes.append((entry, output, None))
+            except (ArithmeticError, ValueError) as e:
+                outcomes.append((entry, None, str(e)))
+
+    for (line_number, record, _), output, error in outcomes:
+        if error is not None:
+            rejects.append({"line": line_number, "error": error, "record": record})
+            continue
+        row = {"line": line_number}
+        if "id" in record:
+            row["id"] = record["id"]
+        row.update(output._asdict() if result_name is None else {result_name: output})
+        results.append(row)
+    return results, rejects
+
+# Streaming Batch Runner
+def run_batch(calculator, input_path, output_path, rejects_path=None, chunk_size=10_000):
+    """
+    Streams a CSV or JSONL file of instruments through one of the pure calculators, chunk by chunk, so memory
+    stays flat whatever the file size. Rates in the file are decimals (0.05 for 5%) and cash flows go in a
+    "cashflows" field. Results stream to output_path (CSV or JSONL, by extension) keyed by input line
+    number and "id" when present; rows that cannot be parsed or computed go to the JSONL reject file.
+    :param calculator: One of price, maturity, current_yield, ytm, duration, irr, payback or recovery.
+    :param rejects_path: Reject file, output_path + ".rejects.jsonl" by default.
+    :return: A BatchSummary with the number of rows written, rejected and the elapsed time.
+    """
+    if calculator not in _BATCH_CALCULATORS:
+        raise ValueError(f"Unknown calculator '{calculator}'. Choose from: {', '.join(_BATCH_CALCULATORS)}.")
+    if rejects_path is None:
+        rejects_path = output_path + ".rejects.jsonl"
+    for_csv = not output_path.endswith((".jsonl", ".ndjson", ".json"))
+    start = time.perf_counter()
+    processed = rejected = 0
+    writer = None
+    with open(output_path, "w", newline="", encoding="utf-8") as output, \
+            open(rejects_path, "w", encoding="utf-8") as reject_file:
+        for chunk in _chunked(_read_batch_records(input_path), chunk_size):
+            results, rejects = _process_batch_chunk(calculator, chunk)
+            for row in results:
+                row = {key: _batch_output_value(value, for_csv) for key, value in row.items()}
+                if not for_csv:
+                    output.write(json.dumps(row) + "\n")
+                    continue
+                if writer is None:
+                    writer = csv.DictWriter(output, fieldnames=list(row), extrasaction="ignore")
+                    writer.writeheader()
+                writer.writerow(row)
+            for reject in rejects:
+                reject_file.write(json.dumps(reject, default=str) + "\n")
+            processed += len(results)
+            rejected += len(rejects)
+    return BatchSummary(processed, rejected, time.perf_counter() - start)
+
+# --------------------- PARALLEL SOLVING ---------------------
+
+# Outcome of one row of a parallel solve job
+class RowResult(NamedTuple):
+    result: object      # YTMResult or IRRResult, None when the row failed
+    error: str          # Error message for the row, None when it was solved
+
+def _write_solve_inputs(kind, inputs, handle):
+    """
+    Writes the inputs of a solve job to a binary file that workers memory-map instead of receiving
+    pickled rows. YTM jobs are stored as four float64 columns; IRR jobs as n + 1 int64 row offsets
+    followed by every cash flow as float64.
+    :return: The number of rows written.
+    """
+    if kind == "ytm":
+        columns = [array("d", column) for column in inputs]
+        if len({len(column) for column in columns}) != 1:
+            raise ValueError("All input columns must have the same length.")
+        for column in columns:
+            column.tofile(handle)
+        return len(columns[0])
+    offsets, values = array("q", [0]), array("d")
+    for cashflows in inputs:
+        values.extend(float(cf) for cf in cashflows)
+        offsets.append(len(values))
+    offsets.tofile(handle)
+    values.tofile(handle)
+    return len(offsets) - 1
+
+def _solve_mapped_chunk(kind, path, rows, start, stop):
+    """
+    Worker entry point: memory-maps the job inputs and solves rows start to stop.
+    :return: A list of RowResult for those rows, in order.
+    """
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)
+        try:
+            if kind == "ytm":
+                doubles = view.cast("d")
+                columns = [doubles[i * rows + start:i * rows + stop].tolist() for i in range(4)]
+                doubles.release()
+                try:
+                    return [RowResult(result, None) for result in solve_ytm(*columns)]
+                except Exception:
+                    bonds = zip(*columns)
+            else:
+                offsets = view[:(rows + 1) * 8].cast("q")
+                doubles = view[(rows + 1) * 8:].cast("d")
+                bonds = [(doubles[offsets[i]:offsets[i + 1]].tolist(),) for i in range(start, stop)]
+                offsets.release()
+                doubles.release()
+        finally:
+            view.release()
+
+    solve = solve_ytm if kind == "ytm" else solve_irr
+    outcomes = []
+    for arguments in bonds:
+        try:
+            outcomes.append(RowResult(solve(*arguments), None))
+        except Exception as e:
+            outcomes.append(RowResult(None, f"{type(e).__name__}: {e}"))
+    return outcomes
+
+# Parallel YTM / IRR Solver
+def solve_parallel(kind, inputs, workers=None, chunk_size=None):
+    """
+    Splits a large YTM or IRR solve job into chunks across a process pool. Inputs are written once to a
+    temporary file that every worker memory-maps, so rows are never pickled one by one.
+    :param kind: "ytm" or "irr".
+    :param inputs: For "ytm", the columns (prices, face values, coupon rates, years to maturity); for
+    "irr", a list of cash-flow sequences of any length.
+    :param workers: Number of worker processes, os.cpu_count() by default.
+    :param chunk_size: Rows per task, by default enough for about four tasks per worker.
+    :return: A list of RowResult in input order, with an error message on every row that failed.
+    """
+    if kind not in ("ytm", "irr"):
+        raise ValueError("kind must be 'ytm' or 'irr'.")
+    workers = workers or os.cpu_count() or 1
+    handle = tempfile.NamedTemporaryFile(prefix="solve_", suffix=".bin", delete=False)
+    try:
+        with handle:
+            rows = _write_solve_inputs(kind, inputs, handle)
+        if rows == 0:
+            return []
+        chunk_size = chunk_size or max(1, -(-rows // (workers * 4)))
+        starts = range(0, rows, chunk_size)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(_solve_mapped_chunk, itertools.repeat(kind), itertools.repeat(handle.name),
+                              itertools.repeat(rows), starts, (min(start + chunk_size, rows) for start in starts))
+            return [outcome for chunk in chunks for outcome in chunk]
+    finally:
+        os.remove(handle.name)
+
+# --------------------- BENCHMARKS ---------------------
+
+def _bond_price_by_periods(face_value, coupon_rate, market_rate, years_to_maturity):
+    """
+    Reference implementation of the original per-period bond price loop, kept for benchmarking.
+    """
+    coupon_payment = face_value * coupon_rate
+    coupon_pv = sum(coupon_payment / (1 + market_rate) ** t for t in range(1, years_to_maturity + 1))
+    return coupon_pv + face_value / (1 + market_rate) ** years_to_maturity
+
+def _ytm_by_bisection(bond_price, face_value, coupon_rate, years_to_maturity):
+    """
+    Reference implementation of the original bisection YTM search, kept for benchmarking.
+    :return: The yield and the number of bisection iterations, or (None, 0) when the range has no root.
+    """
+    coupon_payment = face_value * coupon_rate
+
+    def f(y):
+        total = sum(coupon_payment / ((1 + y) ** t) for t in range(1, years_to_maturity + 1))
+        total += face_value / ((1 + y) ** years_to_maturity)
+        return total - bond_price
+
+    low, high, iteration = 0.0001, 1.0, 0
+    if f(low) * f(high) > 0:
+        return None, 0
+    while high - low > 1e-6 and iteration < 10000:
+        mid = (low + high) / 2
+        if f(mid) == 0:
+            break
+        elif f(mid) * f(low) < 0:
+            high = mid
+        else:
+            low = mid
+        iteration += 1
+    return (low + high) / 2, iteration
+
+def _irr_by_bisection(cashflows):
+    """
+    Reference implementation of the original bisection IRR search over -99% to 100%, kept for benchmarking.
+    :return: The IRR, or None when the range has no sign change.
+    """
+    def npv(r):
+        return sum(cashflows[t] / ((1 + r) ** t) for t in range(len(cashflows)))
+
+    low, high, iteration = -0.99, 1.0, 0
+    if npv(low) * npv(high) > 0:
+        return None
+    while high - low > 1e-6 and iteration < 10000:
+        mid = (low + high) / 2
+        if npv(mid) == 0:
+            break
+        elif npv(mid) * npv(low) < 0:
+            high = mid
+        else:
+            low = mid
+        iteration += 1
+    return (low + high) / 2
+
+def _random_projects(size, seed=0, min_periods=3, max_periods=30):
+    """
+    Builds reproducible synthetic projects of mixed lengths: an initial investment followed by inflows.
+    :return: A ragged list of cash-flow lists.
+    """
+    rng = random.Random(seed)
+    projects = []
+    for _ in range(size):
+        periods = rng.randint(min_periods, max_periods)
+        investment = rng.uniform(500.0, 5000.0)
+        inflow = investment * rng.uniform(0.6, 2.5) / periods
+        projects.append([-investment] + [inflow * rng.uniform(0.5, 1.5) for _ in range(periods)])
+    return projects
+
+def _random_bond_book(size, seed=0):
+    """
+    Builds a reproducible synthetic bond book of the given size for the benchmarks.
+    :return: Face values, coupon rates, market rates and years to maturity as four lists.
+    """
+    rng = random.Random(seed)
+    faces = [rng.choice((100.0, 1000.0, 5000.0)) for _ in range(size)]
+    coupons = [rng.uniform(0.0, 0.1) for _ in range(size)]
+    rates = [rng.uniform(0.005, 0.1) for _ in range(size)]
+    years = [rng.randint(1, 30) for _ in range(size)]
+    return faces, coupons, rates, years
+
+def benchmark_bond_pricing(sizes=(1_000, 100_000, 1_000_000), seed=0):
+    """
+    Times the original per-period loop against price_bonds on synthetic bond books.
+    :param sizes: Number of bonds in each book.
+    :return: A list of (size, loop seconds, price_bonds seconds) tuples, also printed as a table.
+    """
+    results = []
+    for size in sizes:
+        faces, coupons, rates, years = _random_bond_book(size, seed)
+        start = time.perf_counter()
+        for bond in zip(faces, coupons, rates, years):
+            _bond_price_by_periods(*bond)
+        loop_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        price_bonds(faces, coupons, rates, years)
+        batch_seconds = time.perf_counter() - start
+        results.append((size, loop_seconds, batch_seconds))
+        print(f"{size:>10,} bonds | loop {loop_seconds:9.3f}s | price_bonds {batch_seconds:9.3f}s"
+              f" | {loop_seconds / batch_seconds:6.1f}x")
+    return results
+
+def benchmark_ytm_solver(sizes=(1_000, 10_000), seed=0):
+    """
+    Times the original bisection search against the batch solve_ytm on synthetic bond books, where the
+    quoted prices come from price_bonds so every bond has a known yield.
+    :return: A list of (size, bisection seconds, solve_ytm seconds, mean solve_ytm iterations) tuples.
+    """
+    results = []
+    for size in sizes:
+        faces, coupons, rates, years = _random_bond_book(size, seed)
+        prices = price_bonds(faces, coupons, rates, years)
+        start = time.perf_counter()
+        for bond in zip(prices, faces, coupons, years):
+            _ytm_by_bisection(*bond)
+        bisection_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        solved = solve_ytm(prices, faces, coupons, years)
+        newton_seconds = time.perf_counter() - start
+        mean_iterations = sum(result.iterations for result in solved) / size
+        results.append((size, bisection_seconds, newton_seconds, mean_iterations))
+        print(f"{size:>10,} bonds | bisection {bisection_seconds:9.3f}s | solve_ytm {newton_seconds:9.3f}s"
+              f" | {bisection_seconds / newton_seconds:6.1f}x | {mean_iterations:.1f} iterations/bond")
+    return results
 
-        # CREATE A FUNCTION THAT MODIFIES THE CURRENT STATE OF THE GAME BOARD
-        def modgameboard(num, symbol):
-            """
-            Allows for the game board to be modified after each input, adjusting for the 0 based indexing that python uses
-            for lists and arrays. It will substitute the cell with its current value with the symbol that made the move and
-            introduced a valid input for one of the categories.
-            :param num: Number in the array (from 1 to 9) that will be modified according to the player to cell dictionary.
-            :param symbol: 'X' or 'O' depending on the team that made the move and introduced a valid input for one of the category.
-            :return: The updated game board with the modified cell after each move, but it does not print the current state of the board
-            after it has been modified by this function.
-            """
-            nonlocal gameBoard  # Imports the Game board into this specific function
-            num -= 1  # Adjust for 0-based indexing
-            if num == 0:
-                gameBoard[0][0] = symbol
-            elif num == 1:
-                gameBoard[0][1] = symbol
-            elif num == 2:
-                gameBoard[0][2] = symbol
-            elif num == 3:
-                gameBoard[1][0] = symbol
-            elif num == 4:
-                gameBoard[1][1] = symbol
-            elif num == 5:
-                gameBoard[1][2] = symbol
-            elif num == 6:
-                gameBoard[2][0] = symbol
-            elif num == 7:
-                gameBoard[2][1] = symbol
-            elif num == 8:
-                gameBoard[2][2] = symbol
+def benchmark_irr_solver(sizes=(1_000, 10_000), seed=0):
+    """
+    Measures IRR throughput (projects per second) of the original bisection against solve_irr_batch on
+    synthetic projects of 3 to 30 periods.
+    :return: A list of (size, bisection projects/s, solve_irr_batch projects/s) tuples.
+    """
+    results = []
+    for size in sizes:
+        projects = _random_projects(size, seed)
+        start = time.perf_counter()
+        for cashflows in projects:
+            _irr_by_bisection(cashflows)
+        bisection_rate = size / (time.perf_counter() - start)
+        start = time.perf_counter()
+        solve_irr_batch(projects)
+        batch_rate = size / (time.perf_counter() - start)
+        results.append((size, bisection_rate, batch_rate))
+        print(f"{size:>10,} projects | bisection {bisection_rate:12,.0f}/s | solve_irr_batch {batch_rate:12,.0f}/s"
+              f" | {batch_rate / bisection_rate:6.1f}x")
+    return results
 
-        # CREATE A FUNCTION THAT PRINTS THE RESULT OF THE GAME
-        def declare_winner(symbol):
-            """
-            This function declares the winner of the game, it severs a complementary purpose to the checkwin function.
-            :param symbol: 'X' or 'O' depending on the team that won the game.
-            :return: A f string with the team that has won the game of tic-tac-toe
-            """
-            nonlocal endloop  # Imports endloop into this specific function
-            if symbol == home_team:
-                print(f"Incredible! {Team_1} has scored a game winning goal!")
-                print(f"{Team_1} has won the championship with an incredible performance!")
-            elif symbol == away_team:
-                print(f"Incredible! {Team_2} has scored a game winning goal!")
-                print(f"{Team_2} has won the championship with an incredible performance!")
-            endloop = True
-            printboard()
+def benchmark_core_calls(number=100_000):
+    """
+    Measures the per-call overhead of the pure calculators, the cost of one call from a tight loop.
+    :param number: Calls timed per calculator.
+    :return: A dict of calculator name to microseconds per call.
+    """
+    cashflows = [-1000.0, 300.0, 400.0, 500.0]
+    calls = {
+        "price_bonds": lambda: price_bonds(1000.0, 0.05, 0.04, 10),
+        "perpetuity_price": lambda: perpetuity_price(100.0, 5.0),
+        "compute_maturity_value": lambda: compute_maturity_value(1000.0, 0.05, 10, 0.04),
+        "compute_current_yield": lambda: compute_current_yield(1000.0, 0.05, 950.0),
+        "solve_ytm": lambda: solve_ytm(950.0, 1000.0, 0.05, 10),
+        "compute_duration": lambda: compute_duration(1000.0, 0.05, 10, 0.04),
+        "solve_irr": lambda: solve_irr(cashflows),
+        "compute_payback_period": lambda: compute_payback_period(cashflows),
+        "compute_recovery_value": lambda: compute_recovery_value(5000.0, 0.05, 0.2),
+    }
+    results = {}
+    for name, call in calls.items():
+        seconds = min(timeit.repeat(call, number=number, repeat=3))
+        results[name] = seconds / number * 1e6
+        print(f"{name:<24} {results[name]:8.2f} us/call")
+    return results
 
-        # CREATE A COMPLEMENTARY FUNCTION TO THE PREVIOUS ONE THAT RUNS THE WHOLE LOGIC OF WHO HAS WON
-        def checkwin(board):
-            """
-            Creates the logic behind checking the winner of the game, this functions analyzes the current state of the
-            game board and determines if there is a winner and who it is or if the game is a tie. It checks for that condition
-            by comparing the cells to each other and seeing the symbol that they have assigned, if there are three of the same
-            symbol in a straight line, it declares the winner. This is a simplified version of the function from the preliminary
-            versions, as it now checks for the content of the cells and lets other function handle the result of the game, it does
-            not check for every single possibility that there is for both players to determine the winner
-            :param board: The current state of the tic-tac-toe game board.
-            :return: The result of the game, but it does not print the team that won or if there was a tie
-            """
-            nonlocal endloop  # Imports endloop into the function
-            # Check rows
-            if board[0][0] == board[0][1] == board[0][2]:
-                declare_winner(board[0][0])
-            elif board[1][0] == board[1][1] == board[1][2]:
-                declare_winner(board[1][0])
-            elif board[2][0] == board[2][1] == board[2][2]:
-                declare_winner(board[2][0])
-            # Check columns
-            elif board[0][0] == board[1][0] == board[2][0]:
-                declare_winner(board[0][0])
-            elif board[0][1] == board[1][1] == board[2][1]:
-                declare_winner(board[0][1])
-            elif board[0][2] == board[1][2] == board[2][2]:
-                declare_winner(board[0][2])
-            # Check diagonals
-            elif board[0][0] == board[1][1] == board[2][2]:
-                declare_winner(board[0][0])
-            elif board[2][0] == board[1][1] == board[0][2]:
-                declare_winner(board[2][0])
+def benchmark_parallel_solver(size=20_000, worker_counts=(1, 2, 4, 8, 16), seed=0):
+    """
+    Measures how solve_parallel scales with the number of worker processes on a YTM job and an IRR job
+    of the same size.
+    :return: A list of (workers, YTM seconds, IRR seconds) tuples.
+    """
+    faces, coupons, rates, years = _random_bond_book(size, seed)
+    prices = price_bonds(faces, coupons, rates, years)
+    projects = _random_projects(size, seed)
+    results = []
+    for workers in worker_counts:
+        start = time.perf_counter()
+        solve_parallel("ytm", (prices, faces, coupons, years), workers)
+        ytm_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        solve_parallel("irr", projects, workers)
+        irr_seconds = time.perf_counter() - start
+        results.append((workers, ytm_seconds, irr_seconds))
+        print(f"{workers:>3} workers | {size:,} YTM solves {ytm_seconds:8.3f}s | {size:,} IRR solves {irr_seconds:8.3f}s")
+    return results
 
-        # CREATE THE TURN LOGIC FOR THE GAME
-        while endloop == False and Count_Turns < 9:
-            # Logic for knowing which is the team in control of the turn
-            printboard()
-            if Count_Turns % 2 == 0:
-                current_team = Team_1  # Sets the team that is in charge during that turn
-                symbol = home_team
-            else:
-                current_team = Team_2
-                symbol = away_team
-            player_name = input(f"\n{current_team}, pick a player to try and score (The format must be 'Sergio Ramos' or 'Ramos) or type exit to quit: ").strip()# The function strip eliminates all the useless spaces to be able to compare the names directly to the dictionary
-            if player_name.lower() == "exit":
-                print("Exiting game. Goodbye!")
-                endloop = True
-                break
-            # Check if the player picked is within the options in the dictionary
-            if player_name not in player_to_cell:
-                print("That player is not available for the game!. Choose another option")
-                continue
-            # Check that the player is picking an available cell, one that has not been used by the opponent
-            chosen_cell = player_to_cell[player_name]
-            if chosen_cell not in available_positions:
-                print(
-                    f"That position {player_name} is already taken, a player has been used from there. Choose another cell.")
-                continue
-            # Modify the current state of the game board according to the input received, also checks if there has been a winning goal
-            modgameboard(chosen_cell, symbol)
-            available_positions.remove(chosen_cell)
-            print(f"Incredible! {player_name} has scored an amazing goal for {current_team}!")
-            checkwin(gameBoard)
-            Count_Turns += 1
+def benchmark_yield_curve(sizes=(1_000, 100_000), seed=0):
+    """
+    Times yield-curve construction (bootstrapping a 30-year curve from par yields) separately from
+    pricing bond books against the finished curve.
+    :return: A dict with the construction time per method and (size, seconds) pricing times.
+    """
+    tenors = [1, 2, 3, 5, 7, 10, 20, 30]
+    par_yields = [0.035, 0.037, 0.038, 0.040, 0.041, 0.043, 0.046, 0.047]
+    results = {"construction": {}, "pricing": []}
+    for method in ("linear", "cubic"):
+        start = time.perf_counter()
+        for _ in range(100):
+            YieldCurve.from_par_yields(tenors, par_yields, method)
+        seconds = (time.perf_counter() - start) / 100
+        results["construction"][method] = seconds
+        print(f"{method:>6} curve construction {seconds * 1e6:10.1f} us")
+    curve = YieldCurve.from_par_yields(tenors, par_yields, "cubic")
+    for size in sizes:
+        faces, coupons, _, years = _random_bond_book(size, seed)
+        start = time.perf_counter()
+        curve.price_bonds(faces, coupons, years)
+        seconds = time.perf_counter() - start
+        results["pricing"].append((size, seconds))
+        print(f"{size:>10,} bonds priced on the curve in {seconds:8.3f}s ({seconds / size * 1e9:6.0f} ns/bond)")
+    return results
 
-        if not endloop:
-            print("It's a tie!")
-            printboard()
+def benchmark_scenarios(bonds=2_000, scenario_count=200, seed=0):
+    """
+    Times run_scenarios against repricing every bond from scratch, coupon by coupon, under each scenario.
+    :return: (from-scratch seconds, run_scenarios seconds).
+    """
+    curve = YieldCurve.from_par_yields([1, 2, 3, 5, 7, 10, 20, 30],
+                                       [0.035, 0.037, 0.038, 0.040, 0.041, 0.043, 0.046, 0.047], "cubic")
+    faces, coupons, _, years = _random_bond_book(bonds, seed)
+    rng = random.Random(seed)
+    scenarios = [twist_scenario(curve, rng.uniform(-0.02, 0.02), rng.uniform(-0.02, 0.02))
+                 for _ in range(scenario_count)]
+    start = time.perf_counter()
+    for shifts in scenarios:
+        zeros = [curve.grid_discount_factors[year] ** (-1 / year) - 1 + shift for year, shift in enumerate(shifts, 1)]
+        for face_value, coupon, maturity in zip(faces, coupons, years):
+            sum(face_value * coupon / (1 + zeros[t - 1]) ** t for t in range(1, maturity + 1)) \
+                + face_value / (1 + zeros[maturity - 1]) ** maturity
+    scratch_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    run_scenarios(curve, faces, coupons, years, scenarios)
+    engine_seconds = time.perf_counter() - start
+    print(f"{bonds:,} bonds x {scenario_count} scenarios | from scratch {scratch_seconds:8.3f}s"
+          f" | run_scenarios (with DV01, convexity, KRDs) {engine_seconds:8.3f}s"
+          f" | {scratch_seconds / engine_seconds:6.1f}x")
+    return scratch_seconds, engine_seconds
 
-    # MAIN MENU for choosing the games
+def benchmark_monte_carlo(path_counts=(1_000, 10_000, 100_000), years=5, steps_per_year=12, seed=0):
+    """
+    Convergence against time for the Monte Carlo pricer on a Vasicek zero-coupon bond, where the exact
+    price is known, with and without antithetic variates.
+    :return: A list of (paths, antithetic, seconds, absolute error, standard error) tuples.
+    """
+    parameters = dict(r0=0.03, speed=0.2, mean=0.04, volatility=0.01)
+    exact = 100 * _vasicek_zero_coupon_price(maturity=years, **parameters)
+    results = []
+    for paths in path_counts:
+        for antithetic in (False, True):
+            start = time.perf_counter()
+            result = monte_carlo_bond_prices(100.0, 0.0, years, "vasicek", paths=paths, steps_per_year=steps_per_year,
+                                             seed=seed, antithetic=antithetic, **parameters)
+            seconds = time.perf_counter() - start
+            error = abs(result.price - exact)
+            results.append((paths, antithetic, seconds, error, result.std_error))
+            print(f"{paths:>9,} paths | antithetic {str(antithetic):<5} | {seconds:8.3f}s"
+                  f" | error {error:.5f} | std error {result.std_error:.5f}")
+    return results
 
-    print("Choose a game configuration:")
-    print("1: Game 1")
-    print("2: Game 2")
-    print("3: Game 3")
-    print("4: Game 4")
-    choice = input("Enter the number of the game you want to play: ").strip()
-    if choice == "1":
-        row_labels, col_labels, player_to_cell = config_game1()
-    elif choice == "2":
-        row_labels, col_labels, player_to_cell = config_game2()
-    elif choice == "3":
-        row_labels, col_labels, player_to_cell = config_game3()
-    elif choice == "4":
-        row_labels, col_labels, player_to_cell = config_game4()
-    else:
-        print("Invalid choice. Defaulting to Game 1.")
-        row_labels, col_labels, player_to_cell = config_game1()
-    Team_1 = input("Team 1's name is: ")
-    Team_2 = input("Team 2's name is: ")
-    print(f"Let the championship final between {Team_1} and {Team_2} begin!")
-    play_game(Team_1, Team_2, row_labels, col_labels, player_to_cell)
+def benchmark_coupon_schedules(bonds=100_000, templates=500, seed=0):
+    """
+    Times coupon-schedule generation for a bond book whose bonds share a limited number of templates,
+    building every schedule from scratch against the cached coupon_schedule.
+    :return: (uncached seconds, cached seconds).
+    """
+    rng = random.Random(seed)
+    shapes = []
+    for _ in range(templates):
+        issue = date(rng.randint(2000, 2020), rng.randint(1, 12), rng.choice((1, 15, 28)))
+        shapes.append((issue, _add_months(issue, 12 * rng.randint(2, 30)), rng.choice((1, 2, 4)),
+                       rng.choice(DAY_COUNT_CONVENTIONS)))
+    book = [rng.choice(shapes) for _ in range(bonds)]
+    start = time.perf_counter()
+    for template in book:
+        coupon_schedule.__wrapped__(*template)
+    uncached_seconds = time.perf_counter() - start
+    coupon_schedule.cache_clear()
+    start = time.perf_counter()
+    for template in book:
+        coupon_schedule(*template)
+    cached_seconds = time.perf_counter() - start
+    print(f"{bonds:,} bonds over {templates} templates | uncached {uncached_seconds:8.3f}s"
+          f" | cached {cached_seconds:8.3f}s | {uncached_seconds / cached_seconds:6.1f}x")
+    return uncached_seconds, cached_seconds
 
-def tenaball():
-    barcelona_signings = ["Philippe Coutinho", "Ousmane Dembele", "Antoine Griezmann", "Neymar Jr", "Frenkie de Jong",
-                          "Luis Suarez", "Zlatan Ibrahimovic", "Miralem Pjanic", "Raphinha", "Dani Olmo"]
+def benchmark_cash_flow_ledger(periods=10_000, rate=0.08, sampled_queries=50, seed=0):
+    """
+    Appends a long cash-flow series one period at a time and queries NPV, IRR and payback after every
+    append, comparing CashFlowLedger with recomputing everything from the full list. Full recomputation is
+    timed on the last sampled_queries appends, where the series is longest.
+    :return: (full recomputation microseconds per update, ledger microseconds per update).
+    """
+    rng = random.Random(seed)
+    flows = [-periods * 50.0] + [rng.uniform(0.0, 120.0) for _ in range(periods - 1)]
+    ledger = CashFlowLedger()
+    ledger.track_rate(rate)
+    start = time.perf_counter()
+    for cf in flows:
+        ledger.append(cf)
+        ledger.npv(rate)
+        ledger.irr()
+        ledger.payback_period()
+    ledger_us = (time.perf_counter() - start) / periods * 1e6
+    start = time.perf_counter()
+    for end in range(periods - sampled_queries, periods):
+        series = flows[:end + 1]
+        _npv(series, rate)
+        solve_irr(series)
+        compute_payback_period(series)
+    full_us = (time.perf_counter() - start) / sampled_queries * 1e6
+    print(f"{periods:,} periods | full recomputation {full_us:12,.1f} us/update"
+          f" | CashFlowLedger {ledger_us:10,.1f} us/update | {full_us / ledger_us:6.1f}x")
+    return full_us, ledger_us
 
-    # most appearances with keeper David de Gea
+def benchmark_payback(sizes=(10_000, 100_000), discount_rate=0.08, seed=0):
+    """
+    Throughput (projects per second) of payback_periods against looping the original payback calculation
+    over each project, for simple payback and for discounted payback (where the loop recomputes
+    (1 + r)^t for every project).
+    :return: A list of (size, loop simple/s, batch simple/s, loop discounted/s, batch discounted/s) tuples.
+    """
+    results = []
+    for size in sizes:
+        projects = _random_projects(size, seed)
+        start = time.perf_counter()
+        for cashflows in projects:
+            compute_payback_period(cashflows)
+        loop_simple = size / (time.perf_counter() - start)
+        start = time.perf_counter()
+        payback_periods(projects)
+        batch_simple = size / (time.perf_counter() - start)
+        start = time.perf_counter()
+        for cashflows in projects:
+            compute_payback_period([cf / (1 + discount_rate) ** t for t, cf in enumerate(cashflows)])
+        loop_discounted = size / (time.perf_counter() - start)
+        start = time.perf_counter()
+        payback_periods(projects, discount_rate)
+        batch_discounted = size / (time.perf_counter() - start)
+        results.append((size, loop_simple, batch_simple, loop_discounted, batch_discounted))
+        print(f"{size:>9,} projects | simple: loop {loop_simple:11,.0f}/s, batch {batch_simple:11,.0f}/s"
+              f" | discounted: loop {loop_discounted:11,.0f}/s, batch {batch_discounted:11,.0f}/s")
+    return results
 
-    degea_app = ["Marcus Rashford", "Chris Smalling", "Anthony Martial", "Juan Mata", "Antonio Valencia",
-                 "Ashley Young", "Luke Shaw", "Wayne Rooney", "Phil Jones", "Victor Lindelof"]
+def benchmark_asset_register(rows=300_000, seed=0):
+    """
+    Writes a synthetic asset register to a temporary CSV and times loading it into an AssetRegister and
+    aggregating it by group, against reading it as a list of dicts and aggregating row by row. Peak
+    Python memory of each approach is measured with tracemalloc.
+    :return: A dict with seconds and peak bytes for both approaches.
+    """
+    rng = random.Random(seed)
+    jurisdictions = [f"J{i:02d}" for i in range(40)]
+    tax_rates = {name: rng.uniform(0.1, 0.35) for name in jurisdictions}
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["asset_id", "salvage_value", "selling_cost", "tax_rate", "jurisdiction", "category"])
+        for asset in range(rows):
+            writer.writerow([asset, round(rng.uniform(100, 100_000), 2), round(rng.uniform(0, 0.1), 4),
+                             round(rng.uniform(0.1, 0.3), 4) if rng.random() < 0.3 else "",
+                             rng.choice(jurisdictions), rng.choice(("IT", "VEHICLE", "PLANT", "PROPERTY"))])
+    def columnar():
+        return AssetRegister.from_csv(handle.name, group_by="category").aggregate(tax_rates)
 
-    # most combined games for Real Madrid and Juventus
+    def dicts():
+        with open(handle.name, newline="") as source:
+            records = list(csv.DictReader(source))
+        totals = {}
+        for record in records:
+            rate = float(record["tax_rate"]) if record["tax_rate"] else tax_rates[record["jurisdiction"]]
+            net = compute_recovery_value(float(record["salvage_value"]), float(record["selling_cost"]), rate)
+            totals[record["category"]] = totals.get(record["category"], 0.0) + net
+        return totals
 
-    juve_real = ["Cristiano Ronaldo", "Zinedine Zidane", "Gonzalo Higuain", "Alvaro Morata", "Sami Khedira", "Danilo",
-                 "Fabio Cannavaro", "Di Maria", "Emerson", "Micheal Laudrup"]
+    results = {}
+    try:
+        for name, approach in (("columnar", columnar), ("dicts", dicts)):
+            start = time.perf_counter()
+            approach()
+            seconds = time.perf_counter() - start
+            tracemalloc.start()
+            approach()
+            results[name] = (seconds, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+    finally:
+        os.remove(handle.name)
+    for name, (seconds, peak) in results.items():
+        print(f"{rows:,} assets | {name:<8} {seconds:8.3f}s | peak {peak / 2 ** 20:8.1f} MiB")
+    return results
 
-    # most spanish national team appearances
+def benchmark_annuity_grid(sides=(10, 50, 100)):
+    """
+    Times a payments x rates x growth sensitivity grid of growing annuities valued with one
+    sensitivity_grid call, against nested Python loops calling the scalar function point by point.
+    :return: A dict of grid size -> (grid seconds, loop seconds).
+    """
+    results = {}
+    for side in sides:
+        payments = [50 + 10 * i for i in range(side)]
+        rates = [-2 + 12 * i / side for i in range(side)]
+        growths = [-1 + 5 * i / side for i in range(side)]
 
-    spain_app = ["Sergio Ramos", "Iker Casillas", "Sergio Busquets", "Xavi", "Andres Iniesta", "Andoni Zubizarreta",
-                 "David Silva", "Xabi Alonso", "Fernando Torres", "Cesc Fabregas"]
+        start = time.perf_counter()
+        sensitivity_grid(growing_annuity_price, payment=payments, discount_rate_percent=rates,
+                         growth_rate_percent=growths, periods=[20])
+        grid_seconds = time.perf_counter() - start
 
-    # highest alltime goalscorers
+        start = time.perf_counter()
+        table = [[[growing_annuity_price(payment, rate, growth, 20) for growth in growths] for rate in rates]
+                 for payment in payments]
+        loop_seconds = time.perf_counter() - start
 
-    top_goals = ["Cristiano Ronaldo", "Lionel Messi", "Pele", "Romario", "Ferenc Puskas", "Josef Bican",
-                 "Robert Lewandowski", "Jimmy Jones", "Gerd Muller", "Joe Bambrick"]
+        results[side ** 3] = (grid_seconds, loop_seconds)
+        print(f"{side ** 3:>9,} points | grid {grid_seconds:7.3f}s | nested loops {loop_seconds:7.3f}s")
+    return results
 
-    # most appearances with teammate Antony
+def benchmark_result_cache(queries=20_000, distinct_bonds=200, seed=0):
+    """
+    Replays a stream of YTM queries drawn from a small set of benchmark bonds, as many desks pricing the
+    same bonds would, through solve_ytm directly and through a ResultCache.
+    :return: A dict with seconds for both runs and the cache's CacheStats.
+    """
+    rng = random.Random(seed)
+    book = [(round(rng.uniform(800, 1200), 2), 1000.0, round(rng.uniform(0.01, 0.08), 4), rng.randint(1, 30))
+            for _ in range(distinct_bonds)]
+    stream = [rng.choice(book) for _ in range(queries)]
+    cache = ResultCache(maxsize=distinct_bonds)
 
-    antony_app = ["Lisandro Martinez", "Bruno Fernandes", "Dusan Tadic", "Andre Onana", "Diogo Dalot",
-                  "Ryan Gravenberch", "Casemiro", "Davy Klaassen", "Daley Blind", "Edson Alvarez"]
+    start = time.perf_counter()
+    for bond in stream:
+        solve_ytm(*bond)
+    direct_seconds = time.perf_counter() - start
 
-    # most used players by coach Carlo Ancelotti at Real Madrid
+    start = time.perf_counter()
+    for bond in stream:
+        cache.call(solve_ytm, *bond)
+    cached_seconds = time.perf_counter() - start
 
-    ancelotti_used = ["Luka Modric", "Dani Carvajal", "Karim Benzema", "Federico Valverde", "Toni Kroos",
-                      "Vinicius Junior", "Thibaut Courtois", "Rodrygo", "Antonio Rudiger", "Nacho Fernandez"]
+    stats = cache.stats()
+    print(f"{queries:,} queries over {distinct_bonds} bonds | direct {direct_seconds:.3f}s | "
+          f"cached {cached_seconds:.3f}s | hits {stats.hits:,} misses {stats.misses:,} evictions {stats.evictions:,}")
+    return {"direct": direct_seconds, "cached": cached_seconds, "stats": stats}
 
-    # most used players by coach Luis Suarez at Fc Barcelona
+def benchmark_finance_suite(min_seconds=0.2, json_path=None, seed=0):
+    """
+    Times every finance calculator on representative inputs. Each case is auto-ranged until one round
+    takes at least min_seconds, then the best of three rounds is kept, as a benchmark runner would.
+    :param json_path: Optional file to write the results to, for comparing runs.
+    :return: A dict of calculator name to microseconds per call.
+    """
+    rng = random.Random(seed)
+    cashflows = [-1000.0, 300.0, 400.0, 500.0]
+    projects = _random_projects(100, seed)
+    curve = YieldCurve([1, 2, 5, 10, 30], [0.03, 0.032, 0.035, 0.038, 0.04], method="cubic")
+    book = [[1000.0] * 100, [rng.uniform(0.01, 0.08) for _ in range(100)], [rng.uniform(0.01, 0.08) for _ in range(100)],
+            [rng.randint(1, 30) for _ in range(100)]]
+    ledger = CashFlowLedger(cashflows * 25)
+    cases = {
+        "price_bonds": lambda: price_bonds(1000.0, 0.05, 0.04, 10),
+        "price_bonds[100]": lambda: price_bonds(*book),
+        "perpetuity_price": lambda: perpetuity_price(100.0, 5.0),
+        "growing_perpetuity_price": lambda: growing_perpetuity_price(100.0, 5.0, 2.0),
+        "annuity_price": lambda: annuity_price(100.0, 5.0, 10),
+        "growing_annuity_price": lambda: growing_annuity_price(100.0, 5.0, 2.0, 10),
+        "annuity_due_price": lambda: annuity_due_price(100.0, 5.0, 10),
+        "compute_maturity_value": lambda: compute_maturity_value(1000.0, 0.05, 10, 0.04),
+        "compute_current_yield": lambda: compute_current_yield(1000.0, 0.05, 950.0),
+        "solve_ytm": lambda: solve_ytm(950.0, 1000.0, 0.05, 10),
+        "compute_duration": lambda: compute_duration(1000.0, 0.05, 10, 0.04),
+        "YieldCurve.price_bonds[100]": lambda: curve.price_bonds(book[0], book[1], book[3]),
+        "run_scenarios": lambda: run_scenarios(curve, book[0][:10], book[1][:10], book[3][:10],
+                                               [parallel_scenario(curve, 0.01)]),
+        "monte_carlo_bond_prices": lambda: monte_carlo_bond_prices(1000.0, 0.05, 5, paths=500, seed=seed),
+        "price_dated_bond": lambda: price_dated_bond(1000.0, 0.05, 0.04, date(2025, 3, 14), date(2035, 6, 30)),
+        "solve_irr": lambda: solve_irr(cashflows),
+        "solve_irr_batch[100]": lambda: solve_irr_batch(projects),
+        "compute_payback_period": lambda: compute_payback_period(cashflows),
+        "payback_periods[100]": lambda: payback_periods(projects, 0.08),
+        "CashFlowLedger.edit+irr": lambda: (ledger.edit(50, rng.uniform(-1200, -800)), ledger.irr()),
+        "compute_recovery_value": lambda: compute_recovery_value(5000.0, 0.05, 0.2),
+    }
+    results = {}
+    for name, case in cases.items():
+        timer = timeit.Timer(case)
+        number, seconds = timer.autorange()
+        while seconds < min_seconds:
+            number *= 2
+            seconds = timer.timeit(number)
+        results[name] = min(timer.repeat(repeat=3, number=number)) / number * 1e6
+        print(f"{name:<28} {results[name]:12.2f} us/call")
+    if json_path is not None:
+        with open(json_path, "w") as handle:
+            json.dump(results, handle, indent=2)
+    return results
 
-    lEnrique_used = ["Lionel Messi", "Luis Suarez", "Neymar Jr", "Sergio Busquets", "Gerard Pique", "Javier Mascherano",
-                     "Ivan Rakitic", "Jordi Alba", "Andres Iniesta", "Ter Stegen"]
+def _list_board_self_play(games, seed=0):
+    """
+    Random self-play on the nested-list board with cell-by-cell line checks that Footy_tictactoe used
+    before bitboards, kept as the reference for benchmark_tictactoe_engine.
+    """
+    rng = random.Random(seed)
+    lines = ((0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (6, 4, 2))
+    results = [0, 0, 0]
+    for _ in range(games):
+        board = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        available_positions = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+        for turn in range(9):
+            cell = rng.choice(available_positions)
+            available_positions.remove(cell)
+            board[(cell - 1) // 3][(cell - 1) % 3] = "XO"[turn & 1]
+            flat = board[0] + board[1] + board[2]
+            if any(flat[a] == flat[b] == flat[c] for a, b, c in lines):
+                results[turn & 1] += 1
+                break
+        else:
+            results[2] += 1
+    return tuple(results)
 
-    manu_managers = ["Ruben Amorim", "Ruud Van Nistelrooy", "Ten Hag", "Ralf Rangnick", "Michael Carrick",
-                     "Ole Gunnar Solskjaer", "Jose Mourinho", "Louis Van Gaal", "Ryan Giggs", "David Moyes"]
+def benchmark_tictactoe_engine(games=200_000, seed=0):
+    """
+    Random self-play games per second on bitboards against the nested-list board.
+    :return: A dict of engine name -> games per second.
+    """
+    results = {}
+    for name, engine in (("bitboard", random_self_play), ("list board", _list_board_self_play)):
+        start = time.perf_counter()
+        outcome = engine(games, seed)
+        results[name] = games / (time.perf_counter() - start)
+        print(f"{name:<10} {results[name]:12,.0f} games/s | X wins {outcome[0]:,} O wins {outcome[1]:,} ties {outcome[2]:,}")
+    return results
 
-    ronaldo_assist = ["Karim Benzema", "Mesut Ozil", "Gareth Bale", "Di Maria", "Marcelo", "Ryan Giggs",
-                      "Gonzalo Higuain", "Isco", "Kaka", "Lucas Vazquez"]
+def benchmark_tictactoe_ai(positions=2_000, seed=0):
+    """
+    Times building the AI's transposition table from scratch and loading it back from a file, then the
+    move latency and nodes searched over random reachable positions.
+    :return: A dict with build and load seconds, table size, mean move microseconds and mean nodes per move.
+    """
+    start = time.perf_counter()
+    ai = TicTacToeAI.precomputed()
+    build_seconds = time.perf_counter() - start
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as handle:
+        path = handle.name
+    try:
+        ai.save(path)
+        start = time.perf_counter()
+        ai = TicTacToeAI.load(path)
+        load_seconds = time.perf_counter() - start
+    finally:
+        os.remove(path)
 
-    # Code to randomly choose the tenaball category and its list for the game
+    rng = random.Random(seed)
+    latencies, nodes = [], []
+    while len(latencies) < positions:
+        boards = [0, 0]
+        for turn in range(rng.randint(0, 7)):
+            boards[turn & 1] |= cell_bit(rng.choice(free_cells(*boards)))
+            if has_won(boards[turn & 1]):
+                break
+        else:
+            mover = boards[0].bit_count() > boards[1].bit_count()
+            move = ai.best_move(boards[mover], boards[1 - mover])
+            latencies.append(move.seconds)
+            nodes.append(move.nodes)
+    results = {"build_seconds": build_seconds, "load_seconds": load_seconds, "table_size": len(ai.table),
+               "move_us": statistics.fmean(latencies) * 1e6, "nodes_per_move": statistics.fmean(nodes)}
+    print(f"table of {results['table_size']:,} positions | built in {build_seconds * 1000:.1f} ms | "
+          f"loaded in {load_seconds * 1000:.1f} ms")
+    print(f"{positions:,} moves | {results['move_us']:.1f} us/move | {results['nodes_per_move']:.1f} nodes/move")
+    return results
 
-    random_tenaball, category = random.choice([
-        (barcelona_signings, "most expensive barça signings"),
-        (degea_app, "most appearances with teammate David de Gea"),
-        (juve_real, "players with the most combined appearances for Juventus and Real Madrid"),
-        (spain_app, "players with the most caps for the Spanish National Team"),
-        (top_goals, "all time goalscorers"),
-        (antony_app, "players with most appearances with teammate Antony"),
-        (ancelotti_used, "most used players by coach Ancelotti at Real Madrid"),
-        (lEnrique_used, "most used players by coach lEnrique at Fc Barcelona"),
-        (manu_managers, "managers to have coached Manchester United after Sir Alex Ferguson"),
-        (ronaldo_assist, "players that have provided the most assists to teammate Cristiano Ronaldo"),
-    ])
+def _random_player_names(size, seed=0):
+    """
+    Builds reproducible synthetic player names from a pool of first names and made-up surnames, some with
+    accents or a particle ("van", "de", ...).
+    """
+    rng = random.Random(seed)
+    syllables = [onset + vowel + coda for onset in ("b", "c", "d", "f", "g", "h", "j", "k", "l", "m", "n", "p", "r",
+                                                    "s", "t", "v", "z", "ch", "br", "gr", "st", "tr", "sh", "ll")
+                 for vowel in ("a", "e", "i", "o", "u", "á", "é", "í", "ó", "ü", "ei", "ou")
+                 for coda in ("", "", "", "n", "r", "s", "l", "z", "k")]
+    first_names = ["".join(rng.choices(syllables, k=2)).capitalize() for _ in range(400)]
+    particles = ["", "", "", "", "van ", "de ", "da ", "di "]
+    return [f"{rng.choice(first_names)} {rng.choice(particles)}"
+            f"{''.join(rng.choices(syllables, k=rng.randint(2, 3))).capitalize()}" for _ in range(size)]
 
-    # so that we can track how many the player has guessed
-    correct_answer = []
+def benchmark_name_index(size=100_000, lookups=2_000, seed=0):
+    """
+    Builds a PlayerNameIndex of size synthetic names and times exact, surname and misspelled lookups, against
+    linear scans of the folded names (a membership test for exact names, edit distances for misspelled ones).
+    :return: A dict with the build seconds and microseconds per lookup of each kind.
+    """
+    names = _random_player_names(size, seed)
+    start = time.perf_counter()
+    index = PlayerNameIndex((name, position) for position, name in enumerate(names))
+    build_seconds = time.perf_counter() - start
 
-    # object that defines the amount of lives you
-    lives = 3
+    rng = random.Random(seed)
+    sample = rng.sample(names, lookups)
 
-    # Scoreboard object so to substitute the name of the player by the question mark
-    reveal_ans = ["?" for _ in random_tenaball]
+    def misspell(name):
+        position = rng.randrange(len(name))
+        return name[:position] + rng.choice("aeiourst") + name[position + 1:]
 
-    # starting the game
-    print("Welcome to our Tenaball game mode")
-    play = input("Do you want to play or exit?")
-    # if player types exit it will. not run
-    if play == "exit":
-        print("Bye!")
-        return
+    queries = {
+        "exact": [name.upper() for name in sample],
+        "surname": [name.split(" ", 1)[1] for name in sample],
+        "one typo": [misspell(name) for name in sample],
+    }
+    results = {"build_seconds": build_seconds}
+    print(f"{size:,} names indexed in {build_seconds:.2f}s")
+    for kind, batch in queries.items():
+        start = time.perf_counter()
+        for query in batch:
+            index.lookup(query)
+        results[kind] = (time.perf_counter() - start) / len(batch) * 1e6
+        print(f"{kind:<12} {results[kind]:10.1f} us/lookup")
 
-    # anything else will start the game
-    else:
-        # will start a loop that will keep going as long as lives are not 0 or the amount of player guessed is less than 10
-        while lives > 0 and len(correct_answer) < 10:
-            print(f"\nYou have {lives} lives left")
+    folded = [fold_name(name) for name in names]
+    start = time.perf_counter()
+    for query in queries["exact"][:100]:
+        fold_name(query) in folded
+    results["linear exact"] = (time.perf_counter() - start) / 100 * 1e6
+    start = time.perf_counter()
+    for query in queries["one typo"][:5]:
+        key = fold_name(query)
+        min(folded, key=lambda name: _edit_distance(key, name, 2))
+    results["linear typo"] = (time.perf_counter() - start) / 5 * 1e6
+    for kind in ("linear exact", "linear typo"):
+        print(f"{kind:<12} {results[kind]:10.1f} us/lookup")
+    return results
 
-            # will print the tenaball tower which will allows the player to later see what position of the players he guessed
-            print("tenaball tower:")
-            for i, name in enumerate(reveal_ans, start=1):
-                print(f"{i}. {name}")
-            print(f"find the top 10 {category}")
+def benchmark_game_data(lineups=5_000, seed=0):
+    """
+    Times loading one record from the game data store cold (first use, index scan included) and warm (index
+    already built), against decoding every record up front, on the real store and on a synthetic store grown
+    to lineups Missing 11 lineups.
+    :return: A dict of store name -> (cold seconds, warm seconds, decode-all seconds).
+    """
+    rng = random.Random(seed)
+    names = _random_player_names(lineups * 11, seed)
+    positions = ["GK", "LB", "CB", "CB", "RB", "CM", "CM", "CM", "LW", "RW", "ST"]
+    with tempfile.NamedTemporaryFile("w", suffix=".tsv", delete=False, encoding="utf-8") as handle:
+        handle.write("game\tkey\tdata\n")
+        for team in range(lineups):
+            lineup = [[position, names[team * 11 + slot]] for slot, position in enumerate(positions)]
+            handle.write(f"missing11\tTeam {team}\t{json.dumps({'lineup': lineup}, ensure_ascii=False)}\n")
+    results = {}
+    try:
+        for name, path, game in (("game_data.tsv", GAME_DATA.path, "missing11"), (f"{lineups:,} lineups", handle.name, "missing11")):
+            start = time.perf_counter()
+            store = GameDataStore(path)
+            key = rng.choice(store.keys(game))
+            store.load(game, key)
+            cold = time.perf_counter() - start
 
-            player = input("Enter a player's full name: ")
+            start = time.perf_counter()
+            for key in rng.choices(store.keys(game), k=100):
+                store.load(game, key)
+            warm = (time.perf_counter() - start) / 100
 
-            # check if guessed player is in the top 10
-            if player in random_tenaball and player not in correct_answer:
-                # will define what position in the top 10 the player is in
-                position = random_tenaball.index(player) + 1
-                # will print what position in the top 10 the player is in
-                print(f"You guessed {player} correctly, he is number {position} on the list")
-                # will then add the correct player to the list by removing the question mark by the player name
-                reveal_ans[position - 1] = player
-                # adds the player in the list of correct answers so that we can see how many right players
-                # the user has guessed
-                correct_answer.append(player)
-                lives = 3
+            start = time.perf_counter()
+            with open(path, encoding="utf-8") as source:
+                next(source)
+                everything = [json.loads(line.split("\t", 2)[2]) for line in source]
+            decode_all = time.perf_counter() - start
 
-                # if player has already been guessed
-            elif player in correct_answer:
-                print("You already guessed that player")
-                # lives == lives
+            results[name] = (cold, warm, decode_all)
+            print(f"{name:<16} cold {cold * 1000:8.2f} ms | warm {warm * 1000:8.3f} ms | decode all {decode_all * 1000:8.2f} ms")
+    finally:
+        os.remove(handle.name)
+    return results
 
-                # if player is not on the list
-            else:
-                print(f"{player} is not on the list")
-                # removes a life
-                lives -= 1
+def _iter_random_roster(size, seed=0):
+    """
+    Yields a reproducible synthetic Footynator roster: teams belong to one league, nationalities lean towards
+    the league's country and ages run from 17 to 40, all stored as strings like the real roster.
+    """
+    rng = random.Random(seed)
+    nationalities = [f"Country {i}" for i in range(60)]
+    leagues = [(f"League {i}", [f"Team {i}-{j}" for j in range(20)], nationalities[i]) for i in range(20)]
+    positions = ["Goalkeeper", "Defender", "Midfielder", "Forward", "Winger"]
+    for name in _random_player_names(size, seed):
+        league, teams, home = rng.choice(leagues)
+        yield {"name": name, "league": league, "team": rng.choice(teams),
+               "position": rng.choices(positions, weights=(1, 4, 4, 3, 2))[0], "age": str(rng.randint(17, 40)),
+               "nationality": home if rng.random() < 0.6 else rng.choice(nationalities)}
 
-        # conditionalities for the code to see if it should stop
-        # stops if the length of players is the top 10 given
-        if len(correct_answer) == 10:
-            print("\nYou beat the Tenaball")
+def _random_roster(size, seed=0):
+    return list(_iter_random_roster(size, seed))
 
-        # or it will also stop if lives reach zero
+def benchmark_question_planner(size=50_000, games=200, seed=0):
+    """
+    Plays Footynator against itself on a synthetic roster: a random player is picked, every question is answered
+    truthfully, and the game ends when one candidate is left or no question can split the rest. Compares the
+    entropy-ordered planner with the old fixed question order and filter_players.
+    The planner's setup (counting its histograms from the PlayerTable) is timed apart from its questions.
+    :return: A dict of strategy -> (mean questions, share of players guessed, mean ms per question), plus the
+             planner's mean setup ms under "planner setup".
+    """
+    rng = random.Random(seed)
+    roster = _random_roster(size, seed)
+    table = PlayerTable(roster)
+    targets = rng.sample(roster, games)
+    results = {}
 
-        else:
-            print("\nThe Tenaball beat you")
-            print(f"The correct players were:")
-            for position, player in enumerate(random_tenaball, start=1):
-                print(f"{position}. {player}")
+    questions, guessed, seconds, setup = 0, 0, 0.0, 0.0
+    for target in targets:
+        start = time.perf_counter()
+        planner = QuestionPlanner(table)
+        setup += time.perf_counter() - start
+        candidates = planner.candidates
+        while len(candidates) > 1:
+            start = time.perf_counter()
+            attribute = planner.next_question()
+            if attribute is None:
+                break
+            candidates = planner.answer(attribute, target[attribute])
+            seconds += time.perf_counter() - start
+            questions += 1
+        guessed += len(candidates) == 1
+    results["planner"] = (questions / games, guessed / games, seconds / questions * 1000)
+    results["planner setup"] = setup / games * 1000
 
+    questions, guessed, seconds = 0, 0, 0.0
+    for target in targets:
+        candidates = roster
+        for attribute in FOOTYNATOR_QUESTIONS:
+            if len(candidates) == 1:
+                break
+            start = time.perf_counter()
+            candidates = filter_players(candidates, attribute, target[attribute])
+            seconds += time.perf_counter() - start
+            questions += 1
+        guessed += len(candidates) == 1
+    results["fixed order"] = (questions / games, guessed / games, seconds / questions * 1000)
 
-def filter_players(players, attribute, value):
+    for name in ("planner", "fixed order"):
+        mean_questions, share, ms = results[name]
+        print(f"{name:<12} {mean_questions:5.2f} questions/game | {share:6.1%} guessed | {ms:8.2f} ms/question")
+    print(f"planner setup {results['planner setup']:.1f} ms/game")
+    return results
+
+def benchmark_player_table(sizes=(10_000, 100_000, 1_000_000), seed=0):
     """
-    Filters the list of players based on the given attribute value.
-    The comparison is case-insensitive.
+    Memory and filter latency of a PlayerTable against the list of player dicts it replaces. Memory is the
+    tracemalloc peak of building each layout from a stream of rows; the filter is the three-answer footynator
+    question league, position, then nationality, with the candidates counted at the end.
+    :return: A dict of size -> {layout: (peak MiB, filter ms)}.
     """
-    return [player for player in players if player[attribute].lower() == value.lower()]
+    results = {}
+    for size in sizes:
+        tracemalloc.start()
+        roster = list(_iter_random_roster(size, seed))
+        list_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        tracemalloc.start()
+        table = PlayerTable(_iter_random_roster(size, seed))
+        table_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
 
-def footynator():
-    print("Welcome to Footynator: Football Player Guesser!")
-    players = [
-        {"name": "Lionel Messi", "league": "MLS", "team": "Inter Miami", "position": "Forward", "age": "37",
-         "nationality": "Argentina"},
-        {"name": "Cristiano Ronaldo", "league": "Saudi Pro League", "team": "Al Nassr", "position": "Forward",
-         "age": "40", "nationality": "Portugal"},
-        {"name": "Neymar Jr", "league": "Brasilian Serie A", "team": "Santos Futebol", "position": "Forward",
-         "age": "33", "nationality": "Brazil"},
-        {"name": "Kevin De Bruyne", "league": "Premier League", "team": "Manchester City", "position": "Midfielder",
-         "age": "33", "nationality": "Belgium"},
-        {"name": "Luka Modrić", "league": "La Liga", "team": "Real Madrid", "position": "Midfielder", "age": "39",
-         "nationality": "Croatia"},
-        {"name": "Kylian Mbappe", "league": "La Liga", "team": "Real Madrid", "position": "Forward", "age": "26",
-         "nationality": "France"},
-        {"name": "Mohamed Salah", "league": "Premier League", "team": "Liverpool", "position": "Forward", "age": "32",
-         "nationality": "Egypt"},
-        {"name": "Robert Lewandowski", "league": "La Liga", "team": "Barcelona", "position": "Forward", "age": "36",
-         "nationality": "Poland"},
-        {"name": "Virgil van Dijk", "league": "Premier League", "team": "Liverpool", "position": "Defender",
-         "age": "33", "nationality": "Netherlands"},
-        {"name": "Sergio Ramos", "league": "La Liga", "team": "Sevilla", "position": "Defender", "age": "38",
-         "nationality": "Spain"},
-        {"name": "Sadio Mané", "league": "Bundesliga", "team": "Bayern Munich", "position": "Forward", "age": "32",
-         "nationality": "Senegal"},
-        {"name": "Karim Benzema", "league": "Saudi Pro League", "team": "Al-Ittihad", "position": "Forward",
-         "age": "37", "nationality": "France"},
-        {"name": "Erling Haaland", "league": "Premier League", "team": "Manchester City", "position": "Forward",
-         "age": "24", "nationality": "Norway"},
-        {"name": "Harry Kane", "league": "Bundesliga", "team": "Bayern Munich", "position": "Forward", "age": "31",
-         "nationality": "England"},
-        {"name": "Paulo Dybala", "league": "Serie A", "team": "AS Roma", "position": "Forward", "age": "31",
-         "nationality": "Argentina"},
-        {"name": "Antoine Griezmann", "league": "La Liga", "team": "Atlético Madrid", "position": "Forward",
-         "age": "33", "nationality": "France"},
-        {"name": "N’Golo Kanté", "league": "Premier League", "team": "Chelsea", "position": "Midfielder", "age": "33",
-         "nationality": "France"},
-        {"name": "Jan Oblak", "league": "La Liga", "team": "Atlético Madrid", "position": "Goalkeeper", "age": "32",
-         "nationality": "Slovenia"},
-        {"name": "Manuel Neuer", "league": "Bundesliga", "team": "Bayern Munich", "position": "Goalkeeper", "age": "38",
-         "nationality": "Germany"},
-        {"name": "Marc-André ter Stegen", "league": "La Liga", "team": "Barcelona", "position": "Goalkeeper",
-         "age": "32", "nationality": "Germany"},
-        {"name": "Son Heung-min", "league": "Premier League", "team": "Tottenham", "position": "Forward", "age": "32",
-         "nationality": "South Korea"},
-        {"name": "Raheem Sterling", "league": "Premier League", "team": "Chelsea", "position": "Forward", "age": "30",
-         "nationality": "England"},
-        {"name": "Bernardo Silva", "league": "Premier League", "team": "Manchester City", "position": "Midfielder",
-         "age": "30", "nationality": "Portugal"},
-        {"name": "Joshua Kimmich", "league": "Bundesliga", "team": "Bayern Munich", "position": "Midfielder",
-         "age": "30", "nationality": "Germany"},
-        {"name": "Alisson Becker", "league": "Premier League", "team": "Liverpool", "position": "Goalkeeper",
-         "age": "32", "nationality": "Brazil"},
-        {"name": "Thibaut Courtois", "league": "La Liga", "team": "Real Madrid", "position": "Goalkeeper", "age": "32",
-         "nationality": "Belgium"},
-        {"name": "Casemiro", "league": "Premier League", "team": "Manchester United", "position": "Midfielder",
-         "age": "33", "nationality": "Brazil"},
-        {"name": "Frenkie de Jong", "league": "Premier League", "team": "Manchester United", "position": "Midfielder",
-         "age": "27", "nationality": "Netherlands"},
-        {"name": "Jadon Sancho", "league": "Premier League", "team": "Manchester United", "position": "Winger",
-         "age": "24", "nationality": "England"},
-        {"name": "Bruno Fernandes", "league": "Premier League", "team": "Manchester United", "position": "Midfielder",
-         "age": "30", "nationality": "Portugal"},
-        {"name": "Romelu Lukaku", "league": "Serie A", "team": "Roma", "position": "Forward", "age": "31",
-         "nationality": "Belgium"},
-        {"name": "Luis Suárez", "league": "Brasileiro Série A", "team": "Grêmio", "position": "Forward", "age": "38",
-         "nationality": "Uruguay"},
-        {"name": "Thomas Müller", "league": "Bundesliga", "team": "Bayern Munich", "position": "Midfielder",
-         "age": "35", "nationality": "Germany"},
-        {"name": "Vinicius Junior", "league": "La Liga", "team": "Real Madrid", "position": "Forward", "age": "24",
-         "nationality": "Brazil"},
-        {"name": "Nico Williams", "league": "La Liga", "team": "Athletico Bilbao", "position": "Forward", "age": "22",
-         "nationality": "Spain"},
-        {"name": "Lamine Yamal", "league": "La Liga", "team": "Barcelona", "position": "Forward", "age": "17",
-         "nationality": "Spain"},
-        {"name": "Pau Cubarsi", "league": "La Liga", "team": "Barcelona", "position": "Defender", "age": "18",
-         "nationality": "Spain"},
-        {"name": "Ferran Torres", "league": "La Liga", "team": "Barcelona", "position": "Midfielder", "age": "24",
-         "nationality": "Spain"},
-        {"name": "Sergio Ramos", "league": "La Liga", "team": "Sevilla", "position": "Defender", "age": "38",
-         "nationality": "Spain"},
-        {"name": "Antony", "league": "Premier League", "team": "Manchester United", "position": "Forward", "age": "25",
-         "nationality": "Brazil"},
-        {"name": "Jude Bellingham", "league": "La Liga", "team": "Real Madrid", "position": "Midfielder", "age": "21",
-         "nationality": "England"},
-        {"name": "Antonio Rüdiger", "league": "La Liga", "team": "Real Madrid", "position": "Defencer", "age": "31",
-         "nationality": "Germany"},
-        {"name": "Dani Olmo", "league": "La Liga", "team": "Barcelona", "position": "Midfielder", "age": "26",
-         "nationality": "Spain"},
-        {"name": "Dani Carvajal", "league": "La Liga", "team": "Real Madrid", "position": "Defender", "age": "33",
-         "nationality": "Spain"},
-        {"name": "Gonzalo Garcia", "league": "La Liga", "team": "Real Madrid", "position": "Forward", "age": "20",
-         "nationality": "Spain"},
-    ]
+        target = roster[size // 2]
+        answers = [(attribute, target[attribute]) for attribute in ("league", "position", "nationality")]
+        timings = {}
+        for name, players in (("dicts", roster), ("table", table)):
+            start = time.perf_counter()
+            candidates = players
+            for attribute, value in answers:
+                candidates = filter_players(candidates, attribute, value)
+            len(candidates)
+            timings[name] = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        table.range("age", 20, 25).bit_count()
+        range_ms = (time.perf_counter() - start) * 1000
 
-    print("Think of a football player, and I'll try to guess who it is by asking a few questions.")
-    print("At any point, type 'exit' to quit the game.")
+        results[size] = {"dicts": (list_peak / 2 ** 20, timings["dicts"]), "table": (table_peak / 2 ** 20, timings["table"])}
+        print(f"{size:>9,} players | dicts {list_peak / 2 ** 20:8.1f} MiB {timings['dicts']:9.2f} ms | "
+              f"table {table_peak / 2 ** 20:8.1f} MiB {timings['table']:7.3f} ms | age 20-25 {range_ms:6.3f} ms")
+        del roster, table
+    return results
+
+def _append_corrections(directory, worker, count):
+    """
+    Appends count synthetic corrections to the memory in directory (run in a separate process by
+    benchmark_correction_log).
+    """
+    memory = FootynatorMemory(directory, durable=False)
+    for player in itertools.islice(_iter_random_roster(count, seed=worker), count):
+        memory.record(dict(player, name=f"{player['name']} {worker}"))
+    return count
 
-    candidates = players.copy()
+def benchmark_correction_log(records=20_000, workers=4, seed=0):
+    """
+    Exercises FootynatorMemory in a temporary directory: append throughput with and without fsync, replaying
+    a log of records corrections, a torn last line, compaction, and workers processes appending at once.
+    :return: A dict of the measured seconds and counts.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        memory = FootynatorMemory(directory, compact_bytes=1 << 40, durable=False)
+        roster = _random_roster(records, seed)
+        start = time.perf_counter()
+        for player in roster:
+            memory.record(player)
+        results["append_us"] = (time.perf_counter() - start) / records * 1e6
 
-    questions = [
-        ("league", "Which league does he play in?"),
-        ("position", "What is his position?"),
-        ("nationality", "What is his nationality?"),
-        ("team", "Which team does he play for?"),
-        ("age", "What is his age?")
-    ]
+        durable = FootynatorMemory(os.path.join(directory, "durable"), durable=True)
+        start = time.perf_counter()
+        for player in roster[:200]:
+            durable.record(player)
+        results["durable_append_us"] = (time.perf_counter() - start) / 200 * 1e6
 
-    for attribute, question in questions:
-        if len(candidates) == 1:
-            break
+        with open(memory.log.path, "ab") as handle:
+            handle.write(CorrectionLog.encode(roster[0])[:25])
+        start = time.perf_counter()
+        replayed, damaged = memory.log.replay()
+        results["replay_seconds"] = time.perf_counter() - start
+        results["damaged_lines"] = damaged
 
-        answer = input(question + " ").strip()
-        if answer.lower() == "exit":
-            print("Exiting the game.")
-            return
+        start = time.perf_counter()
+        memory.compact()
+        results["compact_seconds"] = time.perf_counter() - start
+        start = time.perf_counter()
+        table = PlayerTable(memory.load())
+        results["load_after_compaction_seconds"] = time.perf_counter() - start
 
-        candidates = filter_players(candidates, attribute, answer)
+        shared = os.path.join(directory, "shared")
+        os.makedirs(shared)
+        per_worker = records // workers
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_append_corrections, itertools.repeat(shared), range(workers),
+                              itertools.repeat(per_worker)))
+        results["concurrent_seconds"] = time.perf_counter() - start
+        # Compactions ran while the workers appended, so count what survives in snapshot and log together
+        expected = {fold_name(f"{player['name']} {worker}")
+                    for worker in range(workers) for player in _iter_random_roster(per_worker, seed=worker)}
+        concurrent = FootynatorMemory(shared)
+        concurrent_damaged = concurrent.log.replay()[1]
+        results["concurrent_players"] = len({fold_name(player["name"]) for player in concurrent.load()})
+        results["expected_players"] = len(expected)
 
-        if not candidates:
-            print("No player matches that description. Please try again.")
-            return
+    print(f"append {results['append_us']:.1f} us (fsync {results['durable_append_us']:.1f} us) | "
+          f"replay {len(replayed):,} records in {results['replay_seconds'] * 1000:.1f} ms, {damaged} damaged line skipped")
+    print(f"compaction {results['compact_seconds'] * 1000:.1f} ms | load of {len(table):,} players after it "
+          f"{results['load_after_compaction_seconds'] * 1000:.1f} ms")
+    print(f"{workers} processes x {per_worker:,} appends in {results['concurrent_seconds']:.2f}s | "
+          f"{results['concurrent_players']:,} of {results['expected_players']:,} players kept, {concurrent_damaged} damaged")
+    return results
 
-    if len(candidates) == 1:
-        guessed_player = candidates[0]["name"]
-        print("The player you are thinking of is:", guessed_player)
-        correct = input("Was I correct? (yes/no) ").strip().lower()
-        if correct in ("yes", "y"):
-            print("Great! Thanks for playing!")
-        else:
-            correct_name = input("Oh no, what player were you thinking of? ").strip()
-            correct_league = input("Which league does he play in? ").strip()
-            correct_position = input("What position does he play in? ").strip()
-            correct_nationality = input("What is his nationality? ").strip()
-            correct_team = input("Which team does he play for? ").strip()
-            correct_age = input("How old is he? ").strip()
-            print(f"Thanks for letting me know! I'll add {correct_name} to my records")
-            print("Thanks for playing!")
-            return
-    else:
-        print("I couldn't guess with certainty. The players that match are:")
-        for player in candidates:
-            print("- " + player["name"])
+def _write_random_stats(path, rows, seed=0):
+    """
+    Writes a reproducible synthetic statistics CSV of rows player seasons: careers of 6 to 18 seasons over one to
+    four clubs out of 200, a coach per club every three seasons, transfer fees on arrival at a club, and caps
+    for one of 60 national teams for some of the players.
+    :return: The player names, in the order their careers were written.
+    """
+    rng = random.Random(seed)
+    teams = [f"Team {i}" for i in range(200)]
+    nations = [f"Country {i}" for i in range(60)]
+    names = _random_player_names(rows // 10 + 1, seed)
+    written = 0
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(STATS_TEXT_COLUMNS + STATS_METRICS)
+        for name in names:
+            first = rng.randint(1960, 2010)
+            seasons = rng.randint(6, 18)
+            clubs = rng.sample(teams, rng.randint(1, 4))
+            nation = rng.choice(nations) if rng.random() < 0.3 else None
+            scorer = rng.random()
+            for offset in range(seasons):
+                if written == rows:
+                    return names
+                season = first + offset
+                club = clubs[offset * len(clubs) // seasons]
+                arrival = offset == 0 or club != clubs[(offset - 1) * len(clubs) // seasons]
+                appearances = rng.randint(0, 50)
+                writer.writerow((name, club, season, f"Coach {club[5:]}-{season // 3}", appearances,
+                                 int(appearances * scorer * rng.random()), int(appearances * rng.random() * 0.3),
+                                 rng.randint(1, 150) * 500_000 if arrival and offset else 0))
+                written += 1
+                if nation is not None and written < rows and rng.random() < 0.5:
+                    writer.writerow((name, nation, season, f"Coach {nation[8:]}-{season // 4}",
+                                     rng.randint(0, 10), rng.randint(0, 3), rng.randint(0, 2), 0))
+                    written += 1
+    return names
 
-def missing11():
-    teams = {
-        "Liverpool (2019 Champions League)": [
-            ("GK", "Becker"),
-            ("LB", "Robertson"),
-            ("CB", "Van Dijk"),
-            ("CB", "Matip"),
-            ("RB", "Alexander-Arnold"),
-            ("CM", "Fabinho"),
-            ("CM", "Wijnaldum"),
-            ("CM", "Milner"),
-            ("LW", "Mane"),
-            ("RW", "Salah"),
-            ("ST", "Firmino")
-        ],
-        "Bayern Munich (2020 Champions League)": [
-            ("GK", "Neuer"),
-            ("LB", "Davies"),
-            ("CB", "Boateng"),
-            ("CB", "Alaba"),
-            ("RB", "Pavard"),
-            ("CM", "Kimmich"),
-            ("CM", "Goretzka"),
-            ("CM", "Muller"),
-            ("LW", "Coman"),
-            ("RW", "Gnabry"),
-            ("ST", "Lewandowski")
-        ],
-        "Chelsea (2021 Champions League)": [
-            ("GK", "Mendy"),
-            ("LB", "Azpilicueta"),
-            ("CB", "Thiago Silva"),
-            ("CB", "Rudiger"),
-            ("RB", "James"),
-            ("CM", "Jorginho"),
-            ("CM", "Kante"),
-            ("CM", "Mount"),
-            ("LW", "Pulisic"),
-            ("RW", "Havertz"),
-            ("ST", "Werner")
-        ],
-        "Real Madrid (2022 Champions League)": [
-            ("GK", "Courtois"),
-            ("LB", "Mendy"),
-            ("CB", "Militao"),
-            ("CB", "Alaba"),
-            ("RB", "Carvajal"),
-            ("CM", "Casemiro"),
-            ("CM", "Modric"),
-            ("CM", "Kroos"),
-            ("LW", "Vinicius"),
-            ("RW", "Asensio"),
-            ("ST", "Benzema")
-        ],
-        "Manchester City (2023 Champions League)": [
-            ("GK", "Ederson"),
-            ("LB", "Stones"),
-            ("CB", "Dias"),
-            ("CB", "Laporte"),
-            ("RB", "Walker"),
-            ("CM", "Rodri"),
-            ("CM", "De Bruyne"),
-            ("CM", "Silva"),
-            ("LW", "Foden"),
-            ("RW", "Mahrez"),
-            ("ST", "Haaland")
-        ],
-        "Italy (2006 World Cup)": [
-            ("GK", "Buffon"),
-            ("LB", "Zambrotta"),
-            ("CB", "Cannavaro"),
-            ("CB", "Materazzi"),
-            ("RB", "Grosso"),
-            ("CM", "Pirlo"),
-            ("CM", "Gattuso"),
-            ("CM", "De Rossi"),
-            ("LW", "Del Piero"),
-            ("RW", "Totti"),
-            ("ST", "Toni")
-        ],
-        "Spain (2010 World Cup)": [
-            ("GK", "Casillas"),
-            ("LB", "Capdevila"),
-            ("CB", "Ramos"),
-            ("CB", "Pique"),
-            ("RB", "Puyol"),
-            ("CM", "Alonso"),
-            ("CM", "Xavi"),
-            ("CM", "Iniesta"),
-            ("LW", "David Villa"),
-            ("RW", "Fabregas"),
-            ("ST", "Torres")
-        ],
-        "Germany (2014 World Cup)": [
-            ("GK", "Neuer"),
-            ("LB", "Lahm"),
-            ("CB", "Hummels"),
-            ("CB", "Boateng"),
-            ("RB", "Howedes"),
-            ("CM", "Schweinsteiger"),
-            ("CM", "Kroos"),
-            ("CM", "Ozil"),
-            ("LW", "Götze"),
-            ("RW", "Muller"),
-            ("ST", "Klose")
-        ],
-        "France (2018 World Cup)": [
-            ("GK", "Lloris"),
-            ("LB", "Hernandez"),
-            ("CB", "Varane"),
-            ("CB", "Umtiti"),
-            ("RB", "Pavard"),
-            ("CM", "Kante"),
-            ("CM", "Pogba"),
-            ("CM", "Matuidi"),
-            ("LW", "Griezmann"),
-            ("RW", "Mbappe"),
-            ("ST", "Giroud")
-        ],
-        "Argentina (2022 World Cup)": [
-            ("GK", "Martinez"),
-            ("LB", "Acuña"),
-            ("CB", "Romero"),
-            ("CB", "Otamendi"),
-            ("RB", "Molina"),
-            ("CM", "De Paul"),
-            ("CM", "Paredes"),
-            ("CM", "Mac Allister"),
-            ("LW", "Di Maria"),
-            ("RW", "Messi"),
-            ("ST", "Martínez")
-        ]
-    }
-    # Randomly select a team.
-    team_name, lineup = random.choice(list(teams.items()))
-    print(f"Guess the starting 11 for {team_name}!")
-    print("Enter player names one by one. (Type 'quit' to exit)\n")
+def benchmark_tenaball_stats(rows=1_000_000, seed=0):
+    """
+    Builds Tenaball top 10s from a synthetic statistics file of rows player seasons: the one-off column build,
+    reopening from the column cache, every kind of category computed cold (against a plain dict-summing pass
+    over the same columns for the biggest one), the saved hot categories in a new session, and a rebuild
+    after the file changes.
+    :return: A dict of the measured seconds.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "player_stats.csv")
+        names = _write_random_stats(path, rows, seed)
+        categories = (StatsCategory("goals", "goals"), StatsCategory("assists", "assists"),
+                      StatsCategory("one club", "appearances", (("team", "Team 3"),)),
+                      StatsCategory("two clubs", "appearances", (("team", ("Team 3", "Team 7")),)),
+                      StatsCategory("club and coach", "appearances", (("team", "Team 3"), ("coach", "Coach 3-663"))),
+                      StatsCategory("signings", "fee", (("team", "Team 3"),)),
+                      StatsCategory("teammate", "appearances", (("teammate", names[len(names) // 2]),)))
 
-    guessed = set()
-    attempts = 0
-    while len(guessed) < 11:
-        guess = input("Your guess: ").strip()
-        if guess.lower() == "quit":
-            print("Game exited.")
-            return
-        attempts += 1
-        normalized_guess = guess.lower()
-        found = False
+        stats = PlayerStats(path)
+        start = time.perf_counter()
+        rows = len(stats)
+        results["build_seconds"] = time.perf_counter() - start
+        start = time.perf_counter()
+        len(PlayerStats(path))
+        results["reopen_seconds"] = time.perf_counter() - start
 
-        # Check the guess against each player's name.
-        for pos, player in lineup:
-            if player.lower() == normalized_guess:
-                if player in guessed:
-                    print(f"You already guessed {player}.")
-                else:
-                    guessed.add(player)
-                    print(f"Correct! {player} plays as {pos}.")
-                found = True
-                break
+        for category in categories:
+            start = time.perf_counter()
+            stats.top(category.metric, 10, category.filters)
+            results[category.title] = time.perf_counter() - start
+        start = time.perf_counter()
+        stats.top("goals")
+        results["repeat_seconds"] = time.perf_counter() - start
 
-        if not found:
-            print("Incorrect guess.")
+        totals = {}
+        start = time.perf_counter()
+        for code, goals in zip(stats._columns["player"], stats._columns["goals"]):
+            totals[code] = totals.get(code, 0.0) + goals
+        heapq.nlargest(10, totals.items(), key=operator.itemgetter(1))
+        results["dict_pass_seconds"] = time.perf_counter() - start
 
-        # Display the full lineup with positions, showing "???" for unguessed players.
-        print("\nCurrent lineup:")
-        for pos, player in lineup:
-            if player in guessed:
-                print(f"{pos}: {player}")
-            else:
-                print(f"{pos}: ???")
-        print(f"\n{len(guessed)}/11 players found.\n")
+        stats.categories(categories)
+        start = time.perf_counter()
+        PlayerStats(path).categories(categories)
+        results["saved_categories_seconds"] = time.perf_counter() - start
 
-    print(f"Congratulations! You completed the lineup in {attempts} guesses.")
-    print("\nThe full starting 11 was:")
-    for pos, player in lineup:
-        print(f"{pos}: {player}")
+        with open(path, "a", newline="", encoding="utf-8") as handle:
+            csv.writer(handle).writerow((names[0], "Team 3", 2030, "Coach 3-676", 1000, 1000, 0, 0))
+        start = time.perf_counter()
+        changed = stats.top("goals")
+        results["rebuild_seconds"] = time.perf_counter() - start
+
+    cold = [results[category.title] for category in categories]
+    print(f"{rows:,} rows | build {results['build_seconds']:.1f}s once | reopen {results['reopen_seconds'] * 1000:.0f} ms")
+    print("top 10 " + " | ".join(f"{category.title} {results[category.title] * 1000:.0f} ms" for category in categories))
+    print(f"slowest {max(cold) * 1000:.0f} ms vs dict pass {results['dict_pass_seconds'] * 1000:.0f} ms | "
+          f"repeat {results['repeat_seconds'] * 1e6:.1f} us | saved categories {results['saved_categories_seconds'] * 1000:.0f} ms")
+    print(f"after editing the file: rebuilt in {results['rebuild_seconds']:.1f}s, new leader {changed[0].player}")
+    return results
 
 # --------------------- MAIN MENU ---------------------
 
@@ -1005,6 +4768,10 @@ def main_menu():
         elif game_choice == "2":
             footynator()
         elif game_choice == "3":
+            try:
+                warm_up_player_stats()
+            except (OSError, ValueError) as e:
+                print("Could not load the player statistics, playing the built-in lists:", e)
             tenaball()
         elif game_choice == "4":
             missing11()
@@ -1018,7 +4785,10 @@ def main_menu():
         print("4: Calculate Current Yield")
         print("5: Calculate Yield to Maturity (YTM)")
         print("6: Calculate Duration")
-        bond_choice = input("Enter a number from 1 to 6: ").strip()
+        print("7: Calculate Bond Price on a Yield Curve")
+        print("8: Calculate Bond Price by Monte Carlo Simulation")
+        print("9: Calculate Clean and Dirty Price (with settlement date)")
+        bond_choice = input("Enter a number from 1 to 9: ").strip()
         if bond_choice == "1":
             bond_maturity()
         elif bond_choice == "2":
@@ -1027,7 +4797,7 @@ def main_menu():
             try:
                 payment = float(input("Enter the periodic payment: "))
                 discount_rate_percent = float(input("Enter the discount rate (as a percentage): "))
-                price = perpetuity_price(payment, discount_rate_percent)
+                price = RESULT_CACHE.call(perpetuity_price, payment, discount_rate_percent)
                 print(f"The price of the perpetuity is: ${price:.2f}")
             except ValueError as e:
                 print("Error:", e)
@@ -1037,6 +4807,12 @@ def main_menu():
             yield_to_maturity()
         elif bond_choice == "6":
             duration_calculation()
+        elif bond_choice == "7":
+            curve_bond_calculator()
+        elif bond_choice == "8":
+            monte_carlo_bond_calculator()
+        elif bond_choice == "9":
+            dated_bond_calculator()
         else:
             print("Invalid bond calculation choice!")
     elif mode == "3":
@@ -1056,5 +4832,42 @@ def main_menu():
     else:
         print("Invalid mode selected. Please restart and choose 1, 2, or 3.")
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BIEBIR HUB: football games and finance calculators.")
+    parser.add_argument("--batch", nargs=3, metavar=("CALCULATOR", "INPUT", "OUTPUT"),
+                        help="stream a CSV/JSONL file through a calculator (" + ", ".join(_BATCH_CALCULATORS) + ")")
+    parser.add_argument("--rejects", help="reject file for malformed rows (default: OUTPUT.rejects.jsonl)")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="rows processed per chunk")
+    parser.add_argument("--cache-file", help="SQLite file that keeps calculator results between runs")
+    parser.add_argument("--profile", default=os.environ.get(PROFILE_ENV),
+                        help=f"record timings to a .json report or .prof cProfile file (or set {PROFILE_ENV})")
+    parser.add_argument("--build-stats", action="store_true",
+                        help=f"build the Tenaball statistics cache (player_stats.csv or {STATS_ENV}) and exit")
+    args = parser.parse_args(argv)
+
+    if args.cache_file:
+        RESULT_CACHE.attach(args.cache_file)
+
+    if args.build_stats:
+        start = time.perf_counter()
+        try:
+            stats = warm_up_player_stats()
+        except (OSError, ValueError) as e:
+            parser.exit(1, f"Error: {e}\n")
+        if stats is None:
+            parser.exit(1, f"Error: no player statistics found (set {STATS_ENV}).\n")
+        print(f"Statistics of {len(stats):,} rows ready in {time.perf_counter() - start:.2f}s.")
+    elif args.batch:
+        calculator, input_path, output_path = args.batch
+        try:
+            summary = run_batch(calculator, input_path, output_path, args.rejects, args.chunk_size)
+        except (OSError, ValueError) as e:
+            parser.exit(1, f"Error: {e}\n")
+        print(f"Processed {summary.processed} rows, rejected {summary.rejected} rows in {summary.seconds:.2f}s.")
+    elif args.profile:
+        run_profiled(main_menu, args.profile)
+    else:
+        main_menu()
+
 if __name__ == "__main__":
-    main_menu()
+    main()